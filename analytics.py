@@ -0,0 +1,404 @@
+"""Portfolio risk analytics: covariance of fund returns, portfolio risk and the efficient frontier.
+
+ReturnCovariance keeps the mean and co-moment matrix of daily log returns
+and merges new price rows into them as they arrive (the pairwise update of
+Chan et al.), so the covariance is never recomputed from the full history.
+Without a NAV history, model_covariance() builds one from each fund's
+volatility and a correlation per pair of categories.
+
+portfolio_stats() evaluates any number of candidate weightings with two
+matrix products. efficient_frontier() traces the exact long-only frontier
+with the critical line method: between corner portfolios the optimal weights
+are linear, so the work is one O(k^2) update of the free funds' factorization
+per corner, and the events that end a segment are found for all funds at once.
+"""
+import threading
+
+import numpy as np
+
+from lru import LRUCache
+from nav_store import PERIOD_DAYS, TRADING_DAYS_PER_YEAR
+from portfolio import CASH_TICKER
+
+# Correlation assumed between two funds by category when there is no NAV history
+CATEGORY_CORRELATION = {
+    ("Bond", "Bond"): 0.7,
+    ("Equity", "Equity"): 0.8,
+    ("Mixed", "Mixed"): 0.75,
+    ("Bond", "Equity"): 0.1,
+    ("Bond", "Mixed"): 0.4,
+    ("Equity", "Mixed"): 0.6,
+}
+DEFAULT_CORRELATION = 0.3
+
+# Larger catalogs get covariances per requested subset instead of a tracked full matrix
+MAX_TRACKED_FUNDS = 2000
+
+# Daily returns behind every NAV covariance, tracked or computed per subset:
+# the five years the expected returns are measured over. A shorter window
+# would leave the covariance of a large catalog singular.
+COVARIANCE_WINDOW = PERIOD_DAYS["5Y"]
+
+FRONTIER_POINTS = 30
+
+
+class ReturnCovariance:
+    # Running mean and co-moment of daily log returns for a fixed set of funds,
+    # over the last `window` returns when a window is given. update() takes
+    # price rows that continue the ones seen so far; returns that fall out of
+    # the window are removed from the moments rather than recomputing them.
+
+    def __init__(self, fund_count, window=None):
+        self.window = window
+        self.count = 0
+        self.mean = np.zeros(fund_count)
+        self._comoment = np.zeros((fund_count, fund_count))
+        self._returns = np.empty((0, fund_count))
+        self._last_prices = None
+        self._covariance = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_prices(cls, prices, window=None):
+        tracker = cls(np.shape(prices)[1], window)
+        tracker.update(prices)
+        return tracker
+
+    def copy(self):
+        with self._lock:
+            tracker = ReturnCovariance(len(self.mean), self.window)
+            tracker.count = self.count
+            tracker.mean = self.mean.copy()
+            tracker._comoment = self._comoment.copy()
+            tracker._returns = self._returns
+            tracker._last_prices = self._last_prices
+            tracker._covariance = self._covariance
+            return tracker
+
+    def update(self, prices):
+        prices = np.asarray(prices, dtype=np.float64)
+        with self._lock:
+            if self._last_prices is not None:
+                prices = np.vstack([self._last_prices, prices])
+            if len(prices):
+                self._last_prices = prices[-1:]
+            if len(prices) < 2:
+                return
+            returns = np.diff(np.log(prices), axis=0)
+            self._merge(returns, 1)
+            if self.window is not None:
+                kept = np.concatenate([self._returns, returns])
+                if len(kept) > self.window:
+                    self._merge(kept[:-self.window], -1)
+                    kept = kept[-self.window:]
+                self._returns = kept
+            self._covariance = None
+
+    def _merge(self, returns, sign):
+        # Adds (sign 1) or removes (sign -1) a batch of returns, with the
+        # pairwise update of the mean and co-moment
+        batch_count = len(returns)
+        batch_mean = returns.mean(axis=0)
+        centered = returns - batch_mean
+        total = self.count + sign * batch_count
+        if total == 0:
+            self.count = 0
+            self.mean[:] = 0
+            self._comoment[:] = 0
+            return
+        if sign > 0:
+            delta = batch_mean - self.mean
+            self._comoment += centered.T @ centered + np.outer(delta, delta) * (self.count * batch_count / total)
+            self.mean += delta * (batch_count / total)
+        else:
+            mean = (self.mean * self.count - batch_mean * batch_count) / total
+            delta = batch_mean - mean
+            self._comoment -= centered.T @ centered + np.outer(delta, delta) * (total * batch_count / self.count)
+            self.mean = mean
+        self.count = total
+
+    def covariance(self):
+        # Annualized covariance of log returns, as fractions
+        with self._lock:
+            if self._covariance is None:
+                if self.count < 2:
+                    raise ValueError("need at least two returns for a covariance")
+                covariance = self._comoment * (TRADING_DAYS_PER_YEAR / (self.count - 1))
+                covariance.flags.writeable = False
+                self._covariance = covariance
+            return self._covariance
+
+
+def model_covariance(catalog, indices):
+    # Annualized covariance from the funds' volatility and category correlations
+    indices = np.asarray(indices)
+    names = catalog.category_names
+    pairs = np.full((len(names), len(names)), DEFAULT_CORRELATION)
+    for (first, second), value in CATEGORY_CORRELATION.items():
+        if first in names and second in names:
+            pairs[names.index(first), names.index(second)] = value
+            pairs[names.index(second), names.index(first)] = value
+    codes = catalog.category_codes[indices]
+    correlations = pairs[codes[:, None], codes[None, :]]
+    np.fill_diagonal(correlations, 1.0)
+    volatility = catalog.volatility[indices].astype(np.float64) / 100
+    return correlations * np.outer(volatility, volatility)
+
+
+class RiskModel:
+    # Covariances for any subset of catalog funds. With a NAV store covering
+    # the catalog, small catalogs track the full matrix incrementally and large
+    # ones compute (and cache) the subsets that are asked for, both over the
+    # last COVARIANCE_WINDOW daily returns; otherwise the category model is used.
+
+    def __init__(self, catalog, store=None, max_tracked=MAX_TRACKED_FUNDS, max_entries=256, tracker=None):
+        # `tracker` is a ReturnCovariance already fed with `store`'s prices, see rebased()
+        self.catalog = catalog
+        self.max_tracked = max_tracked
+        self.store = None
+        self.tracker = None
+        if store is not None:
+            positions = store.index_of(catalog.tickers)
+            if (positions >= 0).all():
+                self.store = store
+                self._positions = positions
+                if len(catalog) <= max_tracked:
+                    self.tracker = tracker if tracker is not None else ReturnCovariance.from_prices(
+                        store.prices[-COVARIANCE_WINDOW - 1:, positions], COVARIANCE_WINDOW)
+        self._subsets = LRUCache(max_entries)
+
+    @property
+    def source(self):
+        return "nav" if self.store is not None else "model"
+
+    def rebased(self, catalog, store):
+        # The risk model for a rebuilt registry. When `store` is this model's
+        # history with new days appended and the catalog lists the same funds,
+        # the tracked covariance is carried over and only the new days are
+        # merged in; otherwise it is built from scratch.
+        old = self.store
+        if (self.tracker is None or store is None or old is None or old.tickers != store.tickers
+                or not np.array_equal(catalog.tickers, self.catalog.tickers)
+                or len(store.dates) <= len(old.dates)
+                or not np.array_equal(store.dates[:len(old.dates)], old.dates)
+                or not np.array_equal(store.prices[len(old.dates) - 1], old.prices[-1])):
+            return RiskModel(catalog, store, self.max_tracked, self._subsets.max_entries)
+        model = RiskModel(catalog, store, self.max_tracked, self._subsets.max_entries, tracker=self.tracker.copy())
+        model.update_prices(store.prices[len(old.dates):, self._positions])
+        return model
+
+    def update_prices(self, prices):
+        # New NAV rows (days x catalog funds) for the tracked matrix
+        if self.tracker is not None:
+            self.tracker.update(prices)
+        self._subsets.clear()
+
+    def covariance(self, indices):
+        indices = np.asarray(indices, dtype=np.int64)
+        if self.tracker is not None:
+            return self.tracker.covariance()[np.ix_(indices, indices)]
+        if self.store is None:
+            return model_covariance(self.catalog, indices)
+        key = tuple(indices.tolist())
+        covariance = self._subsets.get(key)
+        if covariance is None:
+            window = self.store.prices[-COVARIANCE_WINDOW - 1:, self._positions[indices]]
+            covariance = ReturnCovariance.from_prices(window).covariance()
+            self._subsets.put(key, covariance)
+        return covariance
+
+
+def portfolio_stats(weights, expected_returns, covariance):
+    # (expected return %, volatility %) of each row of weights (or of one weight vector)
+    weights = np.asarray(weights, dtype=np.float64)
+    returns = weights @ np.asarray(expected_returns, dtype=np.float64)
+    variance = np.einsum("...i,...i->...", weights @ covariance, weights)
+    return returns, np.sqrt(np.maximum(variance, 0)) * 100
+
+
+def holdings_stats(risk_model, tickers, values):
+    # (expected return %, volatility %) of positions weighted by value. Cash
+    # has no return and no risk; tickers outside the catalog are left out.
+    catalog = risk_model.catalog
+    positions = {ticker: i for i, ticker in enumerate(catalog.tickers)}
+    indices = np.array([positions.get(ticker, -1) for ticker in tickers], dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    is_cash = np.asarray(tickers, dtype=object) == CASH_TICKER
+    total = values[(indices >= 0) | is_cash].sum()
+    if total <= 0:
+        return 0.0, 0.0
+    funds = indices >= 0
+    return portfolio_stats(values[funds] / total, catalog.annual_return[indices[funds]],
+                           risk_model.covariance(indices[funds]))
+
+
+class _FreeSetSystem:
+    # The covariance with the free funds permuted to the front, and a square
+    # root M of the inverse of their block, S_FF^-1 = M'M. A fund entering
+    # appends a row to M (the inverse Cholesky factor of the bordered block)
+    # and a fund leaving is dropped after a Householder reflection that zeroes
+    # its column above the last row; both cost O(k^2). With S_FF^-1 [1, mu_F],
+    # S_FF w_F - t mu_F - gamma 1 = 0 and 1'w_F = 1 give w_F = a + t b and
+    # gamma = c + t d.
+    #
+    # M S_FB is kept next to M, in the bound funds' columns: its column is all
+    # an entering fund needs from M, its rows are reflected along with M's,
+    # and each new row updates the bound funds' S_BF S_FF^-1 [1, mu_F], which
+    # their multipliers are made of.
+
+    def __init__(self, covariance, expected_returns):
+        fund_count = len(expected_returns)
+        self.covariance = np.array(covariance, dtype=np.float64)
+        self.expected_returns = np.array(expected_returns, dtype=np.float64)
+        # order[i] is the fund at position i; the first `size` are free
+        self.order = np.arange(fund_count)
+        self.size = 0
+        # [M | M S_FB], by position; rows past the free block are rewritten before they are used
+        self._factor = np.zeros((fund_count, fund_count))
+        # M [1, mu_F] by position, and S_FF^-1 [1, mu_F] at free positions
+        # next to S_jF S_FF^-1 [1, mu_F] at bound ones
+        self._projected = np.zeros((fund_count, 2))
+        self._solved = np.zeros((fund_count, 2))
+
+    def _swap(self, first, second):
+        if first != second:
+            for array in (self.covariance, self.covariance.T, self._solved, self._factor[:self.size].T):
+                row = array[first].copy()
+                array[first] = array[second]
+                array[second] = row
+            for array in (self.order, self.expected_returns):
+                array[first], array[second] = array[second], array[first]
+
+    def add(self, position):
+        size = self.size
+        self._swap(position, size)
+        factor = self._factor
+        row = factor[:size, size].copy()
+        # A fund that is a combination of the free ones would make S_FF singular
+        variance = self.covariance[size, size]
+        pivot = np.sqrt(max(variance - row @ row, 1e-12 * variance, 1e-18))
+        # The old rows of M do not reach the new fund
+        factor[:size, size] = 0
+        new_row = factor[size]
+        new_row[:size] = -(row @ factor[:size, :size]) / pivot
+        new_row[size] = 1 / pivot
+        np.matmul(new_row[:size + 1], self.covariance[:size + 1, size + 1:], out=new_row[size + 1:])
+        right = np.array([1.0, self.expected_returns[size]])
+        projected = (right - row @ self._projected[:size]) / pivot
+        self._projected[size] = projected
+        # M'M [1, mu_F] gains the new row's contribution, and so do the bound funds' products
+        self._solved[size] = 0
+        self._solved += np.multiply.outer(new_row, projected)
+        self.size += 1
+
+    def remove(self, position):
+        last = self.size - 1
+        self._swap(position, last)
+        factor = self._factor[:last + 1]
+        projected = self._projected[:last + 1]
+        # Reflect the leaving fund's column of M onto the last row
+        column = factor[:, last]
+        reflector = column.copy()
+        reflector[last] += np.copysign(np.linalg.norm(column), column[last])
+        norm = reflector @ reflector
+        if norm > 0:
+            for array in (factor, projected):
+                array -= np.multiply.outer(reflector, reflector @ array * (2 / norm))
+        # The last row's contribution to S_FF^-1 [1, mu_F] and the products goes with it
+        self._solved -= np.multiply.outer(self._factor[last], projected[last])
+        # The leaving fund is bound now
+        self._solved[last] = self.covariance[last, :last] @ self._solved[:last]
+        factor[:last, last] = factor[:last, :last] @ self.covariance[last, :last]
+        self.size -= 1
+
+    def events(self):
+        # The t at which, as t falls, each free fund's weight or each bound
+        # fund's KKT multiplier S_jF w_F - t mu_j - gamma reaches zero; -inf
+        # when it never does. Both are (numerator + t denominator) / 1'S_FF^-1 1.
+        size = self.size
+        ones, returns = self._solved.T
+        ones_total = ones[:size].sum()
+        returns_total = returns[:size].sum()
+        numerator = ones.copy()
+        numerator[size:] -= 1
+        denominator = ones_total * returns - returns_total * numerator
+        denominator[size:] -= ones_total * self.expected_returns[size:]
+        return np.where(denominator > 0, -numerator / denominator, -np.inf)
+
+    def weights(self, t):
+        # Weights of the free funds at t, up to their sum
+        ones, returns = self._solved[:self.size].T
+        return np.maximum(ones + t * (ones.sum() * returns - returns.sum() * ones), 0)
+
+
+def corner_portfolios(expected_returns, covariance):
+    # Long-only efficient corner portfolios (critical line method), from the
+    # highest-return fund down to the minimum-variance portfolio. Minimizing
+    # w'Sw / 2 - t mu'w over the simplex, the solution is piecewise linear in
+    # t; a corner is where a fund enters or leaves the free (non-zero) set.
+    system = _FreeSetSystem(covariance, expected_returns)
+    fund_count = len(system.order)
+    best = system.expected_returns.max()
+    tied = np.flatnonzero(system.expected_returns >= best - 1e-12 * abs(best))
+    corners = [np.zeros(fund_count)]
+    if len(tied) == 1:
+        corners[0][tied] = 1.0
+    else:
+        # Funds tied for the best return start as their long-only minimum-variance
+        # mix: the last corner of a frontier over them alone, with any distinct returns
+        corners[0][tied] = corner_portfolios(np.arange(len(tied), dtype=np.float64),
+                                             system.covariance[np.ix_(tied, tied)])[-1]
+    for fund in np.flatnonzero(corners[0] > 0):
+        system.add(int(np.flatnonzero(system.order == fund)[0]))
+    # The fund that changed last cannot change back at once
+    last_position = 0 if len(tied) == 1 else None
+    t = np.inf
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(4 * fund_count + 10):
+            size = system.size
+            events = system.events()
+            if last_position is not None:
+                events[last_position] = -np.inf
+            if np.isfinite(t):
+                events[events >= t * (1 - 1e-12)] = -np.inf
+
+            position = int(np.argmax(events))
+            next_t = max(events[position], 0.0)
+            weights = np.zeros(fund_count)
+            weights[system.order[:size]] = system.weights(next_t)
+            corners.append(weights / weights.sum())
+            if next_t == 0:
+                # No more corners before t = 0, the minimum-variance portfolio
+                break
+            if position < size:
+                system.remove(position)
+                last_position = system.size
+            else:
+                system.add(position)
+                last_position = system.size - 1
+            t = next_t
+    return np.array(corners)
+
+
+def efficient_frontier(expected_returns, covariance, points=FRONTIER_POINTS):
+    # Long-only mean-variance frontier sampled at `points` expected returns
+    # evenly spaced from the minimum-variance portfolio to the best fund:
+    # (expected returns %, volatilities %, points x funds weights). Between
+    # corners the efficient weights are linear in the expected return.
+    expected_returns = np.asarray(expected_returns, dtype=np.float64)
+    corners = corner_portfolios(expected_returns, covariance)[::-1]
+    corner_returns = corners @ expected_returns
+    # Keep the return increasing along the corners, dropping numerical repeats
+    keep = np.concatenate(([True], np.diff(corner_returns) > 1e-12))
+    corners, corner_returns = corners[keep], corner_returns[keep]
+
+    targets = np.linspace(corner_returns[0], corner_returns[-1], points)
+    segment = np.clip(np.searchsorted(corner_returns, targets, side="right") - 1, 0, max(len(corners) - 2, 0))
+    if len(corners) == 1:
+        weights = np.repeat(corners, points, axis=0)
+    else:
+        span = corner_returns[segment + 1] - corner_returns[segment]
+        share = np.clip((targets - corner_returns[segment]) / span, 0, 1)[:, None]
+        weights = corners[segment] * (1 - share) + corners[segment + 1] * share
+    returns, volatility = portfolio_stats(weights, expected_returns, covariance)
+    return returns, volatility, weights
@@ -0,0 +1,132 @@
+"""Offline recommendations for a whole user cohort.
+
+Reads user profiles (CSV or Parquet with risk_tolerance and investment_amount
+columns, and optionally user_id), scores them against the catalog in chunks
+across a process pool and streams the top-k funds and investor profile of
+every user to a CSV or Parquet file, one row per user and rank:
+
+    python batch_recommend.py users.csv recommendations.parquet --k 10
+
+The catalog is the app's: FINTRO_CATALOG and the NAV store are honoured
+unless --catalog is given.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from recommender import DEFAULT_TOP_K, recommend_batch
+from registry import load_etf_catalog
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Output columns and their types, for a file with no users
+RESULT_DTYPES = {"user_id": "int64", "profile": "object", "rank": "int64", "etf_id": "int64",
+                 "ticker": "object", "match_score": "float64"}
+
+_catalog = None
+
+
+def init_worker(catalog_path):
+    # Each worker loads the catalog once
+    global _catalog
+    _catalog = load_etf_catalog(catalog_path)
+
+
+def recommend_chunk(chunk):
+    user_ids, risk_tolerances, investment_amounts, k = chunk
+    indices, scores, profiles = recommend_batch(_catalog, risk_tolerances, investment_amounts, k)
+    ranked = indices >= 0
+    users, ranks = np.nonzero(ranked)
+    funds = indices[ranked]
+    return pd.DataFrame({
+        "user_id": user_ids[users],
+        "profile": profiles[users],
+        "rank": ranks + 1,
+        "etf_id": _catalog.ids[funds],
+        "ticker": np.asarray(_catalog.tickers, dtype=object)[funds],
+        "match_score": np.round(scores[ranked].astype(np.float64), 1),
+    })
+
+
+def read_users(path):
+    users = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+    if "user_id" not in users.columns:
+        users["user_id"] = np.arange(len(users))
+    return (users["user_id"].to_numpy(), users["risk_tolerance"].to_numpy(np.int64),
+            users["investment_amount"].to_numpy(np.float64))
+
+
+class ResultWriter:
+    # Appends chunk frames to a CSV or Parquet file as they arrive
+
+    def __init__(self, path):
+        self.path = path
+        self.parquet = path.endswith(".parquet")
+        self._writer = None
+        self._header = True
+
+    def write(self, frame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self._header else "a", header=self._header, index=False)
+            self._header = False
+
+    def close(self):
+        # A file is always written, with just the header when no rows arrived
+        if self._writer is None and self._header:
+            self.write(pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in RESULT_DTYPES.items()}))
+        if self._writer is not None:
+            self._writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("users", help="CSV or Parquet file of user profiles")
+    parser.add_argument("output", help="CSV or Parquet file to write")
+    parser.add_argument("--k", type=int, default=DEFAULT_TOP_K, help="funds per user")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="users per task")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--catalog", help="catalog CSV or Parquet instead of the app's")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    user_ids, risk_tolerances, investment_amounts = read_users(args.users)
+    chunks = (
+        (user_ids[i:i + args.chunk_size], risk_tolerances[i:i + args.chunk_size],
+         investment_amounts[i:i + args.chunk_size], args.k)
+        for i in range(0, len(user_ids), args.chunk_size)
+    )
+
+    writer = ResultWriter(args.output)
+    done = 0
+    try:
+        with ProcessPoolExecutor(args.workers, initializer=init_worker, initargs=(args.catalog,)) as pool:
+            # map() yields in input order, so the output follows the users file
+            for frame in pool.map(recommend_chunk, chunks):
+                writer.write(frame)
+                done = min(done + args.chunk_size, len(user_ids))
+                elapsed = time.perf_counter() - start
+                print(f"\r{done}/{len(user_ids)} users, {done / elapsed:,.0f} users/s", end="", file=sys.stderr, flush=True)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"\nWrote recommendations for {len(user_ids)} users to {args.output} "
+          f"in {elapsed:.2f} s ({len(user_ids) / elapsed:,.0f} users/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Latency of the portfolio analytics at different numbers of funds.
+
+Covariances come from the category model and from a synthetic NAV history.
+The synthetic funds are independent, so every fund ends up in the
+minimum-variance portfolio: the frontier has a corner per fund, the worst case.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_frontier
+"""
+import time
+
+import numpy as np
+
+from analytics import RiskModel, efficient_frontier, portfolio_stats
+from catalog import synthetic_catalog
+from nav_store import NavStore, synthetic_history
+
+SIZES = (50, 100, 500, 1_000)
+REPEATS = 5
+CANDIDATES = 10_000
+NEW_DAYS = 5
+
+
+def best_ms(fn):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    print(f"{'funds':>6} {'model frontier ms':>18} {'nav frontier ms':>16} {'stats us/portfolio':>19} "
+          f"{'full cov ms':>12} {'update ms':>10}")
+    for size in SIZES:
+        catalog = synthetic_catalog(size)
+        indices = np.arange(size)
+        expected_returns = catalog.annual_return
+
+        model_covariance = RiskModel(catalog).covariance(indices)
+        model_ms = best_ms(lambda: efficient_frontier(expected_returns, model_covariance))
+
+        dates, prices = synthetic_history(catalog.annual_return, catalog.volatility)
+        history = NavStore(catalog.tickers, dates[:-NEW_DAYS], prices[:-NEW_DAYS])
+        risk_model = RiskModel(catalog, history)
+        nav_covariance = risk_model.covariance(indices)
+        nav_ms = best_ms(lambda: efficient_frontier(expected_returns, nav_covariance))
+
+        # Candidate weightings scored in one pass
+        weights = np.random.default_rng(size).dirichlet(np.ones(size), CANDIDATES)
+        stats_us = best_ms(lambda: portfolio_stats(weights, expected_returns, nav_covariance)) * 1000 / CANDIDATES
+
+        # A from-scratch covariance against merging a few new days into the tracked one
+        full_ms = best_ms(lambda: np.cov(np.diff(np.log(prices), axis=0), rowvar=False))
+        update_ms = best_ms(lambda: (risk_model.update_prices(prices[-NEW_DAYS:]), risk_model.covariance(indices)))
+        print(f"{size:>6} {model_ms:18.2f} {nav_ms:16.2f} {stats_us:19.3f} {full_ms:12.2f} {update_ms:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
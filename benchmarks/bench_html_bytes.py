@@ -0,0 +1,166 @@
+"""HTML bytes sent per rerun for the Recommendations and My Profile cards.
+
+Compares the original inline-styled f-strings with the precompiled templates
+in templates.py, for the demo catalog and for a full page of cards:
+
+    python -m benchmarks.bench_html_bytes
+"""
+import time
+
+from catalog import load_catalog, synthetic_catalog
+from templates import METRIC_ROW, PROFILE_BADGE, PROFILE_SUMMARY, STAT_CARD, render_etf_cards
+
+PAGE_SIZE = 10
+REPEATS = 200
+
+
+def legacy_etf_card(etf):
+    # The two st.markdown blobs each card used to send
+    match = f'''
+            <div style="background: linear-gradient(to bottom, #1A2980, #26D0CE); color: white; padding: 15px; display: flex; flex-direction: column; align-items: center; justify-content: center; height: 100%;">
+                <div style="font-size: 1.5rem; font-weight: 700;">{etf["matchScore"]}%</div>
+                <div style="font-size: 0.7rem; text-transform: uppercase; letter-spacing: 0.5px;">Match</div>
+            </div>
+            '''
+    details = f'''
+            <div style="background-color: white; padding: 15px; border-radius: 0 8px 8px 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+                <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
+                    <div style="font-size: 1.1rem; font-weight: 600;">{etf["name"]} ({etf["ticker"]})</div>
+                    <span style="padding: 2px 10px; border-radius: 12px; font-size: 0.75rem; font-weight: 600; background-color: {'#E3F2FD' if etf["category"] == 'Equity' else '#F3E5F5' if etf["category"] == 'Bond' else '#FFFDE7'}; color: {'#1976D2' if etf["category"] == 'Equity' else '#7B1FA2' if etf["category"] == 'Bond' else '#FFA000'};">{etf["category"]}</span>
+                </div>
+
+                <div style="display: flex; gap: 15px; margin-bottom: 15px;">
+                    <div style="text-align: center; flex: 1;">
+                        <div style="font-size: 1.1rem; font-weight: 600; color: #1A2980;">{etf["annualReturn"]}%</div>
+                        <div style="font-size: 0.8rem; color: #666;">Annual Return</div>
+                    </div>
+                    <div style="text-align: center; flex: 1;">
+                        <div style="font-size: 1.1rem; font-weight: 600; color: #1A2980;">{etf["expenseRatio"]}%</div>
+                        <div style="font-size: 0.8rem; color: #666;">Expense Ratio</div>
+                    </div>
+                    <div style="text-align: center; flex: 1;">
+                        <div style="font-size: 1.1rem; font-weight: 600; color: #1A2980;">{etf["volatility"]}%</div>
+                        <div style="font-size: 0.8rem; color: #666;">Volatility</div>
+                    </div>
+                </div>
+
+                <div>
+                    <div style="display: flex; justify-content: space-between; font-size: 0.8rem; font-weight: 600; margin-bottom: 5px;">
+                        <span>Risk Level</span>
+                        <span>{etf["riskLevel"]}/10</span>
+                    </div>
+                    <div style="height: 6px; background-color: #e0e0e0; border-radius: 3px; overflow: hidden;">
+                        <div style="height: 100%; width: {etf["riskLevel"]*10}%; background-color: {
+                            '#4CAF50' if etf["riskLevel"] <= 3 else
+                            '#FFC107' if etf["riskLevel"] <= 6 else
+                            '#F44336'
+                        }; border-radius: 3px;"></div>
+                    </div>
+                </div>
+            </div>
+            '''
+    return match + details
+
+
+def legacy_profile_card(profile_info, risk_tolerance, investment_amount):
+    avatar = '<div style="width: 100px; height: 100px; border-radius: 50%; background: linear-gradient(135deg, #7F7FD5, #86A8E7, #91EAE4); color: white; display: flex; justify-content: center; align-items: center; font-size: 2rem;">📊</div>'
+    badge = f'<span style="display: inline-block; padding: 3px 10px; border-radius: 20px; font-size: 0.8rem; font-weight: 600; color: white; background-color: #26D0CE; margin-bottom: 10px;">{profile_info["percentage"]} of students</span>'
+    metrics = f'''
+        <div class="metric">
+            <div class="metric-value">{risk_tolerance}/10</div>
+            <div class="metric-label">Risk</div>
+        </div>
+        <div class="metric">
+            <div class="metric-value">{profile_info['experience']}</div>
+            <div class="metric-label">Experience</div>
+        </div>
+        <div class="metric">
+            <div class="metric-value">€{investment_amount}</div>
+            <div class="metric-label">Investment</div>
+        </div>
+        '''
+    return avatar + badge + '<div class="metric-container">' + metrics + '</div>'
+
+
+def legacy_profile_summary(portfolio_value, total_invested, total_return, funds_owned, total_return_pct):
+    summary = f"""
+        <div style="margin-top: 15px;">
+            <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
+                <span style="font-weight: 600;">Portfolio Value:</span>
+                <span>{portfolio_value}</span>
+            </div>
+            <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
+                <span style="font-weight: 600;">Total Invested:</span>
+                <span>{total_invested}</span>
+            </div>
+            <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
+                <span style="font-weight: 600;">Total Return:</span>
+                <span style="color: #4CAF50;">{total_return}</span>
+            </div>
+        </div>
+        """
+    cards = f"""
+        <div style="background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); text-align: center;">
+            <div style="font-size: 2rem;">{funds_owned}</div>
+            <div style="color: #666;">ETFs Owned</div>
+        </div>
+        """ + f"""
+        <div style="background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); text-align: center;">
+            <div style="font-size: 2rem; color: #4CAF50;">{total_return_pct}</div>
+            <div style="color: #666;">Total Return</div>
+        </div>
+        """
+    return summary + cards
+
+
+def template_profile_card(profile_info, risk_tolerance, investment_amount):
+    return ('<div class="profile-visual">📊</div>' + PROFILE_BADGE.render(profile_info) + METRIC_ROW.render({
+        "risk_tolerance": risk_tolerance,
+        "experience": profile_info["experience"],
+        "investment_amount": investment_amount,
+    }))
+
+
+def template_profile_summary(portfolio_value, total_invested, total_return, funds_owned, total_return_pct):
+    return (PROFILE_SUMMARY.render({
+        "portfolio_value": portfolio_value,
+        "total_invested": total_invested,
+        "total_return": total_return,
+        "return_class": "positive",
+    }) + STAT_CARD.render({"value": funds_owned, "value_class": "", "label": "ETFs Owned"})
+       + STAT_CARD.render({"value": total_return_pct, "value_class": "positive", "label": "Total Return"}))
+
+
+def measure(name, legacy, templated):
+    before = len(legacy().encode("utf-8"))
+    after = len(templated().encode("utf-8"))
+    timings = []
+    for build in (legacy, templated):
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            build()
+        timings.append((time.perf_counter() - start) / REPEATS * 1e6)
+    print(f"{name:<28} {before:>9} {after:>9} {(1 - after / before) * 100:>7.1f}% "
+          f"{timings[0]:>9.1f} {timings[1]:>9.1f}")
+
+
+def main():
+    profile_info = {"percentage": "27.0%", "experience": "0-2 yrs"}
+    summary = ("€3,742.43", "€3,500.00", "€242.43 (6.93%)", 2, "6.93%")
+    demo = load_catalog().records()
+    page = synthetic_catalog(PAGE_SIZE).records()
+
+    print(f"{'block':<28} {'bytes':>9} {'bytes':>9} {'saved':>8} {'us':>9} {'us':>9}")
+    print(f"{'':<28} {'before':>9} {'after':>9} {'':>8} {'before':>9} {'after':>9}")
+    measure("investor profile card", lambda: legacy_profile_card(profile_info, 6, 2500),
+            lambda: template_profile_card(profile_info, 6, 2500))
+    measure(f"ETF cards (demo, {len(demo)})", lambda: "".join(legacy_etf_card(etf) for etf in demo),
+            lambda: render_etf_cards(demo))
+    measure(f"ETF cards (page of {PAGE_SIZE})", lambda: "".join(legacy_etf_card(etf) for etf in page),
+            lambda: render_etf_cards(page))
+    measure("profile summary and stats", lambda: legacy_profile_summary(*summary),
+            lambda: template_profile_summary(*summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Cost of what My Profile reads from the ledger, by length of the history.
+
+The page, totals and holdings columns should stay flat as the number of
+transactions grows; "full frame" is the old approach of building a
+DataFrame of the whole history on every visit, for comparison.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ledger
+"""
+import time
+
+import pandas as pd
+
+from catalog import load_catalog
+from ledger import Ledger, synthetic_transactions
+
+SIZES = (3, 1_000, 50_000, 200_000)
+REPEATS = 20
+
+
+def best_ms(fn):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    catalog = load_catalog()
+    names = dict(zip(catalog.tickers, catalog.names))
+    print(f"{'transactions':>12} {'append s':>9} {'first page ms':>14} {'deep page ms':>13} "
+          f"{'totals ms':>10} {'holdings ms':>12} {'full frame ms':>14}")
+    for size in SIZES:
+        records = synthetic_transactions(list(catalog.tickers), size)
+        start = time.perf_counter()
+        ledger = Ledger.from_records(records)
+        append_s = time.perf_counter() - start
+
+        # A cursor halfway through the history
+        deep = (records[size // 2]["date"], size // 2 + 1)
+        first_ms = best_ms(lambda: ledger.page())
+        deep_ms = best_ms(lambda: ledger.page(before=deep))
+        totals_ms = best_ms(lambda: ledger.totals())
+        holdings_ms = best_ms(lambda: ledger.holdings(names))
+        frame_ms = best_ms(lambda: pd.DataFrame(records))
+        print(f"{size:>12} {append_s:9.2f} {first_ms:14.3f} {deep_ms:13.3f} "
+              f"{totals_ms:10.3f} {holdings_ms:12.3f} {frame_ms:14.2f}")
+
+
+if __name__ == "__main__":
+    main()
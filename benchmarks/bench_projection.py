@@ -0,0 +1,46 @@
+"""Latency and peak memory of the Monte Carlo projection.
+
+Peak memory is set by the chunk budget, so it stays flat as the number of
+paths grows while the time grows linearly.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_projection
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from analytics import RiskModel
+from catalog import synthetic_catalog
+from projection import horizon_steps, simulate_bands
+
+FUNDS = 10
+HORIZONS = ("6M", "1Y", "5Y")
+PATHS = (100_000, 1_000_000)
+
+
+def main():
+    catalog = synthetic_catalog(FUNDS)
+    indices = np.arange(FUNDS)
+    expected_returns = catalog.annual_return[indices]
+    covariance = RiskModel(catalog).covariance(indices)
+    weights = np.ones(FUNDS)
+
+    print(f"{'horizon':>8} {'paths':>10} {'ms':>9} {'peak MB':>8} {'p5':>8} {'p50':>8} {'p95':>8}")
+    for horizon in HORIZONS:
+        years, steps = horizon_steps(horizon)
+        for paths in PATHS:
+            tracemalloc.start()
+            start = time.perf_counter()
+            bands = simulate_bands(expected_returns, covariance, weights, 10_000, years, steps, paths)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            tracemalloc.stop()
+            low, median, high = bands[:, -1]
+            print(f"{horizon:>8} {paths:>10} {elapsed_ms:9.1f} {peak_mb:8.1f} {low:8.0f} {median:8.0f} {high:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
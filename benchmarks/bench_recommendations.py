@@ -0,0 +1,69 @@
+"""Latency of get_recommendations' engine at different catalog sizes.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_recommendations
+"""
+import time
+
+import numpy as np
+
+from catalog import synthetic_catalog
+from recommender import Recommender, match_scores, recommend
+
+SIZES = (1_000, 100_000, 1_000_000)
+RISK_LEVELS = range(1, 11)
+REPEATS = 5
+BATCH_USERS = 100
+
+
+def legacy_recommend(etfs, risk_tolerance):
+    # The original list-of-dicts filter and full sort on the file's matchScore, for comparison
+    filtered_etfs = etfs.copy()
+    if risk_tolerance < 4:
+        filtered_etfs = [etf for etf in filtered_etfs if etf["category"] == "Bond" or etf["riskLevel"] < 6]
+    elif risk_tolerance > 7:
+        filtered_etfs = [etf for etf in filtered_etfs if etf["annualReturn"] > 5]
+    filtered_etfs.sort(key=lambda x: x["matchScore"], reverse=True)
+    return filtered_etfs
+
+
+def best_ms(fn):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    print(f"{'funds':>10} {'legacy ms':>10} {'vector ms':>10} {'table build s':>14} {'lookup ms':>10} {'batch ms/user':>14}")
+    for size in SIZES:
+        catalog = synthetic_catalog(size)
+        vector_ms = best_ms(lambda: [recommend(catalog, risk, 2500) for risk in RISK_LEVELS]) / len(RISK_LEVELS)
+
+        # The recommender materializes every (risk, amount bucket) input up front
+        start = time.perf_counter()
+        recommender = Recommender(catalog)
+        table_s = time.perf_counter() - start
+        table_ms = best_ms(lambda: [recommender.recommend(risk, 2500) for risk in RISK_LEVELS]) / len(RISK_LEVELS)
+
+        # Building a million dicts needs several GB, so the legacy path stops at 100k
+        if size <= 100_000:
+            etfs = catalog.records()
+            legacy = f"{best_ms(lambda: [legacy_recommend(etfs, risk) for risk in RISK_LEVELS]) / len(RISK_LEVELS):10.3f}"
+        else:
+            legacy = f"{'-':>10}"
+
+        # Scoring a batch of users in one users x funds matrix
+        rng = np.random.default_rng(size)
+        risks = rng.integers(1, 11, BATCH_USERS)
+        amounts = rng.integers(1, 101, BATCH_USERS) * 100
+        users = BATCH_USERS if size <= 100_000 else BATCH_USERS // 10
+        batch_ms = best_ms(lambda: match_scores(catalog, risks[:users], amounts[:users])) / users
+        print(f"{size:>10} {legacy} {vector_ms:10.3f} {table_s:14.2f} {table_ms:10.4f} {batch_ms:14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""Headless rerun benchmark for every tab of streamlit_app.py.
+
+Drives the script through streamlit.testing's AppTest (no browser) and
+records, per tab and interaction, how long the script ran, the peak Python
+memory allocated during the rerun and the number of elements the script
+emitted. The time is taken from the script runner's start and stop events:
+AppTest.run() itself polls for the result every 0.1 s, which would round
+every reading up to the next poll.
+Scenarios are parameterized by catalog size and chat history length. Results
+are written as JSON so runs can be compared:
+
+    python -m benchmarks.bench_reruns --output rerun_benchmark.json
+    python -m benchmarks.bench_reruns --baseline rerun_benchmark.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import ScriptRunnerEvent
+from streamlit.testing.v1 import AppTest, app_test
+from streamlit.testing.v1.element_tree import Block
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+from catalog import CATALOG_PATH_ENV, synthetic_catalog
+from chatbot import ChatHistory
+from views.recommendations import CHART_MODE
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit_app.py")
+
+# A measured rerun ends when the script does, so the watchlist must not stream
+# (views.profile reads this when the app first imports it)
+os.environ["FINTRO_QUOTE_STREAM_SECONDS"] = "0"
+
+
+def click(label):
+    def interact(at):
+        next(button for button in at.button if button.label == label).click()
+    return interact
+
+
+def submit_risk(value):
+    # The slider sits in a form, so a new value only reruns the app once submitted
+    def interact(at):
+        at.slider[0].set_value(value)
+        next(button for button in at.button if button.label == "Get Recommendations").click()
+    return interact
+
+
+def chat(message):
+    def interact(at):
+        at.text_input[0].input(message)
+    return interact
+
+
+# (tab, interaction name, action before the measured rerun; None measures opening the tab)
+INTERACTIONS = [
+    ("recommendations", "open", None),
+    ("recommendations", "risk_change", submit_risk(9)),
+    ("recommendations", "get_recommendations", click("Get Recommendations")),
+    ("learn", "open", None),
+    ("learn", "chat_message", chat("how do etfs work")),
+    ("profile", "open", None),
+]
+
+# With the client-side chart, switching periods does not rerun the script at all
+if CHART_MODE == "image":
+    INTERACTIONS.insert(3, ("recommendations", "period_button", click("1Y")))
+
+
+def count_elements(node):
+    if isinstance(node, Block):
+        return sum(count_elements(child) for child in node.children.values())
+    return 1
+
+
+def chat_history(length):
+    messages = [{"sender": "user" if i % 2 else "bot", "text": f"Message {i} about ETFs and expense ratios."}
+                for i in range(length)]
+    return ChatHistory(messages)
+
+
+def prepared_app(tab, action, chat_length):
+    # A fresh session whose next run() is the measured rerun
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.session_state["chat_messages"] = chat_history(chat_length)
+    at.session_state["active_tab"] = tab
+    if action:
+        at.run()
+        action(at)
+    return at
+
+
+class TimedScriptRunner(LocalScriptRunner):
+    # Records when the script starts and stops executing
+    STOPPED = (ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS, ScriptRunnerEvent.SCRIPT_STOPPED_FOR_RERUN,
+               ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.started = self.stopped = None
+        self.on_event.connect(self.record_time, weak=False)
+
+    def record_time(self, sender, event, **kwargs):
+        if event == ScriptRunnerEvent.SCRIPT_STARTED:
+            self.started = time.perf_counter()
+        elif event in self.STOPPED:
+            self.stopped = time.perf_counter()
+
+
+def timed_run(at):
+    # Seconds the script ran for during at.run()
+    runners = []
+
+    def script_runner(*args, **kwargs):
+        runners.append(TimedScriptRunner(*args, **kwargs))
+        return runners[-1]
+
+    with mock.patch.object(app_test, "LocalScriptRunner", script_runner):
+        at.run()
+    return runners[-1].stopped - runners[-1].started
+
+
+def measure(tab, action, chat_length, repeats):
+    timings = []
+    for _ in range(repeats):
+        at = prepared_app(tab, action, chat_length)
+        timings.append(timed_run(at))
+        if at.exception:
+            raise RuntimeError(f"{tab} rerun failed: {at.exception[0].message}")
+    elements = count_elements(at._tree)
+
+    # Memory is measured on a separate rerun so tracing does not skew the timings
+    at = prepared_app(tab, action, chat_length)
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "script_ms_median": statistics.median(timings) * 1000,
+        "script_ms_min": min(timings) * 1000,
+        "peak_memory_kb": peak / 1024,
+        "elements": elements,
+    }
+
+
+def use_catalog(size, directory):
+    # size 0 means the demo catalog shipped with the app
+    if size:
+        path = os.path.join(directory, f"catalog_{size}.csv")
+        synthetic_catalog(size).to_frame().to_csv(path, index=False)
+        os.environ[CATALOG_PATH_ENV] = path
+    else:
+        os.environ.pop(CATALOG_PATH_ENV, None)
+    # Process-wide resources are keyed by function, not by catalog file
+    st.cache_resource.clear()
+    st.cache_data.clear()
+
+
+def run(catalog_sizes, chat_lengths, repeats):
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for catalog_size in catalog_sizes:
+            use_catalog(catalog_size, directory)
+            for tab, interaction, action in INTERACTIONS:
+                # Chat history length only matters to the Learn tab
+                lengths = chat_lengths if tab == "learn" else chat_lengths[:1]
+                for chat_length in lengths:
+                    result = {
+                        "tab": tab,
+                        "interaction": interaction,
+                        "catalog_size": catalog_size,
+                        "chat_history": chat_length,
+                        **measure(tab, action, chat_length, repeats),
+                    }
+                    results.append(result)
+                    print(f"{tab:>15} {interaction:>20} funds={catalog_size:<7} chat={chat_length:<5} "
+                          f"{result['script_ms_median']:9.1f} ms {result['peak_memory_kb']:10.0f} KB "
+                          f"{result['elements']:5d} elements", flush=True)
+    return results
+
+
+def scenario_key(result):
+    return (result["tab"], result["interaction"], result["catalog_size"], result["chat_history"])
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {scenario_key(result): result for result in json.load(f)["results"]}
+    print(f"\nChange against {baseline_path}:")
+    for result in results:
+        before = baseline.get(scenario_key(result))
+        if before is None:
+            continue
+        if "script_ms_median" not in before:
+            # Older baselines hold AppTest.run() wall times, which are not comparable
+            continue
+        change = (result["script_ms_median"] / before["script_ms_median"] - 1) * 100
+        print(f"{result['tab']:>15} {result['interaction']:>20} funds={result['catalog_size']:<7} "
+              f"chat={result['chat_history']:<5} {change:+7.1f}% script time, "
+              f"{result['elements'] - before['elements']:+d} elements")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--catalog-sizes", default="0,1000,50000",
+                        help="comma-separated fund counts; 0 is the demo catalog")
+    parser.add_argument("--chat-lengths", default="1,50,200", help="comma-separated chat history lengths")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", default="rerun_benchmark.json")
+    parser.add_argument("--baseline", help="earlier output file to compare against")
+    args = parser.parse_args(argv)
+
+    results = run(
+        [int(size) for size in args.catalog_sizes.split(",")],
+        [int(length) for length in args.chat_lengths.split(",")],
+        args.repeats,
+    )
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "streamlit": st.__version__,
+            "repeats": args.repeats,
+            "results": results,
+        }, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+    if args.baseline:
+        compare(results, args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
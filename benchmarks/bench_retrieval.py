@@ -0,0 +1,76 @@
+"""Query latency of the assistant's TF-IDF retrieval at different knowledge-base sizes.
+
+The synthetic knowledge base draws words from a Zipf-distributed vocabulary,
+so a few terms have long postings lists like real text. Queries are
+paraphrases of random entries: some question words dropped, one unknown word
+added. Run from the repository root:
+
+    python -m benchmarks.bench_retrieval
+"""
+import time
+
+import numpy as np
+
+import content
+from chatbot import IntentMatcher, answer_query
+from retrieval import RetrievalIndex, content_entries
+
+SIZES = (1_000, 10_000, 100_000)
+VOCABULARY_SIZE = 20_000
+QUERIES = 500
+
+
+def synthetic_entries(size, seed=0):
+    rng = np.random.default_rng(seed)
+    words = [f"w{i}" for i in range(VOCABULARY_SIZE)]
+
+    def sentence(length):
+        ranks = np.minimum(rng.zipf(1.3, length), VOCABULARY_SIZE) - 1
+        return " ".join(words[rank] for rank in ranks)
+
+    # Content entries first so the real questions stay answerable
+    entries = content_entries(content.chatbot_responses, content.faqs)
+    entries += [(sentence(rng.integers(4, 12)), sentence(rng.integers(30, 80))) for _ in range(size - len(entries))]
+    return entries
+
+
+def paraphrases(entries, count, seed=1):
+    rng = np.random.default_rng(seed)
+    queries = []
+    for i in rng.integers(0, len(entries), count):
+        words = entries[i][0].split()
+        keep = rng.random(len(words)) < 0.7
+        queries.append((" ".join([word for word, kept in zip(words, keep) if kept] + ["unseenword"]), entries[i][1]))
+    return queries
+
+
+def main():
+    matcher = IntentMatcher(content.key_phrase_matches)
+    print(f"{'entries':>10} {'build s':>9} {'p50 ms':>8} {'p95 ms':>8} {'top-1':>6} {'answer p50 ms':>14}")
+    for size in SIZES:
+        entries = synthetic_entries(size)
+        start = time.perf_counter()
+        index = RetrievalIndex(entries)
+        build_seconds = time.perf_counter() - start
+
+        queries = paraphrases(entries, QUERIES)
+        timings = []
+        correct = 0
+        for query, expected in queries:
+            start = time.perf_counter()
+            answer = index.best_answer(query, threshold=0)
+            timings.append(time.perf_counter() - start)
+            correct += answer == expected
+        p50, p95 = np.percentile(timings, [50, 95]) * 1000
+
+        # Full assistant path: exact match, retrieval, then the key-phrase rules
+        answer_timings = []
+        for query, _ in queries[:100]:
+            start = time.perf_counter()
+            answer_query(query, content.chatbot_responses, matcher, index)
+            answer_timings.append(time.perf_counter() - start)
+        print(f"{size:>10} {build_seconds:9.2f} {p50:8.3f} {p95:8.3f} {correct / len(queries):6.1%} {np.median(answer_timings) * 1000:14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Cold-start import report and budget check.
+
+Each measurement runs in a fresh interpreter with ``-X importtime``, so the
+numbers are what a new Streamlit worker pays. The report lists the modules
+with the largest cumulative import time for startup and for the first visit
+of every tab. With --budget it exits with status 1 when the cold start
+(streamlit plus everything the app imports before rendering) exceeds the
+budget, which makes it usable as a CI gate:
+
+    python -m benchmarks.startup_report
+    python -m benchmarks.startup_report --budget 1.5
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds allowed for a cold start when --budget is passed without a value
+COLD_START_BUDGET = 2.0
+
+# Everything streamlit_app.py imports before it renders a tab
+STARTUP_MODULES = ("streamlit", "registry", "views.debug")
+
+TAB_MODULES = {
+    "recommendations": "views.recommendations",
+    "learn": "views.learn",
+    "profile": "views.profile",
+}
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(preload, modules):
+    # {module: cumulative seconds} for importing `modules` after `preload`
+    code = "".join(f"import {module}\n" for module in preload)
+    code += "import sys\nprint('--', file=sys.stderr)\n"
+    code += "".join(f"import {module}\n" for module in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    measured = result.stderr.split("--\n", 1)[1]
+    times = {}
+    for match in IMPORT_LINE.finditer(measured):
+        _, cumulative, indent, module = match.groups()
+        times[module] = (int(cumulative) / 1e6, len(indent) // 2)
+    return times
+
+
+def total(times):
+    # Top-level imports carry the cumulative time of everything below them
+    return sum(seconds for seconds, depth in times.values() if depth == 0)
+
+
+def report(title, times, top):
+    print(f"\n{title}: {total(times):.3f} s")
+    heaviest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    for module, (seconds, _) in heaviest:
+        print(f"  {seconds * 1000:9.1f} ms  {module}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, nargs="?", const=COLD_START_BUDGET,
+                        help=f"fail if cold start exceeds this many seconds (default {COLD_START_BUDGET})")
+    parser.add_argument("--top", type=int, default=10, help="modules listed per section")
+    args = parser.parse_args(argv)
+
+    startup = import_times((), STARTUP_MODULES)
+    report("Cold start", startup, args.top)
+    for tab, module in TAB_MODULES.items():
+        report(f"First visit of {tab}", import_times(STARTUP_MODULES, (module,)), args.top)
+
+    cold_start = total(startup)
+    if args.budget is not None:
+        if cold_start > args.budget:
+            print(f"\nFAIL: cold start {cold_start:.3f} s exceeds the {args.budget:.3f} s budget")
+            return 1
+        print(f"\nOK: cold start {cold_start:.3f} s is within the {args.budget:.3f} s budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""Columnar ETF catalog loaded from a local CSV or Parquet file.
+
+Every numeric field is held as a fixed-dtype NumPy column, categories as small
+integer codes and the per-period returns as a funds x periods matrix, so the
+hot paths can work over the whole universe at once. The arrays are marked
+read-only because a single catalog instance is shared by every session.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+PERIODS = ("1M", "3M", "6M", "1Y", "5Y")
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "etfs.csv")
+
+# Point this at another CSV/Parquet file to serve a different universe
+CATALOG_PATH_ENV = "FINTRO_CATALOG"
+
+RETURN_COLUMNS = tuple(f"return_{period}" for period in PERIODS)
+
+COLUMN_DTYPES = {
+    "id": np.int64,
+    "name": object,
+    "ticker": object,
+    "category": object,
+    "annualReturn": np.float64,
+    "expenseRatio": np.float64,
+    "volatility": np.float64,
+    "riskLevel": np.int8,
+    "matchScore": np.int16,
+    **{column: np.float64 for column in RETURN_COLUMNS},
+}
+
+
+def _code_dtype(count):
+    # Smallest signed integer dtype holding every category code, as pandas picks
+    return np.result_type(np.int8, np.min_scalar_type(-count))
+
+
+def _frozen(values, dtype=None):
+    array = np.ascontiguousarray(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+class ETFCatalog:
+    def __init__(self, ids, names, tickers, category_codes, category_names, annual_return,
+                 expense_ratio, volatility, risk_level, match_score, returns):
+        self.ids = _frozen(ids, np.int64)
+        self.names = _frozen(names, object)
+        self.tickers = _frozen(tickers, object)
+        self.category_names = tuple(category_names)
+        self.category_codes = _frozen(category_codes, _code_dtype(len(self.category_names)))
+        self.annual_return = _frozen(annual_return, np.float64)
+        self.expense_ratio = _frozen(expense_ratio, np.float64)
+        self.volatility = _frozen(volatility, np.float64)
+        self.risk_level = _frozen(risk_level, np.int8)
+        self.match_score = _frozen(match_score, np.int16)
+        # funds x periods, columns ordered as PERIODS
+        self.returns = _frozen(returns, np.float64)
+        self._records = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_frame(cls, frame):
+        missing = [column for column in COLUMN_DTYPES if column not in frame.columns]
+        if missing:
+            raise ValueError(f"ETF catalog is missing columns: {', '.join(missing)}")
+        categories = pd.Categorical(frame["category"])
+        return cls(
+            ids=frame["id"].to_numpy(np.int64),
+            names=frame["name"].to_numpy(object),
+            tickers=frame["ticker"].to_numpy(object),
+            category_codes=categories.codes,
+            category_names=categories.categories,
+            annual_return=frame["annualReturn"].to_numpy(np.float64),
+            expense_ratio=frame["expenseRatio"].to_numpy(np.float64),
+            volatility=frame["volatility"].to_numpy(np.float64),
+            risk_level=frame["riskLevel"].to_numpy(np.int8),
+            match_score=frame["matchScore"].to_numpy(np.int16),
+            returns=frame[list(RETURN_COLUMNS)].to_numpy(np.float64),
+        )
+
+    def to_frame(self):
+        frame = pd.DataFrame({
+            "id": self.ids,
+            "name": self.names,
+            "ticker": self.tickers,
+            "category": self.categories(),
+            "annualReturn": self.annual_return,
+            "expenseRatio": self.expense_ratio,
+            "volatility": self.volatility,
+            "riskLevel": self.risk_level,
+            "matchScore": self.match_score,
+        })
+        for i, column in enumerate(RETURN_COLUMNS):
+            frame[column] = self.returns[:, i]
+        return frame
+
+    def with_nav(self, store):
+        # Copy of the catalog with returns, annual return and volatility taken
+        # from a NavStore; funds without enough history keep their file values
+        positions = store.index_of(self.tickers)
+        covered = positions >= 0
+
+        def merged(current, computed):
+            values = np.array(current, dtype=np.float64)
+            fresh = np.round(computed[positions[covered]], 2)
+            values[covered] = np.where(np.isnan(fresh), values[covered], fresh)
+            return values
+
+        return ETFCatalog(
+            ids=self.ids,
+            names=self.names,
+            tickers=self.tickers,
+            category_codes=self.category_codes,
+            category_names=self.category_names,
+            annual_return=merged(self.annual_return, store.annualized_return()),
+            expense_ratio=self.expense_ratio,
+            volatility=merged(self.volatility, store.volatility()),
+            risk_level=self.risk_level,
+            match_score=self.match_score,
+            returns=merged(self.returns, store.period_returns()),
+        )
+
+    def category_code(self, name):
+        # -1 never matches a stored code, so unknown categories select nothing
+        try:
+            return self.category_names.index(name)
+        except ValueError:
+            return -1
+
+    def categories(self, indices=None):
+        names = np.asarray(self.category_names, dtype=object)
+        codes = self.category_codes if indices is None else self.category_codes[indices]
+        return names[codes]
+
+    def period_index(self, period):
+        return PERIODS.index(period)
+
+    def record(self, i):
+        # Same shape as the original hand-written ETF dicts
+        return {
+            "id": int(self.ids[i]),
+            "name": self.names[i],
+            "ticker": self.tickers[i],
+            "category": self.category_names[self.category_codes[i]],
+            "annualReturn": float(self.annual_return[i]),
+            "expenseRatio": float(self.expense_ratio[i]),
+            "volatility": float(self.volatility[i]),
+            "riskLevel": int(self.risk_level[i]),
+            "matchScore": int(self.match_score[i]),
+            "returns": {period: float(value) for period, value in zip(PERIODS, self.returns[i])},
+        }
+
+    def records(self, indices=None):
+        if indices is not None:
+            return [self.record(int(i)) for i in indices]
+        if self._records is None:
+            self._records = [self.record(i) for i in range(len(self))]
+        return self._records
+
+
+def catalog_path(path=None):
+    return path or os.environ.get(CATALOG_PATH_ENV) or DEFAULT_CATALOG_PATH
+
+
+def load_catalog(path=None):
+    path = catalog_path(path)
+    if path.endswith(".parquet"):
+        frame = pd.read_parquet(path)
+        frame = frame.astype({column: dtype for column, dtype in COLUMN_DTYPES.items() if column in frame.columns})
+    else:
+        frame = pd.read_csv(path, dtype=COLUMN_DTYPES)
+    return ETFCatalog.from_frame(frame)
+
+
+def synthetic_catalog(n, seed=0):
+    # Randomised universe with the same columns as the demo data, for benchmarks
+    rng = np.random.default_rng(seed)
+    category_names = ("Bond", "Equity", "Mixed")
+    category_codes = rng.integers(0, len(category_names), n)
+    risk_level = rng.integers(1, 11, n)
+    volatility = np.round(rng.uniform(2.0, 25.0, n), 1)
+    annual_return = np.round(rng.normal(6.0, 4.0, n), 2)
+    horizons = np.array([1 / 12, 3 / 12, 6 / 12, 1.0, 5.0])
+    returns = np.round(annual_return[:, None] * horizons[None, :], 2)
+    return ETFCatalog(
+        ids=np.arange(1, n + 1),
+        names=np.array([f"Fund {i} ETF" for i in range(1, n + 1)], dtype=object),
+        tickers=np.array([f"F{i:06d}" for i in range(1, n + 1)], dtype=object),
+        category_codes=category_codes,
+        category_names=category_names,
+        annual_return=annual_return,
+        expense_ratio=np.round(rng.uniform(0.03, 0.9, n), 2),
+        volatility=volatility,
+        risk_level=risk_level,
+        match_score=rng.integers(40, 100, n),
+        returns=returns,
+    )
@@ -0,0 +1,194 @@
+"""Cached rendering of the performance comparison chart.
+
+Charts are drawn on a standalone matplotlib Figure with the Agg canvas, so
+nothing is registered with pyplot, and only the encoded PNG bytes are kept in
+a bounded LRU cache shared by every session. matplotlib is imported on the
+first cache miss rather than at startup.
+
+returns_chart_spec() is the client-side alternative: a Vega-Lite spec carrying
+the returns for every period, with the period picker bound to a chart
+parameter, so switching periods happens in the browser without a rerun.
+frontier_chart_spec() and projection_chart_spec() plot an efficient frontier
+and projected value bands the same way.
+"""
+from io import BytesIO
+
+from lru import LRUCache
+
+BAR_COLORS = ["#1976D2", "#7B1FA2", "#FFA000", "#388E3C"]
+
+
+def render_returns_chart(etf_names, returns, selected_time_period):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    # Create the figure and axis
+    fig = Figure(figsize=(10, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    bars = ax.bar(etf_names, returns, color=BAR_COLORS[:len(etf_names)], alpha=0.8)
+
+    # Add labels and title
+    ax.set_ylabel('Returns (%)')
+    ax.set_title(f'Expected Returns ({selected_time_period})')
+
+    # Add value labels on top of bars
+    for bar in bars:
+        height = bar.get_height()
+        ax.annotate(f'{height}%',
+                    xy=(bar.get_x() + bar.get_width() / 2, height),
+                    xytext=(0, 3),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha='center', va='bottom',
+                    fontweight='bold')
+
+    # Customize appearance
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+    # Same encoding st.pyplot uses
+    image = BytesIO()
+    fig.savefig(image, format="png", dpi=200, bbox_inches="tight")
+    fig.clear()
+    return image.getvalue()
+
+
+class ChartCache:
+    def __init__(self, max_entries=128):
+        self._images = LRUCache(max_entries)
+
+    def get(self, tickers, etf_names, returns, selected_time_period):
+        key = (tuple(tickers), tuple(returns), selected_time_period)
+        image = self._images.get(key)
+        if image is None:
+            image = render_returns_chart(list(etf_names), list(returns), selected_time_period)
+            self._images.put(key, image)
+        return image
+
+    def stats(self):
+        return {**self._images.stats(), "bytes": sum(len(image) for image in self._images.values())}
+
+
+def returns_chart_spec(tickers, etf_names, returns_by_period, selected_time_period):
+    # returns_by_period: one {period: return} mapping per fund, in display order
+    periods = list(returns_by_period[0]) if returns_by_period else []
+    rows = [
+        {"ticker": ticker, "name": name, "period": period, "return": returns[period]}
+        for ticker, name, returns in zip(tickers, etf_names, returns_by_period)
+        for period in periods
+    ]
+    encoding = {
+        "x": {"field": "name", "type": "nominal", "sort": None, "title": None, "axis": {"labelAngle": 0}},
+        "y": {"field": "return", "type": "quantitative", "title": "Returns (%)"},
+    }
+    return {
+        "data": {"values": rows},
+        "params": [{
+            "name": "period",
+            "value": selected_time_period,
+            "bind": {"input": "radio", "options": periods, "name": "Period "},
+        }],
+        "transform": [
+            {"filter": "datum.period === period"},
+            {"calculate": "datum['return'] + '%'", "as": "label"},
+        ],
+        "title": "Expected Returns",
+        "height": 320,
+        "layer": [
+            {
+                "mark": {"type": "bar", "opacity": 0.8},
+                "encoding": {
+                    **encoding,
+                    "color": {"field": "ticker", "type": "nominal", "sort": None, "legend": None,
+                              "scale": {"range": BAR_COLORS}},
+                    "tooltip": [
+                        {"field": "name", "type": "nominal"},
+                        {"field": "period", "type": "nominal"},
+                        {"field": "return", "type": "quantitative", "format": ".1f"},
+                    ],
+                },
+            },
+            {
+                "mark": {"type": "text", "dy": -8, "fontWeight": "bold"},
+                "encoding": {**encoding, "text": {"field": "label", "type": "nominal"}},
+            },
+        ],
+        "config": {"view": {"stroke": None}, "axisY": {"gridDash": [4, 4]}},
+    }
+
+
+def frontier_chart_spec(frontier_returns, frontier_volatility, etf_names, etf_returns, etf_volatility,
+                        portfolio_return, portfolio_volatility):
+    # Efficient frontier line, each fund as a point and the portfolio highlighted
+    frontier = [{"volatility": v, "return": r} for r, v in zip(frontier_returns, frontier_volatility)]
+    funds = [{"name": name, "volatility": v, "return": r}
+             for name, r, v in zip(etf_names, etf_returns, etf_volatility)]
+    portfolio = [{"name": "Equal-weight portfolio", "volatility": portfolio_volatility, "return": portfolio_return}]
+    encoding = {
+        "x": {"field": "volatility", "type": "quantitative", "title": "Volatility (%)", "scale": {"zero": False}},
+        "y": {"field": "return", "type": "quantitative", "title": "Expected return (%)", "scale": {"zero": False}},
+    }
+    tooltip = [
+        {"field": "name", "type": "nominal"},
+        {"field": "return", "type": "quantitative", "format": ".2f"},
+        {"field": "volatility", "type": "quantitative", "format": ".2f"},
+    ]
+    return {
+        "title": "Efficient Frontier",
+        "height": 320,
+        "layer": [
+            {
+                "data": {"values": frontier},
+                "mark": {"type": "line", "color": BAR_COLORS[0], "strokeWidth": 2},
+                "encoding": encoding,
+            },
+            {
+                "data": {"values": funds},
+                "mark": {"type": "point", "filled": True, "size": 60, "color": BAR_COLORS[1]},
+                "encoding": {**encoding, "tooltip": tooltip},
+            },
+            {
+                "data": {"values": portfolio},
+                "mark": {"type": "point", "shape": "diamond", "filled": True, "size": 140, "color": BAR_COLORS[2]},
+                "encoding": {**encoding, "tooltip": tooltip},
+            },
+        ],
+        "config": {"view": {"stroke": None}, "axisY": {"gridDash": [4, 4]}},
+    }
+
+
+def projection_chart_spec(months, low, median, high, percentiles):
+    # Fan of projected values: the band between the outer percentiles and the median line
+    rows = [{"month": m, "low": lo, "median": mid, "high": hi} for m, lo, mid, hi in zip(months, low, median, high)]
+    low_label, median_label, high_label = (f"p{percentile}" for percentile in percentiles)
+    x = {"field": "month", "type": "quantitative", "title": "Months"}
+    return {
+        "data": {"values": rows},
+        "title": "Projected Value",
+        "height": 320,
+        "layer": [
+            {
+                "mark": {"type": "area", "opacity": 0.25, "color": BAR_COLORS[0]},
+                "encoding": {
+                    "x": x,
+                    "y": {"field": "low", "type": "quantitative", "title": "Value (€)", "scale": {"zero": False}},
+                    "y2": {"field": "high"},
+                },
+            },
+            {
+                "mark": {"type": "line", "color": BAR_COLORS[0], "strokeWidth": 2},
+                "encoding": {
+                    "x": x,
+                    "y": {"field": "median", "type": "quantitative"},
+                    "tooltip": [
+                        {"field": "month", "type": "quantitative", "format": ".0f"},
+                        {"field": "low", "type": "quantitative", "format": ",.0f", "title": low_label},
+                        {"field": "median", "type": "quantitative", "format": ",.0f", "title": median_label},
+                        {"field": "high", "type": "quantitative", "format": ",.0f", "title": high_label},
+                    ],
+                },
+            },
+        ],
+        "config": {"view": {"stroke": None}, "axisY": {"gridDash": [4, 4]}},
+    }
@@ -0,0 +1,215 @@
+"""Query matching for the Fintro assistant.
+
+IntentMatcher compiles the primary/secondary key-phrase table into an
+Aho-Corasick automaton once, so resolving a query is a single pass over its
+characters instead of a substring scan per key phrase. It is the fallback for
+queries the TF-IDF retrieval in retrieval.py is not confident about, and
+AnswerCache shares resolved answers across sessions. Replies are produced as
+a stream of chunks so the UI can render them incrementally, and ChatHistory
+keeps each session's transcript bounded.
+"""
+import json
+import os
+import re
+from collections import deque
+
+from lru import LRUCache
+from retrieval import STOPWORDS, TOKEN
+
+EXACT_TOKEN = re.compile(r"[a-z0-9']+")
+
+FALLBACK_RESPONSE = "I'm not sure about that. Could you try asking about ETFs, investment basics, or risk profiles?"
+
+
+class IntentMatcher:
+    def __init__(self, key_phrase_matches):
+        self._phrase_ids = {"": 0}
+        # (primary id, secondary id) -> (rank, response key); the rank is the
+        # table's iteration order, which decides precedence like the old loop
+        self._rules = {}
+        rank = 0
+        for primary_key, secondary_matches in key_phrase_matches.items():
+            primary_id = self._phrase_id(primary_key)
+            for secondary_key, response_key in secondary_matches.items():
+                self._rules.setdefault((primary_id, self._phrase_id(secondary_key)), (rank, response_key))
+                rank += 1
+        self._build_automaton()
+
+    def _phrase_id(self, phrase):
+        return self._phrase_ids.setdefault(phrase, len(self._phrase_ids))
+
+    def _build_automaton(self):
+        self._goto = [{}]
+        self._output = [0]
+        for phrase, phrase_id in self._phrase_ids.items():
+            if not phrase:
+                continue
+            node = 0
+            for char in phrase:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._output.append(0)
+                node = next_node
+            self._output[node] = phrase_id
+
+        # Breadth-first failure links, plus dictionary links that skip straight
+        # to the next suffix state that completes a phrase
+        self._fail = [0] * len(self._goto)
+        self._dict_link = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._dict_link[child] = self._fail[child] if self._output[self._fail[child]] else self._dict_link[self._fail[child]]
+                queue.append(child)
+
+    def phrases_in(self, query):
+        # Ids of every key phrase occurring in the query; "" always occurs
+        found = {0}
+        node = 0
+        for char in query:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            hit = node if self._output[node] else self._dict_link[node]
+            while hit:
+                found.add(self._output[hit])
+                hit = self._dict_link[hit]
+        return found
+
+    def match(self, query):
+        # Response key of the first rule whose phrases both occur, or None
+        found = self.phrases_in(query)
+        best = None
+        for primary_id in found:
+            for secondary_id in found:
+                rule = self._rules.get((primary_id, secondary_id))
+                if rule is not None and (best is None or rule < best):
+                    best = rule
+        return best[1] if best else None
+
+
+def exact_key(query):
+    # The query as chatbot_responses keys are written: lowercase words, without
+    # punctuation other than apostrophes, so "How do ETFs work?" finds
+    # "how do etfs work"
+    return " ".join(EXACT_TOKEN.findall(query.lower()))
+
+
+def answer_query(query, chatbot_responses, matcher, retriever=None):
+    query = query.lower()
+    # Check for exact matches
+    exact = chatbot_responses.get(exact_key(query))
+    if exact is not None:
+        return exact
+    # Check for a similar question in the knowledge base
+    if retriever is not None:
+        answer = retriever.best_answer(query)
+        if answer is not None:
+            return answer
+    # Check for key phrases
+    response_key = matcher.match(query)
+    if response_key is None:
+        return FALLBACK_RESPONSE
+    return chatbot_responses[response_key]
+
+
+def normalize_query(query):
+    # Cache key: lowercased words without punctuation or stop words, in order
+    words = TOKEN.findall(query.lower().replace("'", ""))
+    content_words = [word for word in words if word not in STOPWORDS]
+    return " ".join(content_words or words)
+
+
+class AnswerCache:
+    # Process-wide LRU of answer_query() results keyed on normalize_query()
+    # and the key phrases the matcher finds, so "What is an ETF?" and "what is
+    # an etf" share an entry but "What about taxes?" and "How about taxes?" do
+    # not: "what" and "how" are stop words yet decide which rule applies.
+    # Entries expire after `ttl` seconds. It belongs to one response set: the
+    # registry builds a new cache whenever the content is reloaded.
+
+    def __init__(self, chatbot_responses, matcher, retriever=None, max_entries=1024, ttl=3600):
+        self.chatbot_responses = chatbot_responses
+        self.matcher = matcher
+        self.retriever = retriever
+        self._answers = LRUCache(max_entries, ttl)
+
+    def answer(self, query):
+        # Exact matches are resolved first: normalize_query() drops the stop
+        # words, so "How ETFs work" shares a key with the canned "how do etfs
+        # work" but is answered by retrieval
+        exact = self.chatbot_responses.get(exact_key(query))
+        if exact is not None:
+            return exact
+        key = (normalize_query(query), frozenset(self.matcher.phrases_in(query.lower())))
+        answer = self._answers.get(key)
+        if answer is None:
+            answer = answer_query(query, self.chatbot_responses, self.matcher, self.retriever)
+            self._answers.put(key, answer)
+        return answer
+
+    def clear(self):
+        self._answers.clear()
+
+    def stats(self):
+        return self._answers.stats()
+
+
+def stream_response(text, words_per_chunk=4):
+    # Yields the reply a few words at a time; joining the chunks gives back the text
+    words = re.findall(r"\s*\S+\s*", text)
+    for i in range(0, len(words), words_per_chunk):
+        yield "".join(words[i:i + words_per_chunk])
+
+
+class ChatHistory:
+    # The newest `capacity` messages stay in memory; older ones are appended to
+    # a JSON-lines spill file when one is given, and dropped otherwise.
+
+    def __init__(self, messages=(), capacity=200, spill_path=None):
+        self._messages = deque(maxlen=capacity)
+        self.spill_path = spill_path
+        self.spilled = 0
+        for message in messages:
+            self.append(message)
+
+    def __len__(self):
+        return self.spilled + len(self._messages)
+
+    def __iter__(self):
+        return iter(self._messages)
+
+    def __getitem__(self, index):
+        return self._messages[index]
+
+    def append(self, message):
+        if len(self._messages) == self._messages.maxlen:
+            oldest = self._messages[0]
+            if self.spill_path:
+                os.makedirs(os.path.dirname(self.spill_path), exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as spill:
+                    spill.write(json.dumps(oldest) + "\n")
+                self.spilled += 1
+        self._messages.append(message)
+
+    def available(self):
+        # Number of messages that window() can return
+        return len(self) if self.spill_path else len(self._messages)
+
+    def window(self, size):
+        # The most recent `size` messages, reading back from the spill file if needed
+        recent = list(self._messages)[-size:] if size > 0 else []
+        missing = size - len(recent)
+        if missing <= 0 or not self.spilled:
+            return recent
+        with open(self.spill_path, encoding="utf-8") as spill:
+            lines = spill.readlines()[-missing:]
+        return [json.loads(line) for line in lines] + recent
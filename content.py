@@ -0,0 +1,535 @@
+"""Static content for the Fintro app: stylesheet, demo user, chatbot answers and FAQs.
+
+Nothing here depends on user input. registry.build_registry() turns these
+definitions into read-only structures once per process.
+"""
+
+# Custom CSS injected on every page
+stylesheet = """
+<style>
+/* Main colors */
+:root {
+    --primary-blue: #1A2980;
+    --primary-teal: #26D0CE;
+    --light-gray: #F5F7FA;
+    --white: #FFFFFF;
+    --coral: #FF6B6B;
+    --low-risk: #4CAF50;
+    --medium-risk: #FFC107;
+    --high-risk: #F44336;
+}
+
+.main {
+    background-color: var(--light-gray);
+    padding: 20px;
+}
+
+h1, h2, h3 {
+    color: var(--primary-blue);
+}
+
+.stButton>button {
+    background-color: var(--coral);
+    color: white;
+    border-radius: 30px;
+    border: none;
+    padding: 10px 24px;
+    text-align: center;
+    text-decoration: none;
+    display: inline-block;
+    font-size: 16px;
+    margin: 4px 2px;
+    cursor: pointer;
+    transition-duration: 0.4s;
+}
+
+.stButton>button:hover {
+    background-color: #ff5252;
+    transform: translateY(-2px);
+}
+
+/* Card styling */
+.card {
+    background-color: white;
+    border-radius: 8px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    padding: 20px;
+    margin-bottom: 20px;
+}
+
+/* Profile Card */
+.profile-card {
+    display: flex;
+    gap: 20px;
+}
+
+.profile-visual {
+    width: 100px;
+    height: 100px;
+    border-radius: 50%;
+    background: linear-gradient(135deg, #7F7FD5, #86A8E7, #91EAE4);
+    color: white;
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    font-size: 2rem;
+}
+
+.profile-visual.user {
+    background: linear-gradient(135deg, var(--primary-blue), var(--primary-teal));
+    font-size: 3rem;
+}
+
+.profile-badge {
+    display: inline-block;
+    padding: 3px 10px;
+    border-radius: 20px;
+    font-size: 0.8rem;
+    font-weight: 600;
+    color: white;
+    background-color: var(--primary-teal);
+    margin-bottom: 10px;
+}
+
+/* Portfolio summary on My Profile */
+.profile-summary {
+    margin-top: 15px;
+}
+
+.summary-row {
+    display: flex;
+    justify-content: space-between;
+    margin-bottom: 10px;
+}
+
+.summary-label {
+    font-weight: 600;
+}
+
+.stat-card {
+    background-color: white;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    text-align: center;
+}
+
+.stat-value {
+    font-size: 2rem;
+}
+
+.stat-label {
+    color: #666;
+}
+
+/* ETF Card */
+.etf-card {
+    display: flex;
+    border-radius: 8px;
+    overflow: hidden;
+    background-color: white;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    margin-bottom: 15px;
+}
+
+.etf-match-score {
+    width: 70px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    align-items: center;
+    background: linear-gradient(to bottom, var(--primary-blue), var(--primary-teal));
+    color: white;
+    padding: 15px 10px;
+}
+
+.etf-match-value {
+    font-size: 1.5rem;
+    font-weight: 700;
+}
+
+.etf-match-label {
+    font-size: 0.7rem;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+
+.etf-details {
+    flex: 1;
+    padding: 15px;
+}
+
+.etf-header {
+    display: flex;
+    justify-content: space-between;
+    margin-bottom: 10px;
+}
+
+.etf-name {
+    font-size: 1.1rem;
+    font-weight: 600;
+}
+
+.etf-category {
+    padding: 2px 10px;
+    border-radius: 12px;
+    font-size: 0.75rem;
+    font-weight: 600;
+}
+
+.category-equity {
+    background-color: #E3F2FD;
+    color: #1976D2;
+}
+
+.category-bond {
+    background-color: #F3E5F5;
+    color: #7B1FA2;
+}
+
+.category-other {
+    background-color: #FFFDE7;
+    color: #FFA000;
+}
+
+/* Chat styling */
+.chat-history {
+    display: flex;
+    flex-direction: column;
+}
+
+.chat-message {
+    padding: 10px;
+    border-radius: 15px;
+    margin-bottom: 10px;
+    display: flex;
+    flex-direction: column;
+}
+
+.chat-message.user {
+    background-color: var(--primary-teal);
+    color: white;
+    border-bottom-right-radius: 5px;
+    align-self: flex-end;
+    margin-left: 50px;
+}
+
+.chat-message.bot {
+    background-color: #f0f0f0;
+    border-bottom-left-radius: 5px;
+    align-self: flex-start;
+    margin-right: 50px;
+}
+
+/* "Typing" delay for a new reply is played by the browser, not the server */
+.chat-message.bot.typing {
+    animation: chat-reply 0.3s ease-out 0.6s both;
+}
+
+@keyframes chat-reply {
+    from { opacity: 0; transform: translateY(4px); }
+    to { opacity: 1; transform: none; }
+}
+
+/* Risk level styling */
+.risk-low {
+    background-color: var(--low-risk);
+}
+
+.risk-medium {
+    background-color: var(--medium-risk);
+}
+
+.risk-high {
+    background-color: var(--high-risk);
+}
+
+.risk-header {
+    display: flex;
+    justify-content: space-between;
+    font-size: 0.8rem;
+    font-weight: 600;
+    margin-bottom: 5px;
+}
+
+.risk-bar {
+    height: 6px;
+    background-color: #e0e0e0;
+    border-radius: 3px;
+    overflow: hidden;
+}
+
+.risk-fill {
+    height: 100%;
+    border-radius: 3px;
+}
+
+/* Table styling */
+.styled-table {
+    border-collapse: collapse;
+    margin: 25px 0;
+    font-size: 0.9em;
+    width: 100%;
+}
+
+.styled-table thead tr {
+    background-color: var(--primary-blue);
+    color: white;
+    text-align: left;
+}
+
+.styled-table th,
+.styled-table td {
+    padding: 12px 15px;
+    border-bottom: 1px solid #dddddd;
+}
+
+.styled-table tbody tr {
+    border-bottom: 1px solid #dddddd;
+}
+
+.styled-table tbody tr:nth-of-type(even) {
+    background-color: #f3f3f3;
+}
+
+/* Time filter buttons */
+.time-filter-container {
+    display: flex;
+    gap: 10px;
+    margin-bottom: 15px;
+}
+
+.time-filter {
+    padding: 5px 15px;
+    border-radius: 20px;
+    background-color: #f0f0f0;
+    font-size: 0.8rem;
+    font-weight: 600;
+    cursor: pointer;
+    transition: all 0.3s ease;
+}
+
+.time-filter.active {
+    background-color: var(--primary-blue);
+    color: white;
+}
+
+/* FAQ Card Styling */
+.faq-card {
+    background-color: white;
+    border-radius: 8px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    padding: 15px;
+    margin-bottom: 10px;
+}
+
+.faq-question {
+    font-weight: 600;
+    margin-bottom: 8px;
+    color: var(--primary-blue);
+}
+
+/* Metric styling */
+.metric-container {
+    display: flex;
+    justify-content: space-between;
+    gap: 15px;
+    margin-bottom: 15px;
+}
+
+.metric {
+    text-align: center;
+    flex: 1;
+}
+
+.metric-value {
+    font-size: 1.1rem;
+    font-weight: 600;
+    color: var(--primary-blue);
+}
+
+.metric-label {
+    font-size: 0.8rem;
+    color: #666;
+}
+
+/* Positive/Negative values */
+.positive {
+    color: var(--low-risk);
+    font-weight: 600;
+}
+
+.negative {
+    color: var(--high-risk);
+    font-weight: 600;
+}
+
+/* Header styling */
+.app-header {
+    background: linear-gradient(to right, var(--primary-blue), var(--primary-teal));
+    color: white;
+    padding: 15px 20px;
+    border-radius: 8px;
+    margin-bottom: 20px;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.logo {
+    font-size: 1.5rem;
+    font-weight: 700;
+    display: flex;
+    align-items: center;
+}
+
+.logo-icon {
+    margin-right: 8px;
+}
+
+/* Make the sidebar narrower */
+[data-testid="stSidebar"][aria-expanded="true"] {
+    min-width: 200px;
+    max-width: 200px;
+}
+
+/* Hide the Streamlit branding */
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+</style>
+"""
+
+# User profile data
+user_profile = {
+    "name": "Alex Johnson",
+    "email": "alex.j@university.edu",
+    "watchlist": [
+        {"name": "Delta ETF", "ticker": "DTEF", "price": 88.45, "change": 2.4},
+        {"name": "Sigma ETF", "ticker": "SGETF", "price": 41.72, "change": -0.7},
+        {"name": "Omega ETF", "ticker": "OMGA", "price": 63.18, "change": 1.2}
+    ],
+    # Append-only history seeding the in-memory ledger when there is no ledger file
+    "transactions": [
+        {"date": "2024-03-04", "kind": "deposit", "amount": 3487.25},
+        {"date": "2024-03-05", "kind": "buy", "ticker": "ALFA", "shares": 7.3, "amount": 650.00},
+        {"date": "2024-03-05", "kind": "buy", "ticker": "IETF", "shares": 12.1, "amount": 1322.65},
+        {"date": "2024-09-15", "kind": "buy", "ticker": "IETF", "shares": 6.1, "amount": 750.00},
+        {"date": "2024-09-28", "kind": "dividend", "ticker": "ALFA", "amount": 12.75},
+        {"date": "2024-10-05", "kind": "buy", "ticker": "ALFA", "shares": 5.2, "amount": 500.00}
+    ]
+}
+
+# Latest ETF prices (€) used to value holdings
+etf_prices = {"IETF": 123.26, "EPSN": 54.10, "ALFA": 97.74, "DTEF": 88.45}
+
+# Chatbot responses
+chatbot_responses = {
+    "what is an etf": "An ETF (Exchange-Traded Fund) is an investment fund that trades on stock exchanges, much like stocks. ETFs hold assets such as stocks, bonds, or commodities, and trade at market-determined prices. They typically have higher daily liquidity and lower fees than mutual funds, making them attractive for individual investors.",
+    "what exactly is an etf": "An ETF (Exchange-Traded Fund) is an investment fund that trades on stock exchanges, much like stocks. ETFs hold assets such as stocks, bonds, or commodities, and trade at market-determined prices. They typically have higher daily liquidity and lower fees than mutual funds, making them attractive for individual investors.",
+    "how do etfs work": "ETFs work by pooling money from many investors to buy a diversified portfolio of assets. When you buy shares of an ETF, you're buying a small portion of the entire portfolio. ETFs trade throughout the day like stocks, with prices that fluctuate based on supply and demand. Most ETFs are designed to track an index, sector, commodity, or other asset but can be bought and sold like a common stock.",
+    "what are the benefits of etfs": "ETFs offer several advantages: 1) Diversification - instant exposure to many stocks or bonds, 2) Low costs - typically lower expense ratios than mutual funds, 3) Tax efficiency - generally trigger fewer capital gains, 4) Liquidity - can be bought and sold throughout the trading day, 5) Transparency - holdings are disclosed daily, and 6) Flexibility - can be used for various investment strategies including long-term investing.",
+    "what's the difference between etfs and mutual funds": "The main differences between ETFs and mutual funds are: 1) Trading - ETFs trade like stocks throughout the day while mutual funds trade once per day after market close, 2) Fees - ETFs typically have lower expense ratios, 3) Tax efficiency - ETFs are usually more tax-efficient, 4) Minimum investment - ETFs have no minimums beyond the share price, while mutual funds often require minimum investments, and 5) Management style - most ETFs are passively managed while mutual funds are often actively managed.",
+    "what are index etfs": "Index ETFs are exchange-traded funds designed to track a specific market index, such as the S&P 500 or NASDAQ. They aim to replicate the performance of their target index by holding all (or a representative sample) of the securities in the index. Index ETFs offer low-cost diversification and typically have lower expense ratios than actively managed funds because they simply follow an index rather than paying managers to select investments.",
+    "what are the risks of etfs": "The main risks of ETFs include: 1) Market risk - ETF prices fluctuate with their underlying assets, 2) Tracking error risk - some ETFs may not perfectly match their benchmark index, 3) Liquidity risk - some specialized ETFs may have lower trading volumes, 4) Concentration risk - sector or country-specific ETFs lack broad diversification, 5) Currency risk - international ETFs may be affected by exchange rate fluctuations, and 6) Trading costs - frequent buying and selling can add costs through bid-ask spreads and commissions.",
+    "how do i buy an etf": "You can buy ETFs through most brokerage accounts, including traditional brokers and online platforms. The process is similar to buying stocks: 1) Open a brokerage account if you don't have one, 2) Fund your account, 3) Research ETFs that match your investment goals, 4) Place an order using the ETF's ticker symbol, and 5) Specify the number of shares or amount you wish to invest. ETFs trade at market prices throughout the trading day, so you can buy them whenever the market is open.",
+    "what is an expense ratio": "An expense ratio is the annual fee that ETFs and mutual funds charge shareholders for managing the fund. It's expressed as a percentage of the fund's average net assets. For example, an expense ratio of 0.5% means that for every $1,000 invested, you pay $5 annually in fees. ETFs typically have lower expense ratios than mutual funds, especially passive index ETFs. The expense ratio is important because higher fees directly reduce your investment returns over time.",
+    "how are etfs taxed": "ETFs are generally more tax-efficient than mutual funds. When you hold ETFs: 1) Dividends and capital gain distributions are taxable in the year they're received, 2) When you sell ETF shares at a profit, you'll owe capital gains tax based on how long you held them (short-term or long-term rates), 3) ETFs typically generate fewer capital gain distributions than mutual funds due to their unique creation/redemption process, making them more tax-efficient for long-term investors. Tax laws vary by country, so consult a tax professional for specific advice.",
+    "what is the difference between active and passive etfs": "Passive ETFs aim to track a specific index or benchmark, while active ETFs have portfolio managers who make investment decisions to try to outperform the market. Key differences: 1) Management style - passive ETFs follow a rules-based approach while active ETFs rely on manager expertise, 2) Expense ratios - passive ETFs typically have lower fees than active ETFs, 3) Trading activity - active ETFs generally have higher turnover, 4) Performance goals - passive ETFs seek to match their benchmark's performance, while active ETFs aim to exceed it, and 5) Transparency - passive ETFs disclose holdings daily, while some active ETFs may disclose less frequently.",
+    "what are the different types of etfs": "The main types of ETFs include: 1) Stock (equity) ETFs - track stock indices, sectors, or investment strategies, 2) Bond (fixed income) ETFs - invest in government, corporate, or municipal bonds, 3) Commodity ETFs - track physical commodities like gold or oil, 4) Currency ETFs - track currency values or baskets of currencies, 5) Specialty ETFs - focus on specific themes like ESG (Environmental, Social, Governance), 6) Inverse ETFs - aim to profit from market declines, 7) Leveraged ETFs - use financial derivatives to amplify returns, and 8) International ETFs - focus on global or country-specific markets outside your home country.",
+    "are etfs good for beginners": "Yes, ETFs can be excellent investment vehicles for beginners for several reasons: 1) Instant diversification - a single ETF can give you exposure to hundreds of securities, reducing risk, 2) Low minimum investment - you can start with just the price of one share, 3) Simplicity - index ETFs are straightforward to understand compared to selecting individual stocks, 4) Low costs - many ETFs have very low expense ratios, 5) Liquidity - easy to buy and sell when needed, and 6) Variety - you can start with broad market ETFs and gradually add more specific ones as you learn. For beginners, broad-based index ETFs are often recommended as a core investment."
+}
+
+# Key phrases for questions that are not exact matches, in order of precedence
+key_phrase_matches = {
+    "what": {
+        "etf": "what is an etf",
+        "exactly": "what exactly is an etf",
+        "index": "what are index etfs",
+        "risk": "what are the risks of etfs",
+        "expense ratio": "what is an expense ratio",
+        "type": "what are the different types of etfs",
+        "different type": "what are the different types of etfs",
+        "active and passive": "what is the difference between active and passive etfs"
+    },
+    "how": {
+        "work": "how do etfs work",
+        "buy": "how do i buy an etf",
+        "purchase": "how do i buy an etf",
+        "tax": "how are etfs taxed"
+    },
+    "benefit": {
+        "": "what are the benefits of etfs"
+    },
+    "advantage": {
+        "etf": "what are the benefits of etfs"
+    },
+    "difference": {
+        "mutual fund": "what's the difference between etfs and mutual funds",
+        "active": "what is the difference between active and passive etfs",
+        "passive": "what is the difference between active and passive etfs"
+    },
+    "vs": {
+        "mutual": "what's the difference between etfs and mutual funds"
+    },
+    "beginner": {
+        "": "are etfs good for beginners"
+    },
+    "new": {
+        "investor": "are etfs good for beginners"
+    }
+}
+
+# Investor profiles shown on the Recommendations tab
+profile_info = {
+    'Novice Conservative': {
+        'description': 'You prefer stability and are cautious with your investments.',
+        'percentage': '11.8%',
+        'experience': '0-2 yrs'
+    },
+    'Novice Moderate': {
+        'description': 'You seek a balance between risk and return with limited investment experience.',
+        'percentage': '35.2%',
+        'experience': '0-2 yrs'
+    },
+    'Novice Aggressive': {
+        'description': 'You have limited experience but are willing to take calculated risks for better returns.',
+        'percentage': '27.0%',
+        'experience': '0-2 yrs'
+    },
+    'Experienced Conservative': {
+        'description': 'Despite your experience, you prefer consistent returns over high-risk opportunities.',
+        'percentage': '5.5%',
+        'experience': '3+ yrs'
+    },
+    'Experienced Moderate': {
+        'description': 'You have investment experience and prefer a balanced approach to risk and return.',
+        'percentage': '10.3%',
+        'experience': '3+ yrs'
+    },
+    'Experienced Aggressive': {
+        'description': 'You have investment experience and are comfortable with higher risk for potentially greater returns.',
+        'percentage': '10.2%',
+        'experience': '3+ yrs'
+    }
+}
+
+# FAQ cards on the Learn tab
+faqs = [
+    {"question": "What is an ETF?", "answer": "An ETF (Exchange-Traded Fund) is an investment fund that trades on stock exchanges, much like stocks. They typically have lower fees than mutual funds."},
+    {"question": "How do I choose an ETF?", "answer": "Consider your goals, risk tolerance, the sector the ETF tracks, expense ratio, liquidity, and the fund provider's reputation."},
+    {"question": "What's the difference between ETFs and mutual funds?", "answer": "ETFs trade throughout the day like stocks, while mutual funds trade once at market close. ETFs typically have lower fees and more tax efficiency."},
+    {"question": "How do ETFs work?", "answer": "ETFs work by pooling money from investors to buy a portfolio of assets. Most ETFs track an index, but some are actively managed."}
+]
+
+# Suggested questions on the Learn tab
+suggested_questions = [
+    "What exactly is an ETF?", 
+    "How do ETFs work?", 
+    "What are the benefits of ETFs?",
+    "What are the risks of ETFs?",
+    "Are ETFs good for beginners?",
+    "What is an expense ratio?"
+]
+
+# First message of every new chat
+welcome_message = {"sender": "bot", "text": "Hi there! I'm your Fintro assistant. Ask me anything about ETFs, investing, or financial concepts!"}
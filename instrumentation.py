@@ -0,0 +1,115 @@
+"""Lightweight timing spans for finding where a rerun spends its time.
+
+Set FINTRO_PROFILE=1 to enable. Each span records its duration into the
+per-process Timings (shared by every session) and, when one is passed, into
+a per-session Timings. When profiling is disabled span() returns a shared
+no-op context manager, so instrumented code pays a single attribute check.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import numpy as np
+
+ENABLED = bool(os.environ.get("FINTRO_PROFILE"))
+
+# Where exported summaries are appended, one JSON object per span and scope
+EXPORT_PATH = os.environ.get("FINTRO_PROFILE_LOG", "profile_timings.jsonl")
+
+# Percentiles are computed over the most recent samples of each span
+MAX_SAMPLES = 1024
+
+DISABLED = nullcontext()
+
+
+class Timings:
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._samples = {}
+        self._counts = {}
+        self._max = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.max_samples)
+                self._counts[name] = 0
+                self._max[name] = 0.0
+            samples.append(seconds)
+            self._counts[name] += 1
+            self._max[name] = max(self._max[name], seconds)
+
+    def summary(self):
+        # [{span, count, p50_ms, p95_ms, max_ms}], slowest p95 first
+        with self._lock:
+            snapshot = [(name, np.fromiter(samples, float, len(samples)), self._counts[name], self._max[name])
+                        for name, samples in self._samples.items()]
+        rows = []
+        for name, samples, count, longest in snapshot:
+            p50, p95 = np.percentile(samples, [50, 95])
+            rows.append({
+                "span": name,
+                "count": count,
+                "p50_ms": round(p50 * 1000, 3),
+                "p95_ms": round(p95 * 1000, 3),
+                "max_ms": round(longest * 1000, 3),
+            })
+        rows.sort(key=lambda row: row["p95_ms"], reverse=True)
+        return rows
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._max.clear()
+
+
+process_timings = Timings()
+
+
+class Span:
+    __slots__ = ("name", "session_timings", "start")
+
+    def __init__(self, name, session_timings=None):
+        self.name = name
+        self.session_timings = session_timings
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        process_timings.record(self.name, elapsed)
+        if self.session_timings is not None:
+            self.session_timings.record(self.name, elapsed)
+        return False
+
+
+def span(name, session_timings=None):
+    if not ENABLED:
+        return DISABLED
+    return Span(name, session_timings)
+
+
+def export_jsonl(path=EXPORT_PATH, session_timings=None, session_id=None):
+    # Append the current summaries; returns the number of lines written
+    exported_at = time.time()
+    scopes = [("process", None, process_timings)]
+    if session_timings is not None:
+        scopes.append(("session", session_id, session_timings))
+    lines = 0
+    with open(path, "a", encoding="utf-8") as log:
+        for scope, scope_id, timings in scopes:
+            for row in timings.summary():
+                record = {"exported_at": exported_at, "scope": scope, "pid": os.getpid(), **row}
+                if scope_id is not None:
+                    record["session"] = scope_id
+                log.write(json.dumps(record) + "\n")
+                lines += 1
+    return lines
@@ -0,0 +1,259 @@
+"""Append-only transaction ledger in SQLite, with aggregates kept up to date on insert.
+
+Every deposit, withdrawal, buy, sell and dividend is one row of
+``transactions``; rows can be added but never changed or removed. Triggers
+maintain two small tables in the same SQLite transaction as each insert:
+``totals`` (per user: transaction count, net deposits, dividends, cash) and
+``positions`` (per user and ticker: shares and average-cost basis). Reading
+the aggregates never scans the history.
+
+Recent activity is read a page at a time with keyset pagination on the
+(user, date, id) index: a page starts strictly before the (date, id) of the
+last row already shown, so every page costs the same however deep it is
+and however many transactions the user has.
+
+Without a ledger file the ledger is kept in memory and seeded from
+content.user_profile["transactions"]. Build a file with a long synthetic
+history for user 0 with:
+
+    python ledger.py data/ledger.sqlite 50000
+"""
+import datetime
+import os
+import sqlite3
+import sys
+import threading
+
+import numpy as np
+
+from catalog import load_catalog
+from portfolio import CASH_TICKER, Holdings
+
+KINDS = ("deposit", "withdrawal", "buy", "sell", "dividend")
+
+# Rows of recent activity shown per page
+PAGE_SIZE = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    kind TEXT NOT NULL CHECK (kind IN ('deposit', 'withdrawal', 'buy', 'sell', 'dividend')),
+    ticker TEXT,
+    shares REAL NOT NULL DEFAULT 0 CHECK (shares >= 0),
+    amount REAL NOT NULL CHECK (amount >= 0)
+);
+CREATE INDEX IF NOT EXISTS transactions_by_date ON transactions (user_id, date, id);
+CREATE INDEX IF NOT EXISTS transactions_by_ticker ON transactions (user_id, ticker, date);
+
+CREATE TABLE IF NOT EXISTS totals (
+    user_id INTEGER PRIMARY KEY,
+    transactions INTEGER NOT NULL,
+    deposits REAL NOT NULL,
+    dividends REAL NOT NULL,
+    cash REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS positions (
+    user_id INTEGER NOT NULL,
+    ticker TEXT NOT NULL,
+    shares REAL NOT NULL,
+    cost_basis REAL NOT NULL,
+    PRIMARY KEY (user_id, ticker)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS transactions_append_only_update BEFORE UPDATE ON transactions
+BEGIN
+    SELECT RAISE(ABORT, 'the ledger is append-only');
+END;
+
+CREATE TRIGGER IF NOT EXISTS transactions_append_only_delete BEFORE DELETE ON transactions
+BEGIN
+    SELECT RAISE(ABORT, 'the ledger is append-only');
+END;
+
+CREATE TRIGGER IF NOT EXISTS transactions_check_sell BEFORE INSERT ON transactions
+WHEN NEW.kind = 'sell'
+BEGIN
+    SELECT RAISE(ABORT, 'sell of more shares than held')
+    WHERE NEW.shares > coalesce(
+        (SELECT shares FROM positions WHERE user_id = NEW.user_id AND ticker = NEW.ticker), 0) + 1e-9;
+END;
+
+CREATE TRIGGER IF NOT EXISTS transactions_totals AFTER INSERT ON transactions
+BEGIN
+    INSERT INTO totals (user_id, transactions, deposits, dividends, cash)
+    VALUES (
+        NEW.user_id,
+        1,
+        CASE NEW.kind WHEN 'deposit' THEN NEW.amount WHEN 'withdrawal' THEN -NEW.amount ELSE 0 END,
+        CASE NEW.kind WHEN 'dividend' THEN NEW.amount ELSE 0 END,
+        CASE WHEN NEW.kind IN ('buy', 'withdrawal') THEN -NEW.amount ELSE NEW.amount END
+    )
+    ON CONFLICT (user_id) DO UPDATE SET
+        transactions = transactions + 1,
+        deposits = deposits + excluded.deposits,
+        dividends = dividends + excluded.dividends,
+        cash = cash + excluded.cash;
+END;
+
+CREATE TRIGGER IF NOT EXISTS transactions_buy AFTER INSERT ON transactions
+WHEN NEW.kind = 'buy'
+BEGIN
+    INSERT INTO positions (user_id, ticker, shares, cost_basis)
+    VALUES (NEW.user_id, NEW.ticker, NEW.shares, NEW.amount)
+    ON CONFLICT (user_id, ticker) DO UPDATE SET
+        shares = shares + excluded.shares,
+        cost_basis = cost_basis + excluded.cost_basis;
+END;
+
+-- Average cost: a sale takes its share of the cost basis with it
+CREATE TRIGGER IF NOT EXISTS transactions_sell AFTER INSERT ON transactions
+WHEN NEW.kind = 'sell'
+BEGIN
+    UPDATE positions
+    SET cost_basis = CASE WHEN shares - NEW.shares > 1e-9 THEN cost_basis * (1 - NEW.shares / shares) ELSE 0 END,
+        shares = max(shares - NEW.shares, 0)
+    WHERE user_id = NEW.user_id AND ticker = NEW.ticker;
+END;
+"""
+
+COLUMNS = ("id", "date", "kind", "ticker", "shares", "amount")
+
+
+class Ledger:
+    # One SQLite connection shared by every session; calls are serialized by
+    # a lock and each one is a single short indexed query or insert.
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+
+    @classmethod
+    def open(cls, path=":memory:"):
+        return cls(sqlite3.connect(path, check_same_thread=False))
+
+    @classmethod
+    def from_records(cls, records, user_id=0):
+        ledger = cls.open()
+        ledger.append(records, user_id)
+        return ledger
+
+    def append(self, records, user_id=0):
+        # Records have "date" (ISO), "kind", "amount" (€) and, for buys, sells
+        # and dividends, "ticker"; buys and sells also have "shares". All are
+        # added in one transaction, so a rejected record adds none of them.
+        rows = []
+        for record in records:
+            kind = record["kind"]
+            if kind not in KINDS:
+                raise ValueError(f"Unknown transaction kind {kind!r}; expected one of {', '.join(KINDS)}")
+            if kind in ("buy", "sell") and not record.get("ticker"):
+                raise ValueError(f"A {kind} needs a ticker")
+            date = datetime.date.fromisoformat(str(record["date"])).isoformat()
+            rows.append((user_id, date, kind, record.get("ticker"), record.get("shares", 0), record["amount"]))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO transactions (user_id, date, kind, ticker, shares, amount) VALUES (?, ?, ?, ?, ?, ?)",
+                rows)
+
+    def page(self, user_id=0, before=None, limit=PAGE_SIZE):
+        # Up to `limit` transactions, newest first, older than the (date, id)
+        # cursor `before`. Returns the rows and the cursor of the next page,
+        # None when there are no older transactions.
+        query = f"SELECT {', '.join(COLUMNS)} FROM transactions WHERE user_id = ?"
+        params = [user_id]
+        if before is not None:
+            query += " AND (date, id) < (?, ?)"
+            params += list(before)
+        query += " ORDER BY date DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        records = [dict(zip(COLUMNS, row)) for row in rows[:limit]]
+        cursor = (records[-1]["date"], records[-1]["id"]) if len(rows) > limit else None
+        return records, cursor
+
+    def totals(self, user_id=0):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT transactions, deposits, dividends, cash FROM totals WHERE user_id = ?", (user_id,)).fetchone()
+        transactions, deposits, dividends, cash = row or (0, 0.0, 0.0, 0.0)
+        return {"transactions": transactions, "deposits": deposits, "dividends": dividends, "cash": cash}
+
+    def positions(self, user_id=0):
+        # (ticker, shares, cost basis) of every open position, by ticker
+        with self._lock:
+            return self._connection.execute(
+                "SELECT ticker, shares, cost_basis FROM positions WHERE user_id = ? AND shares > 1e-9 ORDER BY ticker",
+                (user_id,)).fetchall()
+
+    def holdings(self, names, user_id=0):
+        # The open positions and the cash balance as Holdings; `names` maps tickers to fund names
+        records = [{"name": names.get(ticker, ticker), "ticker": ticker, "shares": shares, "costBasis": cost_basis}
+                   for ticker, shares, cost_basis in self.positions(user_id)]
+        cash = self.totals(user_id)["cash"]
+        records.append({"name": "Cash", "ticker": CASH_TICKER, "shares": cash, "costBasis": cash})
+        return Holdings.from_records(records, user_id)
+
+
+def synthetic_transactions(tickers, count, years=10, seed=0, end="2024-12-31"):
+    # `count` transactions over `years` before `end`: deposits, buys that
+    # spend most of the cash, occasional sells and dividends, at prices that
+    # vary around a fixed level per ticker
+    rng = np.random.default_rng(seed)
+    days = np.sort(rng.integers(0, years * 365, size=count))
+    start = datetime.date.fromisoformat(end) - datetime.timedelta(days=years * 365)
+    prices = dict(zip(tickers, rng.uniform(20, 150, size=len(tickers))))
+    held = dict.fromkeys(tickers, 0.0)
+    # A 2% yearly yield spread over the ~10% of transactions that are dividends
+    dividend_yield = 0.02 * years * len(tickers) / max(0.1 * count, 1)
+    cash = 0.0
+    records = []
+    for day in days:
+        date = (start + datetime.timedelta(days=int(day))).isoformat()
+        roll = rng.random()
+        ticker = tickers[rng.integers(len(tickers))]
+        price = prices[ticker] * float(np.exp(rng.normal(0, 0.1)))
+        if roll < 0.5 and cash >= price:
+            shares = round(cash * float(rng.uniform(0.3, 0.9)) / price, 3)
+            amount = round(shares * price, 2)
+            held[ticker] += shares
+            cash -= amount
+            records.append({"date": date, "kind": "buy", "ticker": ticker, "shares": shares, "amount": amount})
+        elif roll < 0.55 and held[ticker] > 0.01:
+            shares = round(held[ticker] * float(rng.uniform(0.05, 0.2)), 3)
+            amount = round(shares * price, 2)
+            held[ticker] -= shares
+            cash += amount
+            records.append({"date": date, "kind": "sell", "ticker": ticker, "shares": shares, "amount": amount})
+        elif roll < 0.65 and held[ticker] > 0.01:
+            amount = round(held[ticker] * price * dividend_yield, 2)
+            cash += amount
+            records.append({"date": date, "kind": "dividend", "ticker": ticker, "amount": amount})
+        else:
+            amount = round(float(rng.uniform(100, 1000)), 2)
+            cash += amount
+            records.append({"date": date, "kind": "deposit", "amount": amount})
+    return records
+
+
+def main(argv):
+    if len(argv) != 3:
+        print("usage: python ledger.py OUTPUT_FILE TRANSACTIONS", file=sys.stderr)
+        return 2
+    if os.path.exists(argv[1]):
+        print(f"{argv[1]} already exists; the ledger is append-only", file=sys.stderr)
+        return 1
+    records = synthetic_transactions(list(load_catalog().tickers), int(argv[2]))
+    ledger = Ledger.open(argv[1])
+    ledger.append(records)
+    print(f"Wrote {len(records)} transactions to {argv[1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
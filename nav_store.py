@@ -0,0 +1,170 @@
+"""Daily NAV history store backed by memory-mapped float arrays.
+
+A store is a directory holding ``prices.npy`` (trading days x funds, float32,
+so one date is a contiguous row), ``dates.npy`` and ``tickers.json``. Trailing
+returns, annualized return and volatility are computed for every fund at once,
+and the standard periods are cached per trading day.
+
+Build a synthetic history for the demo catalog with:
+
+    python nav_store.py data/nav
+"""
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+
+from catalog import PERIODS, load_catalog
+
+TRADING_DAYS_PER_YEAR = 252
+
+# Trailing window, in trading days, behind each period button
+PERIOD_DAYS = {"1M": 21, "3M": 63, "6M": 126, "1Y": 252, "5Y": 1260}
+
+
+class NavStore:
+    def __init__(self, tickers, dates, prices):
+        self.tickers = tuple(tickers)
+        self.dates = dates
+        self.prices = prices
+        self._positions = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._period_cache = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path):
+        with open(os.path.join(path, "tickers.json"), encoding="utf-8") as f:
+            tickers = json.load(f)
+        dates = np.load(os.path.join(path, "dates.npy"))
+        prices = np.load(os.path.join(path, "prices.npy"), mmap_mode="r")
+        if prices.shape != (len(dates), len(tickers)):
+            raise ValueError(f"NAV store {path} has prices of shape {prices.shape} "
+                             f"for {len(dates)} dates and {len(tickers)} funds")
+        return cls(tickers, dates, prices)
+
+    @staticmethod
+    def write(path, tickers, dates, prices):
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "tickers.json"), "w", encoding="utf-8") as f:
+            json.dump(list(tickers), f)
+        np.save(os.path.join(path, "dates.npy"), np.asarray(dates, dtype="datetime64[D]"))
+        np.save(os.path.join(path, "prices.npy"), np.asarray(prices, dtype=np.float32))
+
+    @staticmethod
+    def append(path, dates, prices):
+        # Adds trading days after the last one of the store at `path`. Each
+        # file is replaced whole through a temporary file, so readers never see
+        # a partly written array; a running app picks the days up on its next
+        # reload and merges them into the tracked covariance.
+        store = NavStore.open(path)
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        prices = np.asarray(prices, dtype=np.float32)
+        if prices.shape != (len(dates), len(store)):
+            raise ValueError(f"Expected prices of shape ({len(dates)}, {len(store)}), got {prices.shape}")
+        if len(dates) and (dates[0] <= store.dates[-1] or (np.diff(dates) <= np.timedelta64(0, "D")).any()):
+            raise ValueError(f"Appended dates must be increasing and after {store.dates[-1]}")
+        for name, values in (("prices.npy", np.concatenate([store.prices, prices])),
+                             ("dates.npy", np.concatenate([store.dates, dates]))):
+            temporary = os.path.join(path, f".{name}.tmp")
+            with open(temporary, "wb") as f:
+                np.save(f, values)
+            os.replace(temporary, os.path.join(path, name))
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def index_of(self, tickers):
+        # Column of each ticker in the store, -1 where it has no history
+        return np.array([self._positions.get(ticker, -1) for ticker in tickers], dtype=np.int64)
+
+    def _end(self, as_of):
+        if as_of is None:
+            return len(self.dates) - 1
+        return int(np.searchsorted(self.dates, np.datetime64(as_of, "D"), side="right")) - 1
+
+    def trailing_returns(self, days, as_of=None):
+        # Percentage return over the last `days` trading days; NaN without enough history
+        end = self._end(as_of)
+        if end - days < 0:
+            return np.full(len(self), np.nan)
+        latest = self.prices[end].astype(np.float64)
+        start = self.prices[end - days].astype(np.float64)
+        return (latest / start - 1.0) * 100
+
+    def annualized_return(self, days=PERIOD_DAYS["5Y"], as_of=None):
+        # Compound annual growth over the window, shortened to the available history
+        end = self._end(as_of)
+        days = min(days, end)
+        if days <= 0:
+            return np.full(len(self), np.nan)
+        growth = self.prices[end].astype(np.float64) / self.prices[end - days].astype(np.float64)
+        return (growth ** (TRADING_DAYS_PER_YEAR / days) - 1.0) * 100
+
+    def volatility(self, days=TRADING_DAYS_PER_YEAR, as_of=None):
+        # Annualized standard deviation of daily log returns, in percent
+        end = self._end(as_of)
+        window = np.asarray(self.prices[max(0, end - days):end + 1], dtype=np.float64)
+        if len(window) < 3:
+            return np.full(len(self), np.nan)
+        daily = np.diff(np.log(window), axis=0)
+        return np.nanstd(daily, axis=0, ddof=1) * np.sqrt(TRADING_DAYS_PER_YEAR) * 100
+
+    def period_returns(self, as_of=None):
+        # funds x PERIODS matrix, computed once per trading day
+        end = self._end(as_of)
+        key = self.dates[end].item() if end >= 0 else None
+        with self._lock:
+            cached = self._period_cache.get(key)
+        if cached is not None:
+            return cached
+        matrix = np.column_stack([self.trailing_returns(PERIOD_DAYS[period], as_of) for period in PERIODS])
+        matrix.flags.writeable = False
+        with self._lock:
+            self._period_cache = {key: matrix}
+        return matrix
+
+
+def synthetic_history(annual_return, volatility, days=PERIOD_DAYS["5Y"] + 1, seed=0, end=None):
+    # Geometric Brownian motion paths matching each fund's return and volatility
+    rng = np.random.default_rng(seed)
+    annual_return = np.asarray(annual_return, dtype=np.float64) / 100
+    volatility = np.asarray(volatility, dtype=np.float64) / 100
+    drift = np.log1p(annual_return) / TRADING_DAYS_PER_YEAR
+    sigma = volatility / np.sqrt(TRADING_DAYS_PER_YEAR)
+    shocks = rng.standard_normal((days - 1, len(annual_return))) * sigma + drift - sigma ** 2 / 2
+    log_prices = np.vstack([np.zeros(len(annual_return)), np.cumsum(shocks, axis=0)])
+    prices = 100.0 * np.exp(log_prices)
+    end = np.datetime64(end or "today", "D")
+    dates = np.busday_offset(end, -np.arange(days)[::-1], roll="backward")
+    return dates, prices
+
+
+def main(argv):
+    if len(argv) == 4 and argv[2] == "--append":
+        return append_days(argv[1], int(argv[3]))
+    if len(argv) != 2:
+        print("usage: python nav_store.py OUTPUT_DIR [--append DAYS]", file=sys.stderr)
+        return 2
+    catalog = load_catalog()
+    dates, prices = synthetic_history(catalog.annual_return, catalog.volatility)
+    NavStore.write(argv[1], catalog.tickers, dates, prices)
+    print(f"Wrote {prices.shape[0]} days x {prices.shape[1]} funds to {argv[1]}")
+    return 0
+
+
+def append_days(path, days):
+    # Continues every fund of the store at `path` with `days` synthetic trading
+    # days at its historical return and volatility
+    store = NavStore.open(path)
+    _, growth = synthetic_history(store.annualized_return(), store.volatility(), days + 1, seed=len(store.dates))
+    prices = store.prices[-1].astype(np.float64) * growth[1:] / 100
+    dates = np.busday_offset(store.dates[-1], np.arange(1, days + 1), roll="forward")
+    NavStore.append(path, dates, prices)
+    print(f"Appended {days} days to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
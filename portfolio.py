@@ -0,0 +1,94 @@
+"""Numeric holdings and vectorized portfolio valuation.
+
+Positions of any number of portfolios live in one set of flat arrays tagged
+with a portfolio id, so valuing every user's portfolio is a single pass of
+array arithmetic and np.bincount reductions. Formatting happens only when the
+results are rendered.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+# Cash is held as a position in this pseudo-ticker at a constant price of 1
+CASH_TICKER = "-"
+
+
+@dataclass(frozen=True)
+class Holdings:
+    portfolio_ids: np.ndarray
+    names: np.ndarray
+    tickers: np.ndarray
+    shares: np.ndarray
+    # Total amount paid for each position, not per share
+    cost_basis: np.ndarray
+
+    def __post_init__(self):
+        # Holdings are shared between sessions, so the arrays are read-only
+        for field in ("portfolio_ids", "names", "tickers", "shares", "cost_basis"):
+            getattr(self, field).flags.writeable = False
+
+    @classmethod
+    def from_records(cls, records, portfolio_id=0):
+        return cls(
+            portfolio_ids=np.full(len(records), portfolio_id, dtype=np.int64),
+            names=np.array([record["name"] for record in records], dtype=object),
+            tickers=np.array([record["ticker"] for record in records], dtype=object),
+            shares=np.array([record["shares"] for record in records], dtype=np.float64),
+            cost_basis=np.array([record["costBasis"] for record in records], dtype=np.float64),
+        )
+
+    @classmethod
+    def concat(cls, holdings):
+        return cls(*(np.concatenate([getattr(h, field) for h in holdings])
+                     for field in ("portfolio_ids", "names", "tickers", "shares", "cost_basis")))
+
+    def __len__(self):
+        return len(self.shares)
+
+    @property
+    def is_cash(self):
+        return self.tickers == CASH_TICKER
+
+    def prices_from(self, price_table):
+        # Price of every position from a ticker -> price mapping; NaN when unknown
+        return np.array([1.0 if ticker == CASH_TICKER else price_table.get(ticker, np.nan)
+                         for ticker in self.tickers], dtype=np.float64)
+
+
+@dataclass(frozen=True)
+class Valuation:
+    # Per position
+    values: np.ndarray
+    allocations: np.ndarray
+    # Per portfolio
+    portfolio_value: np.ndarray
+    total_invested: np.ndarray
+    total_return: np.ndarray
+    total_return_pct: np.ndarray
+    funds_owned: np.ndarray
+
+
+def value_holdings(holdings, prices, portfolio_count=None):
+    if portfolio_count is None:
+        portfolio_count = int(holdings.portfolio_ids.max()) + 1 if len(holdings) else 0
+    ids = holdings.portfolio_ids
+    values = holdings.shares * prices
+    portfolio_value = np.bincount(ids, weights=values, minlength=portfolio_count)
+    total_invested = np.bincount(ids, weights=holdings.cost_basis, minlength=portfolio_count)
+    total_return = portfolio_value - total_invested
+    with np.errstate(divide="ignore", invalid="ignore"):
+        allocations = np.where(portfolio_value[ids] > 0, values / portfolio_value[ids] * 100, 0.0)
+        total_return_pct = np.where(total_invested > 0, total_return / total_invested * 100, 0.0)
+    funds_owned = np.bincount(ids, weights=(~holdings.is_cash & (holdings.shares > 0)).astype(np.float64),
+                              minlength=portfolio_count).astype(np.int64)
+    return Valuation(values, allocations, portfolio_value, total_invested, total_return,
+                     total_return_pct, funds_owned)
+
+
+def format_eur(amount):
+    sign = "-" if amount < 0 else ""
+    return f"{sign}€{abs(amount):,.2f}"
+
+
+def format_pct(value, decimals=1):
+    return f"{value:.{decimals}f}%"
@@ -0,0 +1,137 @@
+"""Monte Carlo projection of what an investment in a fund or mix could grow to.
+
+Each fund's log return over a step is normal, with the drift implied by its
+expected annual return and the covariance of the risk model, so funds move
+together as they have historically. Steps are at most a month and a horizon
+has at most MAX_STEPS of them; as the returns are exact at any step length,
+the steps only set how many points the bands have. A mix is bought once and
+held: the value of a path is the amount times the weighted sum of every
+fund's growth.
+
+Paths are simulated in chunks whose size is set by a memory budget, and each
+chunk only adds to a fixed histogram of log growth per step, so memory does
+not grow with the number of paths. Draws are used in antithetic pairs.
+Percentile bands are read from the merged histograms. A seeded generator
+makes every projection reproducible, and ProjectionCache keeps finished
+bands per (funds, weights, horizon).
+"""
+import numpy as np
+
+from lru import LRUCache
+from nav_store import PERIOD_DAYS
+
+DEFAULT_PATHS = 100_000
+DEFAULT_SEED = 0
+PERCENTILES = (5, 50, 95)
+
+# Months in each period; a horizon is simulated in at most MAX_STEPS equal steps
+STEP_DAYS = 21
+HORIZON_MONTHS = {period: max(1, days // STEP_DAYS) for period, days in PERIOD_DAYS.items()}
+MAX_STEPS = 20
+
+# Bytes of float32 shocks (paths x steps x funds) drawn at a time
+CHUNK_BYTES = 16 * 2 ** 20
+
+# Histogram bins of log growth per step, spanning 8 standard deviations either side
+BINS = 4096
+BIN_SPAN = 8
+
+
+def covariance_root(covariance):
+    # R with R R' = covariance; eigh also copes with covariances that are only semi-definite
+    values, vectors = np.linalg.eigh(np.asarray(covariance, dtype=np.float64))
+    return vectors * np.sqrt(np.maximum(values, 0))
+
+
+def horizon_steps(horizon):
+    # (years, steps) simulated for a period
+    months = HORIZON_MONTHS[horizon]
+    return months / 12, min(months, MAX_STEPS)
+
+
+def simulate_bands(expected_returns, covariance, weights, amount, years, steps,
+                   paths=DEFAULT_PATHS, seed=DEFAULT_SEED, percentiles=PERCENTILES):
+    # Value of the mix at each percentile after each of `steps` equal steps
+    # over `years`, starting from the amount: (percentiles x steps + 1)
+    expected_returns = np.asarray(expected_returns, dtype=np.float64) / 100
+    covariance = np.asarray(covariance, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    weights = (weights / weights.sum()).astype(np.float32)
+    fund_count = len(weights)
+
+    step = years / steps
+    volatility = np.sqrt(np.diag(covariance))
+    drift = (np.log1p(expected_returns) - volatility ** 2 / 2) * step
+    root = (covariance_root(covariance) * np.sqrt(step)).astype(np.float32).T
+
+    # Every path's log growth lies between its funds' lowest and highest
+    elapsed = np.arange(1, steps + 1)[:, None]
+    low = (drift * elapsed - BIN_SPAN * volatility * np.sqrt(elapsed * step)).min(axis=1)
+    high = (drift * elapsed + BIN_SPAN * volatility * np.sqrt(elapsed * step)).max(axis=1)
+    width = np.maximum(high - low, 1e-12) / BINS
+    offsets = np.arange(steps) * BINS
+    counts = np.zeros(steps * BINS, dtype=np.int64)
+
+    rng = np.random.default_rng(seed)
+    chunk = max(2, CHUNK_BYTES // (4 * steps * fund_count))
+    shocks = np.empty((chunk, steps, fund_count), dtype=np.float32)
+    for start in range(0, paths, chunk):
+        size = min(chunk, paths - start)
+        # Antithetic pairs: every draw is used once as is and once negated
+        half = (size + 1) // 2
+        rng.standard_normal((half, steps, fund_count), dtype=np.float32, out=shocks[:half])
+        np.negative(shocks[:size - half], out=shocks[half:size])
+        log_growth = (shocks[:size].reshape(-1, fund_count) @ root).reshape(size, steps, fund_count)
+        log_growth += drift.astype(np.float32)
+        np.cumsum(log_growth, axis=1, out=log_growth)
+        np.exp(log_growth, out=log_growth)
+        mix = np.log((log_growth.reshape(-1, fund_count) @ weights).reshape(size, steps))
+        bins = np.clip(((mix - low) / width).astype(np.int64), 0, BINS - 1)
+        counts += np.bincount((bins + offsets).ravel(), minlength=steps * BINS)
+
+    # Percentiles by linear interpolation within the bin that crosses each rank
+    counts = counts.reshape(steps, BINS)
+    cumulative = np.cumsum(counts, axis=1)
+    bands = np.empty((len(percentiles), steps + 1))
+    bands[:, 0] = amount
+    for row, percentile in enumerate(percentiles):
+        rank = percentile / 100 * paths
+        crossing = np.minimum((cumulative < rank).sum(axis=1), BINS - 1)
+        below = np.take_along_axis(cumulative - counts, crossing[:, None], axis=1)[:, 0]
+        inside = np.take_along_axis(counts, crossing[:, None], axis=1)[:, 0]
+        share = np.clip((rank - below) / np.maximum(inside, 1), 0, 1)
+        bands[row, 1:] = amount * np.exp(low + (crossing + share) * width)
+    return bands
+
+
+class ProjectionCache:
+    # Process-wide LRU of simulate_bands() results for one registry's catalog
+    # and risk model, keyed on the funds, weights and horizon. The bands are
+    # simulated for an amount of 1 and scaled on lookup, as every path's
+    # value is proportional to the amount invested.
+
+    def __init__(self, catalog, risk_model, paths=DEFAULT_PATHS, seed=DEFAULT_SEED, max_entries=256):
+        self.catalog = catalog
+        self.risk_model = risk_model
+        self.paths = paths
+        self.seed = seed
+        self._bands = LRUCache(max_entries)
+
+    def project(self, indices, weights, amount, horizon):
+        # Percentile bands (PERCENTILES x horizon_steps() + 1) of `amount`
+        # invested in the catalog funds at `indices` with `weights`, over the
+        # period `horizon`
+        indices = np.asarray(indices, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        key = (tuple(indices.tolist()), tuple(np.round(weights / weights.sum(), 6).tolist()), horizon)
+        growth = self._bands.get(key)
+        if growth is None:
+            years, steps = horizon_steps(horizon)
+            growth = simulate_bands(self.catalog.annual_return[indices], self.risk_model.covariance(indices),
+                                    weights, 1.0, years, steps, self.paths, self.seed)
+            growth.flags.writeable = False
+            self._bands.put(key, growth)
+        return growth * amount
+
+    def stats(self):
+        return self._bands.stats()
@@ -0,0 +1,168 @@
+"""Live quotes for the watchlist: a shared in-memory table fed by a background thread.
+
+QuoteTable holds the latest price and change of every ticker in flat arrays
+and a version number that each published batch of ticks increments. A
+QuoteFeed runs in a daemon thread and publishes into the table;
+SimulatedFeed is the local publisher used for the demo and in tests, moving
+prices by random log-normal ticks.
+
+QuoteTable.updates() waits on the table until the version moves and yields
+at most one snapshot per refresh interval, always the latest, so ticks that
+arrive in between are coalesced into a single redraw. SharedFeed keeps a
+single feed thread per process.
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+# Seconds between simulated ticks
+TICK_INTERVAL = 0.2
+
+# Annualized volatility of simulated prices, and seconds in a trading year
+SIMULATED_VOLATILITY = 0.2
+TRADING_SECONDS_PER_YEAR = 252 * 6.5 * 3600
+
+
+@dataclass(frozen=True)
+class QuoteSnapshot:
+    version: int
+    tickers: tuple
+    prices: np.ndarray
+    # Percent change against the reference (previous close) price
+    changes: np.ndarray
+    updated_at: float
+
+
+class QuoteTable:
+    def __init__(self, tickers, prices, changes):
+        # Prices are the latest quotes; changes (%) are against the previous close
+        self.tickers = tuple(tickers)
+        self._positions = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._prices = np.array(prices, dtype=np.float64)
+        self._references = self._prices / (1 + np.asarray(changes, dtype=np.float64) / 100)
+        self.version = 0
+        self.ticks = 0
+        self.updated_at = time.time()
+        self._changed = threading.Condition()
+
+    @classmethod
+    def from_records(cls, records):
+        # Watchlist rows with "ticker", "price" and "change" (%)
+        return cls([row["ticker"] for row in records], [row["price"] for row in records],
+                   [row["change"] for row in records])
+
+    def publish(self, ticks):
+        # {ticker: price}; tickers outside the table are ignored
+        with self._changed:
+            for ticker, price in ticks.items():
+                position = self._positions.get(ticker)
+                if position is not None:
+                    self._prices[position] = price
+                    self.ticks += 1
+            self.version += 1
+            self.updated_at = time.time()
+            self._changed.notify_all()
+
+    def snapshot(self):
+        with self._changed:
+            return self._snapshot()
+
+    def _snapshot(self):
+        prices = self._prices.copy()
+        changes = (prices / self._references - 1) * 100
+        for array in (prices, changes):
+            array.flags.writeable = False
+        return QuoteSnapshot(self.version, self.tickers, prices, changes, self.updated_at)
+
+    def updates(self, refresh_interval, duration, since=0, stopped=None, poll=0.1, heartbeat=2.0):
+        # Snapshots newer than version `since`, at most one per refresh_interval,
+        # for `duration` seconds or until stopped() returns True, which is
+        # checked every `poll` seconds. When nothing changes for `heartbeat`
+        # seconds the current snapshot is yielded again.
+        start = time.monotonic()
+        deadline = start + duration
+        version = since
+        last_frame = start - refresh_interval
+        while True:
+            now = time.monotonic()
+            if now >= deadline or (stopped is not None and stopped()):
+                return
+            with self._changed:
+                changed = self.version != version
+                # Ticks that arrive before the next frame is due are picked up
+                # together by that frame
+                due = last_frame + refresh_interval if changed else last_frame + heartbeat
+                if now < due:
+                    self._changed.wait(min(poll, due - now, deadline - now))
+                    continue
+                snapshot = self._snapshot()
+            version = snapshot.version
+            last_frame = time.monotonic()
+            yield snapshot
+
+
+class QuoteFeed:
+    # Publishes ticks into a QuoteTable from a daemon thread. Subclasses
+    # implement next_ticks(), which returns {ticker: price} or an empty dict.
+
+    def __init__(self, table, interval):
+        self.table = table
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"{type(self).__name__}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            ticks = self.next_ticks()
+            if ticks:
+                self.table.publish(ticks)
+
+    def next_ticks(self):
+        raise NotImplementedError
+
+
+class SimulatedFeed(QuoteFeed):
+    # Local publisher: each tick moves a random subset of tickers by a
+    # log-normal step scaled to the tick interval
+    def __init__(self, table, interval=TICK_INTERVAL, volatility=SIMULATED_VOLATILITY, seed=None):
+        super().__init__(table, interval)
+        self._rng = np.random.default_rng(seed)
+        self._sigma = volatility * np.sqrt(interval / TRADING_SECONDS_PER_YEAR)
+        self._prices = table.snapshot().prices.copy()
+
+    def next_ticks(self):
+        moved = self._rng.random(len(self._prices)) < 0.5
+        self._prices[moved] *= np.exp(self._rng.standard_normal(moved.sum()) * self._sigma)
+        return {self.table.tickers[i]: float(self._prices[i]) for i in np.flatnonzero(moved)}
+
+
+class SharedFeed:
+    # The process's one running feed. Asking for a different watchlist starts
+    # a feed for it and stops the previous one, so reloading the content does
+    # not leave feed threads behind.
+    def __init__(self, feed_type=SimulatedFeed):
+        self._feed_type = feed_type
+        self._watchlist = None
+        self._feed = None
+        self._lock = threading.Lock()
+
+    def table(self, watchlist):
+        # `watchlist` is a hashable sequence of rows for QuoteTable.from_records
+        with self._lock:
+            if self._feed is None or watchlist != self._watchlist:
+                if self._feed is not None:
+                    self._feed.stop()
+                self._feed = self._feed_type(QuoteTable.from_records(watchlist)).start()
+                self._watchlist = watchlist
+            return self._feed.table
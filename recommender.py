@@ -0,0 +1,277 @@
+"""Vectorized ETF recommendations over an ETFCatalog.
+
+The risk-tolerance rules are applied as boolean masks over the catalog columns
+and only the top-k funds are selected, instead of filtering and fully sorting
+a list of dicts on every interaction.
+
+Funds are ranked by match_scores(), which scores every fund against the
+user's risk tolerance and investment amount. The kernel broadcasts users
+against funds, so the same code scores one user or a batch of users (a
+users x funds matrix) without Python loops.
+"""
+import math
+
+import numpy as np
+
+from lru import LRUCache
+
+DEFAULT_TOP_K = 20
+
+# Same granularity as the investment amount input's step
+INVESTMENT_BUCKET = 100
+
+# Largest users x funds score matrix recommend_batch() builds at once (float32 cells)
+SCORE_BLOCK_CELLS = 16_000_000
+
+# Fixed weights of the match score components
+RISK_WEIGHT = 0.35
+VOLATILITY_WEIGHT = 0.15
+CATEGORY_WEIGHT = 0.2
+# (base, extra at the top of the range): returns matter more to risk-tolerant
+# users, costs more to users investing larger amounts
+RETURN_WEIGHT = (0.1, 0.1)
+COST_WEIGHT = (0.1, 0.1)
+
+# Volatility (%) that fits risk tolerance r is VOLATILITY_TARGET[0] + r * VOLATILITY_TARGET[1];
+# the fit falls to zero VOLATILITY_TOLERANCE points away from it
+VOLATILITY_TARGET = (3.0, 1.5)
+VOLATILITY_TOLERANCE = 10.0
+# Expense ratio (%) scored as worst, and annual return (%) scored as best
+MAX_EXPENSE_RATIO = 1.0
+RETURN_SCALE = 15.0
+# Ranges of the risk tolerance slider and the investment amount input (EUR)
+RISK_RANGE = (1, 10)
+INVESTMENT_RANGE = (100, 10000)
+
+
+def investment_bucket(investment_amount):
+    # Rounded up so that "> 3000" stays exact at bucket boundaries
+    return math.ceil(investment_amount / INVESTMENT_BUCKET)
+
+
+def investor_profile(risk_tolerance, investment_amount):
+    experience = "Experienced" if investment_amount > 3000 else "Novice"
+    if risk_tolerance <= 4:
+        return f"{experience} Conservative"
+    if risk_tolerance <= 7:
+        return f"{experience} Moderate"
+    return f"{experience} Aggressive"
+
+
+def investor_profiles(risk_tolerances, investment_amounts):
+    # investor_profile() for arrays of users
+    risk_tolerances = np.asarray(risk_tolerances)
+    experience = np.where(np.asarray(investment_amounts) > 3000, "Experienced", "Novice")
+    appetite = np.select([risk_tolerances <= 4, risk_tolerances <= 7], ["Conservative", "Moderate"], "Aggressive")
+    return np.char.add(np.char.add(experience, " "), appetite)
+
+
+def eligible_mask(catalog, risk_tolerance):
+    if risk_tolerance < 4:
+        # Conservative investors prefer bonds and lower volatility
+        return (catalog.category_codes == catalog.category_code("Bond")) | (catalog.risk_level < 6)
+    if risk_tolerance > 7:
+        # Aggressive investors prefer higher return potential
+        return catalog.annual_return > 5
+    return np.ones(len(catalog), dtype=bool)
+
+
+def category_affinity(category_names, risk):
+    # users x categories, for risk tolerance normalized to [0, 1]
+    affinity = np.full((len(risk), len(category_names)), 0.5, dtype=np.float32)
+    for code, name in enumerate(category_names):
+        if name == "Bond":
+            affinity[:, code] = 1 - risk[:, 0]
+        elif name == "Equity":
+            affinity[:, code] = risk[:, 0]
+        elif name == "Mixed":
+            affinity[:, code] = 1 - np.abs(risk[:, 0] - 0.5) * 2
+    return affinity
+
+
+def match_scores(catalog, risk_tolerance, investment_amount):
+    # Match score (0-100) of every fund. Scalar inputs give one score per fund;
+    # arrays of users give a users x funds float32 matrix.
+    batch = np.ndim(risk_tolerance) > 0
+    risk_tolerance = np.asarray(risk_tolerance, dtype=np.float32).reshape(-1)
+    investment_amount = np.asarray(investment_amount, dtype=np.float32).reshape(-1, 1)
+    experience = np.clip((investment_amount - INVESTMENT_RANGE[0]) / (INVESTMENT_RANGE[1] - INVESTMENT_RANGE[0]), 0, 1)
+
+    # Everything except the cost term depends on the user only through the
+    # risk tolerance, which takes few distinct values in any cohort
+    tolerances, user_tolerance = np.unique(risk_tolerance, return_inverse=True)
+    tolerances = tolerances.reshape(-1, 1)
+    risk = (tolerances - 1) / 9
+    volatility_target = VOLATILITY_TARGET[0] + VOLATILITY_TARGET[1] * tolerances
+    risk_fit = 1 - np.abs(catalog.risk_level.astype(np.float32) - tolerances) / 9
+    volatility_fit = np.clip(1 - np.abs(catalog.volatility.astype(np.float32) - volatility_target) / VOLATILITY_TOLERANCE, 0, 1)
+    return_fit = np.clip(catalog.annual_return.astype(np.float32) / RETURN_SCALE, 0, 1)
+    return_weight = RETURN_WEIGHT[0] + RETURN_WEIGHT[1] * risk
+    tolerance_terms = (RISK_WEIGHT * risk_fit + VOLATILITY_WEIGHT * volatility_fit
+                       + CATEGORY_WEIGHT * category_affinity(catalog.category_names, risk)[:, catalog.category_codes]
+                       + return_weight * return_fit)
+
+    cost_fit = np.clip(1 - catalog.expense_ratio.astype(np.float32) / MAX_EXPENSE_RATIO, 0, 1)
+    cost_weight = COST_WEIGHT[0] + COST_WEIGHT[1] * experience
+    total_weight = RISK_WEIGHT + VOLATILITY_WEIGHT + CATEGORY_WEIGHT + return_weight[user_tolerance] + cost_weight
+
+    # users x funds: one gather plus in-place updates
+    scores = tolerance_terms[user_tolerance]
+    scores += cost_weight * cost_fit
+    scores *= 100 / total_weight
+    return scores if batch else scores[0]
+
+
+def top_k(scores, mask, k):
+    # Indices of the k best eligible scores, highest first. Ties keep catalog
+    # order, exactly as a stable full sort would.
+    candidates = np.flatnonzero(mask)
+    candidate_scores = scores[candidates]
+    if len(candidates) > k:
+        threshold = np.partition(candidate_scores, len(candidates) - k)[len(candidates) - k]
+        above = candidates[candidate_scores > threshold]
+        tied = candidates[candidate_scores == threshold][:k - len(above)]
+        candidates = np.concatenate([above, tied])
+        candidate_scores = scores[candidates]
+    order = np.lexsort((candidates, -candidate_scores))
+    return candidates[order]
+
+
+def top_k_rows(scores, candidates, k):
+    # top_k() for every row of a users x funds matrix restricted to the same
+    # candidate funds: users x min(k, candidates) indices, best first, ties in
+    # catalog order
+    candidate_scores = scores[:, candidates]
+    count = len(candidates)
+    if count > k:
+        threshold = np.partition(candidate_scores, count - k, axis=1)[:, count - k, None]
+        above = candidate_scores > threshold
+        tied = candidate_scores == threshold
+        keep = above | tied
+        # Where more funds tie at the threshold than fit, keep the first ones in catalog order
+        room = k - above.sum(axis=1, keepdims=True)
+        crowded = np.flatnonzero(tied.sum(axis=1, keepdims=True) > room)
+        if len(crowded):
+            keep[crowded] = above[crowded] | (tied[crowded] & (np.cumsum(tied[crowded], axis=1) <= room[crowded]))
+        positions = np.nonzero(keep)[1].reshape(len(scores), k)
+    else:
+        positions = np.broadcast_to(np.arange(count), (len(scores), count))
+    selected_scores = np.take_along_axis(candidate_scores, positions, axis=1)
+    order = np.argsort(-selected_scores, axis=1, kind="stable")
+    return candidates[np.take_along_axis(positions, order, axis=1)]
+
+
+def recommend(catalog, risk_tolerance, investment_amount, k=DEFAULT_TOP_K):
+    # (fund indices best first, their match scores, investor profile)
+    mask = eligible_mask(catalog, risk_tolerance)
+    scores = match_scores(catalog, risk_tolerance, investment_amount)
+    indices = top_k(scores, mask, k)
+    return indices, scores[indices], investor_profile(risk_tolerance, investment_amount)
+
+
+def recommend_batch(catalog, risk_tolerances, investment_amounts, k=DEFAULT_TOP_K):
+    # recommend() for many users: (users x k fund indices padded with -1,
+    # users x k scores padded with NaN, profiles). Amounts are rounded up to
+    # their investment_bucket() as in the app, and each distinct (tolerance,
+    # bucket) pair is ranked once, in blocks that keep the pairs x funds score
+    # matrix within SCORE_BLOCK_CELLS.
+    risk_tolerances = np.asarray(risk_tolerances)
+    buckets = np.ceil(np.asarray(investment_amounts, dtype=np.float64) / INVESTMENT_BUCKET)
+    investment_amounts = buckets * INVESTMENT_BUCKET
+    pairs, user_pair = np.unique(np.column_stack([risk_tolerances, investment_amounts]), axis=0, return_inverse=True)
+    user_pair = user_pair.reshape(-1)
+    pair_risk = pairs[:, 0]
+    pair_amount = pairs[:, 1]
+    indices = np.full((len(pairs), k), -1, dtype=np.int64)
+    scores = np.full((len(pairs), k), np.nan, dtype=np.float32)
+
+    # The eligibility rules only distinguish three tolerance bands
+    bands = np.select([pair_risk < 4, pair_risk > 7], [0, 2], 1)
+    candidates = {}
+    for band in np.unique(bands).tolist():
+        representative = pair_risk[np.argmax(bands == band)]
+        candidates[band] = np.flatnonzero(eligible_mask(catalog, representative))
+
+    block = max(1, SCORE_BLOCK_CELLS // max(1, len(catalog)))
+    for start in range(0, len(pairs), block):
+        stop = min(start + block, len(pairs))
+        block_scores = match_scores(catalog, pair_risk[start:stop], pair_amount[start:stop])
+        for band, band_candidates in candidates.items():
+            rows = np.flatnonzero(bands[start:stop] == band)
+            if not len(rows):
+                continue
+            best = top_k_rows(block_scores[rows], band_candidates, k)
+            indices[start + rows, :best.shape[1]] = best
+            scores[start + rows, :best.shape[1]] = np.take_along_axis(block_scores[rows], best, axis=1)
+    return indices[user_pair], scores[user_pair], investor_profiles(risk_tolerances, investment_amounts)
+
+
+def recommendation_records(catalog, indices, scores):
+    # Card data for recommended funds, showing the user's score rather than the file's
+    return [
+        {**etf, "matchScore": int(round(score))}
+        for etf, score in zip(catalog.records(indices), np.asarray(scores).tolist())
+    ]
+
+
+class Recommender:
+    # Recommendations for one catalog. The Recommendations tab's whole input
+    # space (RISK_RANGE x amount buckets over INVESTMENT_RANGE) is materialized
+    # when the recommender is built, so recommend() is an array lookup; inputs
+    # outside the grid are computed on demand and memoized in a locked LRU.
+
+    def __init__(self, catalog, k=DEFAULT_TOP_K, max_entries=1024):
+        self.catalog = catalog
+        self.k = k
+        # Lookups answered from the precomputed table; the rest go through the LRU
+        self.table_hits = 0
+        self._cache = LRUCache(max_entries)
+        self._build_table()
+
+    def _build_table(self):
+        tolerances = np.arange(RISK_RANGE[0], RISK_RANGE[1] + 1)
+        self._first_bucket = investment_bucket(INVESTMENT_RANGE[0])
+        buckets = np.arange(self._first_bucket, investment_bucket(INVESTMENT_RANGE[1]) + 1)
+        grid_risk, grid_bucket = np.meshgrid(tolerances, buckets, indexing="ij")
+        indices, scores, profiles = recommend_batch(
+            self.catalog, grid_risk.ravel(), grid_bucket.ravel() * INVESTMENT_BUCKET, self.k
+        )
+        shape = (len(tolerances), len(buckets))
+        self._counts = _frozen_table((indices >= 0).sum(axis=1).reshape(shape))
+        self._indices = _frozen_table(indices.reshape(shape + (self.k,)))
+        self._scores = _frozen_table(scores.reshape(shape + (self.k,)))
+        self._profiles = profiles.reshape(shape).tolist()
+
+    def recommend(self, risk_tolerance, investment_amount):
+        # (fund indices best first, their match scores, investor profile)
+        bucket = investment_bucket(investment_amount)
+        row = risk_tolerance - RISK_RANGE[0]
+        column = bucket - self._first_bucket
+        if (risk_tolerance == int(risk_tolerance) and 0 <= row < self._indices.shape[0]
+                and 0 <= column < self._indices.shape[1]):
+            self.table_hits += 1
+            count = self._counts[row, column]
+            return (self._indices[row, column, :count], self._scores[row, column, :count],
+                    self._profiles[row][column])
+
+        key = (risk_tolerance, bucket)
+        result = self._cache.get(key)
+        if result is None:
+            indices, scores, profile = recommend(self.catalog, risk_tolerance, bucket * INVESTMENT_BUCKET, self.k)
+            indices.flags.writeable = False
+            scores.flags.writeable = False
+            result = (indices, scores, profile)
+            self._cache.put(key, result)
+        return result
+
+    def stats(self):
+        stats = self._cache.stats()
+        hits = stats["hits"] + self.table_hits
+        lookups = hits + stats["misses"]
+        return {**stats, "hits": hits, "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "table_hits": self.table_hits}
+
+
+def _frozen_table(values):
+    values.flags.writeable = False
+    return values
@@ -0,0 +1,223 @@
+"""Process-wide, read-only registry of everything that does not depend on user input.
+
+build_registry() loads the ETF catalog, the static content and the structures
+derived from them (recommender, risk model, projection cache, intent matcher,
+retrieval index, answer cache, transaction ledger) once. Sessions get frozen
+views, so nothing shared can be mutated by one user's rerun. Call
+reload_content() before rebuilding to pick up edits to content.py; the
+rebuilt registry starts with empty caches. RegistryReloader rebuilds the
+registry when the data files change and swaps it in atomically.
+"""
+import importlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import content
+from analytics import RiskModel
+from catalog import catalog_path, load_catalog
+from chatbot import AnswerCache, IntentMatcher
+from ledger import Ledger
+from nav_store import NavStore
+from projection import ProjectionCache
+from recommender import Recommender
+from retrieval import RetrievalIndex, load_entries
+
+# When a NAV history store is present its period returns replace the file values
+NAV_STORE_PATH = os.environ.get("FINTRO_NAV_STORE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "nav"))
+
+# Transaction ledger; without the file an in-memory ledger is seeded from content.py.
+# It is not watched for changes: appends update its aggregates in place, and
+# rebuilt registries keep the ledger of the one they replace.
+LEDGER_PATH = os.environ.get("FINTRO_LEDGER", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ledger.sqlite"))
+
+# Optional JSON-lines or CSV file of extra question/answer pairs for the assistant
+KNOWLEDGE_BASE_PATH = os.environ.get("FINTRO_KNOWLEDGE_BASE")
+
+# Seconds between checks of the data files for changes; 0 turns hot reload off
+WATCH_INTERVAL = float(os.environ.get("FINTRO_WATCH_INTERVAL", "2"))
+
+
+def freeze(value):
+    # Read-only deep copy: dicts become mapping proxies and lists become tuples
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class Registry:
+    catalog: object
+    recommender: object
+    risk_model: object
+    projections: object
+    user_profile: MappingProxyType
+    ledger: object
+    fund_names: MappingProxyType
+    etf_prices: MappingProxyType
+    chatbot_responses: MappingProxyType
+    key_phrase_matches: MappingProxyType
+    intent_matcher: object
+    retriever: object
+    answer_cache: object
+    profile_info: MappingProxyType
+    faqs: tuple
+    suggested_questions: tuple
+    welcome_message: MappingProxyType
+    stylesheet: str
+    loaded_at: float
+
+
+def load_nav_store():
+    return NavStore.open(NAV_STORE_PATH) if os.path.isdir(NAV_STORE_PATH) else None
+
+
+def load_etf_catalog(path=None, store=None):
+    catalog = load_catalog(path)
+    store = store if store is not None else load_nav_store()
+    if store is not None:
+        catalog = catalog.with_nav(store)
+    return catalog
+
+
+def load_ledger():
+    if os.path.isfile(LEDGER_PATH):
+        return Ledger.open(LEDGER_PATH)
+    return Ledger.from_records(content.user_profile["transactions"])
+
+
+def load_retriever():
+    extra_entries = load_entries(KNOWLEDGE_BASE_PATH) if KNOWLEDGE_BASE_PATH else ()
+    return RetrievalIndex.from_content(content.chatbot_responses, content.faqs, extra_entries)
+
+
+def reload_content():
+    importlib.reload(content)
+
+
+def build_registry(previous=None):
+    # `previous` is the registry being replaced, when rebuilding. Its ledger is
+    # kept: reopening the file would leave its connection open, and reseeding
+    # an in-memory ledger from content.py would drop the transactions appended
+    # since. Its risk model merges in NAV days appended to the store.
+    store = load_nav_store()
+    catalog = load_etf_catalog(store=store)
+    chatbot_responses = freeze(content.chatbot_responses)
+    intent_matcher = IntentMatcher(content.key_phrase_matches)
+    retriever = load_retriever()
+    if previous is None:
+        risk_model = RiskModel(catalog, store)
+    else:
+        risk_model = previous.risk_model.rebased(catalog, store)
+    return Registry(
+        catalog=catalog,
+        recommender=Recommender(catalog),
+        risk_model=risk_model,
+        projections=ProjectionCache(catalog, risk_model),
+        user_profile=freeze(content.user_profile),
+        ledger=previous.ledger if previous is not None else load_ledger(),
+        fund_names=MappingProxyType(dict(zip(catalog.tickers, catalog.names))),
+        etf_prices=freeze(content.etf_prices),
+        chatbot_responses=chatbot_responses,
+        key_phrase_matches=freeze(content.key_phrase_matches),
+        intent_matcher=intent_matcher,
+        retriever=retriever,
+        answer_cache=AnswerCache(chatbot_responses, intent_matcher, retriever),
+        profile_info=freeze(content.profile_info),
+        faqs=freeze(content.faqs),
+        suggested_questions=freeze(content.suggested_questions),
+        welcome_message=freeze(content.welcome_message),
+        stylesheet=content.stylesheet,
+        loaded_at=time.time(),
+    )
+
+
+def watched_paths():
+    # The data files a registry is built from
+    paths = [catalog_path()]
+    if os.path.isdir(NAV_STORE_PATH):
+        paths += sorted(entry.path for entry in os.scandir(NAV_STORE_PATH) if entry.is_file())
+    if KNOWLEDGE_BASE_PATH:
+        paths.append(KNOWLEDGE_BASE_PATH)
+    return paths
+
+
+def file_signature(paths):
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            signature.append((path, None))
+        else:
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class RegistryReloader:
+    # Holds the current registry and rebuilds it in a background thread when
+    # the data files change. A rebuild starts once the files have looked the
+    # same for two checks in a row, so a file that is still being written is
+    # not read. The new registry replaces `current` in a single assignment:
+    # reruns already in flight keep the registry they started with, and the
+    # next rerun of every session gets the new one, with the same transaction
+    # ledger. If a rebuild fails, the old registry stays and the error is kept
+    # in `last_error`.
+
+    def __init__(self, build=build_registry, interval=WATCH_INTERVAL):
+        self.build = build
+        self.interval = interval
+        self.reloads = 0
+        self.last_error = None
+        self._signature = file_signature(watched_paths())
+        self._pending = None
+        self.current = build()
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.interval > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="registry-reloader", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self):
+        # One look at the data files; returns whether it rebuilt the registry
+        signature = file_signature(watched_paths())
+        if signature == self._signature:
+            self._pending = None
+        elif signature != self._pending:
+            # Changed since the last check; wait for it to settle
+            self._pending = signature
+        else:
+            self._pending = None
+            return self.reload()
+        return False
+
+    def reload(self):
+        # Rebuild now and swap the result in; returns whether it succeeded
+        with self._reload_lock:
+            signature = file_signature(watched_paths())
+            try:
+                registry = self.build(previous=self.current)
+            except Exception as error:
+                self.last_error = f"{type(error).__name__}: {error}"
+                self._signature = signature
+                return False
+            self.current = registry
+            self._signature = signature
+            self.reloads += 1
+            self.last_error = None
+            return True
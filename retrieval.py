@@ -0,0 +1,169 @@
+"""TF-IDF retrieval over the assistant's question/answer knowledge base.
+
+The index is built once: the questions and the answers are each tokenized
+into L2-normalized TF-IDF vectors stored by term, like an inverted index.
+Scoring a query gathers the postings of its few terms and accumulates them
+per entry with np.bincount, which is the sparse dot product with every entry
+at once, so a query costs time proportional to the postings it touches rather
+than to the size of the knowledge base. Question and answer similarities are
+blended so that a short paraphrased question is not drowned out by a long
+answer.
+"""
+import csv
+import json
+import re
+
+import numpy as np
+
+# Cosine similarity below which the retrieved answer is not trusted
+DEFAULT_THRESHOLD = 0.35
+
+# Share of the score that comes from the question rather than the answer
+QUESTION_WEIGHT = 0.7
+
+TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a about an and are as at be by can could do does for from how i if in into is it its me my of on or
+should so tell than that the their them there these this to was what whats when where which who why
+will with would you your
+""".split())
+
+
+def normalize_term(token):
+    # Crude plural folding so "etfs" and "etf" share a term
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    return [normalize_term(token) for token in TOKEN.findall(text.lower().replace("'", "")) if token not in STOPWORDS]
+
+
+def load_entries(path):
+    # (question, answer) pairs from a JSON-lines or CSV file with question and answer fields
+    with open(path, encoding="utf-8", newline="") as source:
+        if path.endswith(".csv"):
+            rows = list(csv.DictReader(source))
+        else:
+            rows = [json.loads(line) for line in source if line.strip()]
+    return [(row["question"], row["answer"]) for row in rows]
+
+
+def content_entries(chatbot_responses, faqs):
+    # The canned responses, then the FAQs that do not ask one of their
+    # questions: blended scores favour the shorter FAQ answer, so a duplicate
+    # question would otherwise always answer with the FAQ
+    entries = list(chatbot_responses.items())
+    canned_questions = {tuple(tokenize(question)) for question in chatbot_responses}
+    entries += [(faq["question"], faq["answer"]) for faq in faqs
+                if tuple(tokenize(faq["question"])) not in canned_questions]
+    return entries
+
+
+class TermIndex:
+    # L2-normalized TF-IDF vectors of one field, stored as postings grouped by term
+
+    def __init__(self, documents, vocabulary):
+        term_ids = []
+        document_ids = []
+        counts = []
+        for document_id, text in enumerate(documents):
+            bag = {}
+            for term in tokenize(text):
+                bag[term] = bag.get(term, 0) + 1
+            for term, count in bag.items():
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                document_ids.append(document_id)
+                counts.append(count)
+        self.term_ids = np.asarray(term_ids, dtype=np.int64)
+        self.document_ids = np.asarray(document_ids, dtype=np.int64)
+        self.counts = np.asarray(counts, dtype=np.float64)
+        self.document_count = len(documents)
+
+    def finalize(self, vocabulary_size):
+        # Called once the shared vocabulary is complete
+        document_frequency = np.bincount(self.term_ids, minlength=vocabulary_size)
+        self.idf = np.log((1 + self.document_count) / (1 + document_frequency)) + 1
+        weights = (1 + np.log(self.counts)) * self.idf[self.term_ids]
+        norms = np.sqrt(np.bincount(self.document_ids, weights=weights ** 2, minlength=self.document_count))
+        weights /= np.where(norms > 0, norms, 1)[self.document_ids]
+
+        # Postings of term t are [term_start[t], term_start[t + 1])
+        order = np.argsort(self.term_ids, kind="stable")
+        self.posting_documents = self.document_ids[order]
+        self.posting_weights = weights[order]
+        self.term_start = np.concatenate(([0], np.cumsum(document_frequency)))
+        del self.term_ids, self.document_ids, self.counts
+
+    def scores(self, term_ids, term_counts, unknown_terms=0):
+        # Cosine similarity of the query terms with every document. Terms outside
+        # the vocabulary still count towards the query norm, at the rarest idf.
+        query_weights = (1 + np.log(term_counts)) * self.idf[term_ids]
+        unseen_idf = np.log(1 + self.document_count) + 1
+        norm = np.sqrt(np.dot(query_weights, query_weights) + unknown_terms * unseen_idf ** 2)
+        starts = self.term_start[term_ids]
+        lengths = self.term_start[term_ids + 1] - starts
+        if not norm or not lengths.any():
+            return np.zeros(self.document_count)
+        # Positions of every posting of the query terms, without a loop per posting
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return np.bincount(
+            self.posting_documents[positions],
+            weights=self.posting_weights[positions] * np.repeat(query_weights / norm, lengths),
+            minlength=self.document_count
+        )
+
+
+class RetrievalIndex:
+    def __init__(self, entries):
+        self.questions = [question for question, _ in entries]
+        self.answers = [answer for _, answer in entries]
+        self.vocabulary = {}
+        self._question_index = TermIndex(self.questions, self.vocabulary)
+        self._answer_index = TermIndex(self.answers, self.vocabulary)
+        self._question_index.finalize(len(self.vocabulary))
+        self._answer_index.finalize(len(self.vocabulary))
+
+    def __len__(self):
+        return len(self.answers)
+
+    @classmethod
+    def from_content(cls, chatbot_responses, faqs, extra_entries=()):
+        return cls(content_entries(chatbot_responses, faqs) + list(extra_entries))
+
+    def scores(self, query):
+        # Blend of the query's cosine similarity with each question and each answer
+        terms = {}
+        unknown_terms = set()
+        for term in tokenize(query):
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                unknown_terms.add(term)
+            else:
+                terms[term_id] = terms.get(term_id, 0) + 1
+        if not terms:
+            return np.zeros(len(self.answers))
+        term_ids = np.fromiter(terms, np.int64, len(terms))
+        term_counts = np.fromiter(terms.values(), np.float64, len(terms))
+        return (QUESTION_WEIGHT * self._question_index.scores(term_ids, term_counts, len(unknown_terms))
+                + (1 - QUESTION_WEIGHT) * self._answer_index.scores(term_ids, term_counts, len(unknown_terms)))
+
+    def search(self, query, k=5):
+        # [(score, question, answer)] for the k best entries with a non-zero score
+        scores = self.scores(query)
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.lexsort((best, -scores[best]))]
+        return [(float(scores[i]), self.questions[i], self.answers[i]) for i in best if scores[i] > 0]
+
+    def best_answer(self, query, threshold=DEFAULT_THRESHOLD):
+        # The highest scoring answer, or None when nothing is similar enough
+        scores = self.scores(query)
+        if not len(scores):
+            return None
+        best = int(np.argmax(scores))
+        return self.answers[best] if scores[best] >= threshold else None
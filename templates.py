@@ -0,0 +1,120 @@
+"""Precompiled HTML templates for the cards rendered with st.markdown.
+
+Each layout is parsed once into literal chunks and field slots, and styling
+lives in the stylesheet's classes rather than in repeated inline style
+attributes. Rendering a list of items is a single join. String values are
+HTML-escaped unless the field name ends in ``_html``.
+"""
+import html
+from string import Formatter
+
+
+class Template:
+    def __init__(self, source):
+        # One line without indentation, so markdown passes it through as a single HTML block
+        source = "".join(line.strip() for line in source.strip().splitlines())
+        self._parts = []
+        for literal, field, format_spec, _ in Formatter().parse(source):
+            self._parts.append((literal, field, format_spec or "", field is not None and field.endswith("_html")))
+
+    def render(self, values):
+        chunks = []
+        for literal, field, format_spec, raw in self._parts:
+            chunks.append(literal)
+            if field is not None:
+                value = values[field]
+                if isinstance(value, str) and not raw:
+                    value = html.escape(value)
+                chunks.append(format(value, format_spec))
+        return "".join(chunks)
+
+    def render_many(self, items):
+        return "".join(self.render(values) for values in items)
+
+
+CATEGORY_CLASSES = {"Equity": "category-equity", "Bond": "category-bond"}
+
+
+def get_risk_level_class(risk_level):
+    if risk_level <= 3:
+        return "risk-low"
+    if risk_level <= 6:
+        return "risk-medium"
+    return "risk-high"
+
+
+ETF_CARD = Template("""
+<div class="etf-card">
+    <div class="etf-match-score">
+        <div class="etf-match-value">{matchScore}%</div>
+        <div class="etf-match-label">Match</div>
+    </div>
+    <div class="etf-details">
+        <div class="etf-header">
+            <div class="etf-name">{name} ({ticker})</div>
+            <span class="etf-category {category_class}">{category}</span>
+        </div>
+        <div class="metric-container">
+            <div class="metric"><div class="metric-value">{annualReturn}%</div><div class="metric-label">Annual Return</div></div>
+            <div class="metric"><div class="metric-value">{expenseRatio}%</div><div class="metric-label">Expense Ratio</div></div>
+            <div class="metric"><div class="metric-value">{volatility}%</div><div class="metric-label">Volatility</div></div>
+        </div>
+        <div class="risk-header"><span>Risk Level</span><span>{riskLevel}/10</span></div>
+        <div class="risk-bar"><div class="risk-fill {risk_class}" style="width: {risk_width}%;"></div></div>
+    </div>
+</div>
+""")
+
+PROFILE_BADGE = Template("""
+<span class="profile-badge">{percentage} of students</span>
+""")
+
+METRIC_ROW = Template("""
+<div class="metric-container">
+    <div class="metric"><div class="metric-value">{risk_tolerance}/10</div><div class="metric-label">Risk</div></div>
+    <div class="metric"><div class="metric-value">{experience}</div><div class="metric-label">Experience</div></div>
+    <div class="metric"><div class="metric-value">€{investment_amount}</div><div class="metric-label">Investment</div></div>
+</div>
+""")
+
+PROFILE_SUMMARY = Template("""
+<div class="profile-summary">
+    <div class="summary-row"><span class="summary-label">Portfolio Value:</span><span>{portfolio_value}</span></div>
+    <div class="summary-row"><span class="summary-label">Total Invested:</span><span>{total_invested}</span></div>
+    <div class="summary-row"><span class="summary-label">Total Return:</span><span class="{return_class}">{total_return}</span></div>
+</div>
+""")
+
+STAT_CARD = Template("""
+<div class="stat-card">
+    <div class="stat-value {value_class}">{value}</div>
+    <div class="stat-label">{label}</div>
+</div>
+""")
+
+WATCHLIST_TABLE = Template("""
+<table class="styled-table watchlist">
+    {caption_html}
+    <thead><tr><th>Name</th><th>Ticker</th><th>Price</th><th>Change</th></tr></thead>
+    <tbody>{rows_html}</tbody>
+</table>
+""")
+
+WATCHLIST_CAPTION = Template("""<caption>Live · updated {updated}</caption>""")
+
+WATCHLIST_ROW = Template("""
+<tr><td>{name}</td><td>{ticker}</td><td>{price}</td><td class="{change_class}">{change}</td></tr>
+""")
+
+
+def etf_card_values(etf):
+    return {
+        **etf,
+        "category_class": CATEGORY_CLASSES.get(etf["category"], "category-other"),
+        "risk_class": get_risk_level_class(etf["riskLevel"]),
+        "risk_width": etf["riskLevel"] * 10,
+    }
+
+
+def render_etf_cards(etfs):
+    return ETF_CARD.render_many(etf_card_values(etf) for etf in etfs)
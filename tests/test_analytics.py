@@ -0,0 +1,43 @@
+import numpy as np
+
+from analytics import corner_portfolios, efficient_frontier, portfolio_stats
+
+
+def test_frontier_starts_from_mix_of_funds_tied_for_best_return():
+    returns, volatility, weights = efficient_frontier([8, 8, 4], np.diag([0.09, 0.01, 0.02]))
+    # Best return at the least risk: 1/variance weights over the two tied funds
+    np.testing.assert_allclose(weights[-1], [0.1, 0.9, 0.0], atol=1e-9)
+    np.testing.assert_allclose(volatility[-1], np.sqrt(0.009) * 100)
+    np.testing.assert_allclose(returns[-1], 8.0)
+    # Minimum variance: 1/variance weights over all three
+    np.testing.assert_allclose(volatility[0], np.sqrt(1 / (1 / 0.09 + 1 / 0.01 + 1 / 0.02)) * 100)
+
+
+def test_single_fund_and_all_tied():
+    corners = corner_portfolios([5.0], [[0.04]])
+    np.testing.assert_allclose(corners, [[1.0], [1.0]])
+    _, volatility, weights = efficient_frontier([3, 3], np.diag([0.04, 0.04]))
+    np.testing.assert_allclose(weights, 0.5)
+    np.testing.assert_allclose(volatility, np.sqrt(0.02) * 100)
+
+
+def test_no_long_only_portfolio_beats_the_frontier():
+    rng = np.random.default_rng(1)
+    for case in range(40):
+        count = int(rng.integers(2, 8))
+        factors = rng.normal(size=(count, 2)) * 0.1
+        covariance = factors @ factors.T + np.diag(rng.uniform(0.001, 0.04, count))
+        # Every other case draws returns from a few values, so ties are common
+        if case % 2:
+            expected_returns = rng.choice([2.0, 4.0, 6.0, 8.0], count)
+        else:
+            expected_returns = np.round(rng.uniform(1, 12, count), 2)
+        returns, volatility, weights = efficient_frontier(expected_returns, covariance)
+        assert weights.min() >= 0
+        np.testing.assert_allclose(weights.sum(axis=1), 1)
+
+        samples = rng.dirichlet(np.full(count, 0.5), 5000)
+        sample_returns, sample_volatility = portfolio_stats(samples, expected_returns, covariance)
+        for target, risk in zip(returns, volatility):
+            reaching = sample_returns >= target
+            assert not reaching.any() or sample_volatility[reaching].min() >= risk - 1e-6
@@ -0,0 +1,16 @@
+import numpy as np
+
+from catalog import ETFCatalog, synthetic_catalog
+
+
+def test_category_codes_hold_more_than_127_categories():
+    frame = synthetic_catalog(400).to_frame()
+    frame["category"] = [f"Category {i % 200:03d}" for i in range(len(frame))]
+    catalog = ETFCatalog.from_frame(frame)
+
+    assert len(catalog.category_names) == 200
+    assert catalog.category_codes.max() == 199
+    assert list(catalog.categories()) == list(frame["category"])
+    assert catalog.record(399)["category"] == "Category 199"
+    assert catalog.category_codes.dtype == np.int16
+    assert synthetic_catalog(10).category_codes.dtype == np.int8
@@ -0,0 +1,57 @@
+import content
+from chatbot import FALLBACK_RESPONSE, AnswerCache, IntentMatcher, answer_query, exact_key
+from retrieval import RetrievalIndex, content_entries
+
+
+def make_cache():
+    matcher = IntentMatcher(content.key_phrase_matches)
+    retriever = RetrievalIndex.from_content(content.chatbot_responses, content.faqs)
+    return matcher, retriever, AnswerCache(content.chatbot_responses, matcher, retriever)
+
+
+def test_cache_keeps_queries_apart_that_differ_only_in_key_phrases():
+    for queries in (["What about taxes?", "How about taxes?"], ["How about taxes?", "What about taxes?"]):
+        matcher, retriever, cache = make_cache()
+        for query in queries:
+            assert cache.answer(query) == answer_query(query, content.chatbot_responses, matcher, retriever)
+    assert cache.answer("What about taxes?") == FALLBACK_RESPONSE
+    assert cache.answer("How about taxes?") == content.chatbot_responses["how are etfs taxed"]
+
+
+def test_cache_does_not_mix_exact_matches_with_other_answers():
+    # Both queries normalize to "etfs work" with the same key phrases, but only
+    # the second is a canned question; the first is answered from the knowledge base
+    responses = {"how do etfs work": "Canned answer."}
+    matcher = IntentMatcher({"how": {"work": "how do etfs work"}})
+    retriever = RetrievalIndex([("ETFs work", "Knowledge base answer.")])
+    pair = ["How ETFs work?", "How do ETFs work?"]
+    for queries in (pair, pair[::-1]):
+        cache = AnswerCache(responses, matcher, retriever)
+        answers = {query: cache.answer(query) for query in queries}
+        assert answers == {"How ETFs work?": "Knowledge base answer.", "How do ETFs work?": "Canned answer."}
+
+
+def test_cache_shares_entries_across_case_and_punctuation():
+    _, _, cache = make_cache()
+    first = cache.answer("Tell me about ETF fees?")
+    assert cache.answer("tell me about etf fees") == first
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_suggested_questions_get_the_canned_answer():
+    matcher = IntentMatcher(content.key_phrase_matches)
+    retriever = RetrievalIndex.from_content(content.chatbot_responses, content.faqs)
+    assert all(exact_key(key) == key for key in content.chatbot_responses)
+    for question in content.suggested_questions:
+        canned = content.chatbot_responses.get(exact_key(question))
+        if canned is not None:
+            assert answer_query(question, content.chatbot_responses, matcher, retriever) == canned
+    assert (answer_query("How do ETFs work?", content.chatbot_responses, matcher, retriever)
+            == content.chatbot_responses["how do etfs work"])
+
+
+def test_faqs_that_repeat_a_canned_question_are_not_indexed():
+    questions = [question for question, _ in content_entries(content.chatbot_responses, content.faqs)]
+    assert "How do ETFs work?" not in questions
+    assert "How do I choose an ETF?" in questions
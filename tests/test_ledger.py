@@ -0,0 +1,63 @@
+import sqlite3
+
+import pytest
+
+from ledger import Ledger
+
+
+def test_sells_take_the_average_cost_basis():
+    ledger = Ledger.from_records([
+        {"date": "2024-01-02", "kind": "deposit", "amount": 1000.0},
+        {"date": "2024-01-03", "kind": "buy", "ticker": "AAA", "shares": 10, "amount": 100.0},
+        {"date": "2024-02-01", "kind": "buy", "ticker": "AAA", "shares": 10, "amount": 300.0},
+        {"date": "2024-03-01", "kind": "sell", "ticker": "AAA", "shares": 5, "amount": 250.0},
+    ])
+
+    # 20 shares cost 400, so 15 of them keep 300 whatever the sale fetched
+    (ticker, shares, cost_basis), = ledger.positions()
+    assert (ticker, shares) == ("AAA", 15)
+    assert cost_basis == pytest.approx(300.0)
+    assert ledger.totals()["cash"] == pytest.approx(1000 - 400 + 250)
+
+    ledger.append([{"date": "2024-04-01", "kind": "sell", "ticker": "AAA", "shares": 15, "amount": 500.0}])
+    assert ledger.positions() == []
+
+
+def test_overselling_rejects_the_whole_append():
+    ledger = Ledger.from_records([
+        {"date": "2024-01-02", "kind": "deposit", "amount": 1000.0},
+        {"date": "2024-01-03", "kind": "buy", "ticker": "AAA", "shares": 10, "amount": 100.0},
+    ])
+
+    with pytest.raises(sqlite3.IntegrityError, match="sell of more shares than held"):
+        ledger.append([
+            {"date": "2024-01-04", "kind": "sell", "ticker": "AAA", "shares": 4, "amount": 40.0},
+            {"date": "2024-01-05", "kind": "sell", "ticker": "AAA", "shares": 7, "amount": 70.0},
+        ])
+    assert ledger.positions() == [("AAA", 10, 100.0)]
+    assert ledger.totals()["transactions"] == 2
+
+
+def test_buys_and_sells_need_a_ticker():
+    ledger = Ledger.open()
+
+    for kind in ("buy", "sell"):
+        with pytest.raises(ValueError, match="ticker"):
+            ledger.append([{"date": "2024-01-02", "kind": kind, "shares": 1, "amount": 10.0}])
+    assert ledger.totals()["transactions"] == 0
+
+
+def test_pages_continue_across_rows_with_the_same_date():
+    records = [{"date": f"2024-01-0{day}", "kind": "deposit", "amount": float(index)}
+               for index, day in enumerate([1, 2, 2, 2, 2, 2, 3])]
+    ledger = Ledger.from_records(records)
+
+    pages, cursor = [], None
+    while True:
+        rows, cursor = ledger.page(before=cursor, limit=3)
+        pages.append([row["amount"] for row in rows])
+        if cursor is None:
+            break
+
+    # Newest first, ties on the date in reverse insertion order, with no row repeated or skipped
+    assert pages == [[6.0, 5.0, 4.0], [3.0, 2.0, 1.0], [0.0]]
@@ -0,0 +1,25 @@
+import time
+
+from lru import LRUCache
+
+
+def test_evicts_the_least_recently_used_entry():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {"hits": 3, "misses": 1, "hit_rate": 0.75, "evictions": 1, "entries": 2}
+
+
+def test_entries_expire_after_the_ttl():
+    cache = LRUCache(4, ttl=0.05)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
@@ -0,0 +1,25 @@
+import numpy as np
+
+from analytics import RiskModel
+from catalog import synthetic_catalog
+from projection import ProjectionCache, horizon_steps, simulate_bands
+
+
+def test_cached_bands_scale_with_the_amount():
+    catalog = synthetic_catalog(5)
+    risk_model = RiskModel(catalog)
+    cache = ProjectionCache(catalog, risk_model, paths=2_000)
+    indices = np.arange(5)
+    weights = np.ones(5)
+
+    small = cache.project(indices, weights, 1_000, "1Y")
+    large = cache.project(indices, weights, 25_000, "1Y")
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+
+    years, steps = horizon_steps("1Y")
+    expected = simulate_bands(catalog.annual_return[indices], risk_model.covariance(indices), weights, 25_000,
+                              years, steps, paths=2_000)
+    np.testing.assert_allclose(large, expected, rtol=1e-12)
+    np.testing.assert_allclose(large, small * 25, rtol=1e-12)
+    assert large[:, 0].tolist() == [25_000] * len(large)
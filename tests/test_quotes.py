@@ -0,0 +1,51 @@
+import threading
+import time
+
+from quotes import QuoteTable, SharedFeed, SimulatedFeed
+
+WATCHLIST = (
+    {"ticker": "AAA", "price": 100.0, "change": 1.0},
+    {"ticker": "BBB", "price": 50.0, "change": -2.0},
+    {"ticker": "CCC", "price": 20.0, "change": 0.0},
+)
+
+
+def test_updates_coalesce_ticks_at_the_refresh_rate():
+    table = QuoteTable.from_records(WATCHLIST)
+    feed = SimulatedFeed(table, interval=0.005, seed=0).start()
+    refresh = 0.1
+    try:
+        frames = [(time.monotonic(), snapshot) for snapshot in table.updates(refresh, duration=1.0)]
+    finally:
+        feed.stop()
+
+    versions = [snapshot.version for _, snapshot in frames]
+    assert versions == sorted(set(versions))
+    # Ticks arrive about 20 times per frame; each frame carries the latest of them
+    assert 2 <= len(frames) <= 1.0 / refresh + 1
+    assert versions[-1] > 3 * len(frames)
+    gaps = [later - earlier for (earlier, _), (later, _) in zip(frames, frames[1:])]
+    assert min(gaps) >= refresh * 0.9
+
+
+def test_updates_end_promptly_when_stopped():
+    table = QuoteTable.from_records(WATCHLIST)
+    stop = threading.Event()
+    threading.Timer(0.2, stop.set).start()
+    start = time.monotonic()
+    assert list(table.updates(1.0, duration=10.0, stopped=stop.is_set, heartbeat=10.0)) == []
+    assert time.monotonic() - start < 0.5
+
+
+def test_shared_feed_stops_the_previous_feed():
+    shared = SharedFeed(lambda table: SimulatedFeed(table, interval=0.01))
+    first = shared.table(WATCHLIST)
+    assert shared.table(WATCHLIST) is first
+    old_thread = shared._feed._thread
+
+    second = shared.table(WATCHLIST[:2])
+    assert second is not first
+    assert second.tickers == ("AAA", "BBB")
+    old_thread.join(timeout=1.0)
+    assert not old_thread.is_alive()
+    shared._feed.stop()
@@ -0,0 +1,21 @@
+import numpy as np
+
+from catalog import synthetic_catalog
+from recommender import Recommender, recommend_batch
+
+
+def test_batch_matches_the_app_for_amounts_inside_a_bucket():
+    catalog = synthetic_catalog(200)
+    recommender = Recommender(catalog, k=5)
+    risk_tolerances = np.array([2, 5, 5, 9, 9, 10])
+    # Off-grid amounts are rounded up to their bucket of 100, as in the app
+    investment_amounts = np.array([1234.5, 2901.0, 3000.0, 3000.01, 999_999.5, 50.0])
+
+    indices, scores, profiles = recommend_batch(catalog, risk_tolerances, investment_amounts, k=5)
+    for user, (risk, amount) in enumerate(zip(risk_tolerances.tolist(), investment_amounts.tolist())):
+        expected_indices, expected_scores, expected_profile = recommender.recommend(risk, amount)
+        count = len(expected_indices)
+        assert indices[user, :count].tolist() == expected_indices.tolist()
+        assert (indices[user, count:] == -1).all()
+        np.testing.assert_allclose(scores[user, :count], expected_scores, rtol=1e-6)
+        assert profiles[user] == expected_profile
@@ -0,0 +1,86 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import registry
+from registry import RegistryReloader, build_registry
+
+
+@pytest.fixture
+def data_file(tmp_path, monkeypatch):
+    path = tmp_path / "catalog.csv"
+    path.write_text("v1")
+    monkeypatch.setattr(registry, "watched_paths", lambda: [str(path)])
+    return path
+
+
+def touch(path, text):
+    path.write_text(text)
+    # A distinct mtime even on filesystems with coarse timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def counting_build():
+    builds = []
+
+    def build(previous=None):
+        builds.append(previous)
+        return SimpleNamespace(ledger=previous.ledger if previous else object(), build=len(builds))
+    return build, builds
+
+
+def test_rebuilds_once_a_change_has_settled(data_file):
+    build, builds = counting_build()
+    reloader = RegistryReloader(build, interval=0)
+    first = reloader.current
+    assert not reloader.check()
+
+    touch(data_file, "v2")
+    assert not reloader.check()  # changed: wait for the next check
+    touch(data_file, "v3")
+    assert not reloader.check()  # still being written
+    assert reloader.current is first
+
+    assert reloader.check()
+    assert reloader.current.build == 2
+    assert reloader.current.ledger is first.ledger
+    assert builds[1] is first
+    assert reloader.reloads == 1
+    assert not reloader.check()
+
+
+def test_failed_rebuild_keeps_the_previous_registry(data_file):
+    build, _ = counting_build()
+    reloader = RegistryReloader(build, interval=0)
+    first = reloader.current
+
+    def broken(previous=None):
+        raise ValueError("bad catalog")
+    reloader.build = broken
+    touch(data_file, "v2")
+    assert not reloader.check()
+    assert not reloader.check()
+    assert reloader.current is first
+    assert reloader.last_error == "ValueError: bad catalog"
+    assert reloader.reloads == 0
+
+    # The failed version is not retried until the files change again
+    reloader.build = build
+    assert not reloader.check()
+    touch(data_file, "v3")
+    reloader.check()
+    assert reloader.check()
+    assert reloader.last_error is None
+
+
+def test_rebuilt_registry_keeps_appended_transactions(tmp_path, monkeypatch):
+    # The in-memory ledger seeded from content.py
+    monkeypatch.setattr(registry, "LEDGER_PATH", str(tmp_path / "missing.sqlite"))
+    first = build_registry()
+    first.ledger.append([{"date": "2024-12-30", "kind": "deposit", "amount": 100.0}])
+    count = first.ledger.totals()["transactions"]
+    second = build_registry(previous=first)
+    assert second.ledger is first.ledger
+    assert second.ledger.totals()["transactions"] == count
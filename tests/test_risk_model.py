@@ -0,0 +1,56 @@
+import numpy as np
+
+from analytics import COVARIANCE_WINDOW, ReturnCovariance, RiskModel
+from catalog import synthetic_catalog
+from nav_store import NavStore, synthetic_history
+
+
+def window_covariance(prices, window=COVARIANCE_WINDOW):
+    returns = np.diff(np.log(np.asarray(prices, dtype=np.float64)), axis=0)[-window:]
+    return np.cov(returns, rowvar=False) * 252
+
+
+def test_windowed_tracker_matches_a_fresh_computation():
+    _, prices = synthetic_history(np.full(4, 6.0), np.array([5.0, 10.0, 20.0, 30.0]), days=600)
+    tracker = ReturnCovariance.from_prices(prices[:300], window=250)
+    for start in range(300, 600, 37):
+        tracker.update(prices[start:start + 37])
+    np.testing.assert_allclose(tracker.covariance(), window_covariance(prices, 250), rtol=1e-9)
+    assert tracker.count == 250
+
+
+def test_tracked_and_per_subset_covariances_use_the_same_window():
+    catalog = synthetic_catalog(30)
+    # Longer than the window, so both paths have to cut the history
+    dates, prices = synthetic_history(catalog.annual_return, catalog.volatility, days=COVARIANCE_WINDOW + 200)
+    store = NavStore(catalog.tickers, dates, prices)
+    tracked = RiskModel(catalog, store)
+    per_subset = RiskModel(catalog, store, max_tracked=10)
+    assert tracked.tracker is not None and per_subset.tracker is None
+
+    indices = [3, 7, 21]
+    np.testing.assert_allclose(tracked.covariance(indices), per_subset.covariance(indices), rtol=1e-9)
+    np.testing.assert_allclose(np.sqrt(np.diag(tracked.covariance(indices))) * 100,
+                               store.volatility(COVARIANCE_WINDOW)[indices], rtol=1e-5)
+
+
+def test_rebased_model_merges_appended_days(tmp_path):
+    catalog = synthetic_catalog(20)
+    dates, prices = synthetic_history(catalog.annual_return, catalog.volatility)
+    path = str(tmp_path / "nav")
+    NavStore.write(path, catalog.tickers, dates[:-5], prices[:-5])
+    model = RiskModel(catalog, NavStore.open(path))
+    before = model.covariance(np.arange(20)).copy()
+
+    NavStore.append(path, dates[-5:], prices[-5:])
+    store = NavStore.open(path)
+    rebased = model.rebased(catalog, store)
+    assert rebased.tracker is not model.tracker
+    np.testing.assert_allclose(rebased.covariance(np.arange(20)), window_covariance(store.prices), rtol=1e-6)
+    np.testing.assert_array_equal(model.covariance(np.arange(20)), before)
+
+    # A store that does not extend the old one is tracked from scratch
+    NavStore.write(path, catalog.tickers, dates[5:], prices[5:])
+    store = NavStore.open(path)
+    rebuilt = model.rebased(catalog, store)
+    np.testing.assert_allclose(rebuilt.covariance(np.arange(20)), window_covariance(store.prices), rtol=1e-6)
@@ -0,0 +1,13 @@
+from benchmarks import startup_report
+
+
+def test_cold_start_is_within_the_budget(capsys):
+    assert startup_report.main(["--budget", "--top", "3"]) == 0
+    assert "OK: cold start" in capsys.readouterr().out
+
+
+def test_budget_fails_when_the_cold_start_exceeds_it(monkeypatch, capsys):
+    monkeypatch.setattr(startup_report, "import_times", lambda preload, modules: {"streamlit": (3.0, 0)})
+
+    assert startup_report.main(["--budget", "2.5"]) == 1
+    assert "FAIL: cold start 3.000 s exceeds the 2.500 s budget" in capsys.readouterr().out
@@ -0,0 +1,73 @@
+"""Sidebar debug panel with per-session and per-process rerun timings."""
+import sys
+import uuid
+
+import streamlit as st
+
+import instrumentation
+
+
+def init_state():
+    if 'timings' not in st.session_state:
+        st.session_state.timings = instrumentation.Timings()
+    if 'timings_session_id' not in st.session_state:
+        st.session_state.timings_session_id = uuid.uuid4().hex
+
+
+def span(name):
+    # Times the block for this session and for the process when FINTRO_PROFILE is set
+    return instrumentation.span(name, st.session_state.get("timings"))
+
+
+def export_timings():
+    lines = instrumentation.export_jsonl(
+        session_timings=st.session_state.timings,
+        session_id=st.session_state.timings_session_id
+    )
+    st.session_state.timings_exported = f"Appended {lines} lines to {instrumentation.EXPORT_PATH}"
+
+
+def reset_session_timings():
+    st.session_state.timings.clear()
+
+
+def render_panel(registry):
+    init_state()
+
+    with st.sidebar.expander("Debug: rerun timings"):
+        st.markdown("**This session**")
+        session_rows = st.session_state.timings.summary()
+        if session_rows:
+            st.dataframe(session_rows, hide_index=True, use_container_width=True)
+        else:
+            st.caption("No spans recorded yet.")
+
+        st.markdown("**All sessions in this process**")
+        process_rows = instrumentation.process_timings.summary()
+        if process_rows:
+            st.dataframe(process_rows, hide_index=True, use_container_width=True)
+
+        st.markdown("**Caches**")
+        caches = {
+            "answers": registry.answer_cache.stats(),
+            "projections": registry.projections.stats(),
+            "recommendations": registry.recommender.stats(),
+        }
+        # Only once the Recommendations tab has been loaded in this process
+        recommendations = sys.modules.get("views.recommendations")
+        if recommendations is not None:
+            caches["charts"] = recommendations.get_chart_cache().stats()
+        st.json(caches)
+
+        # Recommendations tab reruns that reused all of their derived state
+        if st.session_state.get("derived_reruns"):
+            st.markdown("**Derived state**")
+            st.json({**st.session_state.derived_reruns, **st.session_state.derived_counts})
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button("Export", key="timings_export", on_click=export_timings)
+        with col2:
+            st.button("Reset", key="timings_reset", on_click=reset_session_timings)
+        if st.session_state.get("timings_exported"):
+            st.caption(st.session_state.timings_exported)
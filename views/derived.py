@@ -0,0 +1,43 @@
+"""Per-session derived state, recomputed only when its inputs change.
+
+derived(name, inputs, compute) returns the value cached for `name` while
+`inputs` compares equal to the inputs it was computed from, and calls
+compute() otherwise. Reruns in which nothing had to be recomputed are
+counted, and the counts are shown in the debug panel.
+"""
+import streamlit as st
+
+
+def init_state():
+    if 'derived_values' not in st.session_state:
+        st.session_state.derived_values = {}
+    if 'derived_counts' not in st.session_state:
+        st.session_state.derived_counts = {}
+    if 'derived_reruns' not in st.session_state:
+        st.session_state.derived_reruns = {"reruns": 0, "skipped": 0}
+
+
+def begin_rerun():
+    init_state()
+    st.session_state.derived_recomputed = False
+
+
+def end_rerun():
+    reruns = st.session_state.derived_reruns
+    reruns["reruns"] += 1
+    if not st.session_state.derived_recomputed:
+        reruns["skipped"] += 1
+
+
+def derived(name, inputs, compute):
+    values = st.session_state.derived_values
+    counts = st.session_state.derived_counts.setdefault(name, {"recomputed": 0, "reused": 0})
+    cached = values.get(name)
+    if cached is not None and cached[0] == inputs:
+        counts["reused"] += 1
+        return cached[1]
+    value = compute()
+    values[name] = (inputs, value)
+    counts["recomputed"] += 1
+    st.session_state.derived_recomputed = True
+    return value
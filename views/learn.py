@@ -0,0 +1,105 @@
+"""Learn tab: the Fintro assistant chat, FAQs and suggested questions."""
+import html
+import os
+import uuid
+
+import streamlit as st
+
+from chatbot import ChatHistory, stream_response
+from views.debug import span
+
+# Chat history limits; set FINTRO_CHAT_SPILL_DIR to keep turns beyond the cap on disk
+CHAT_HISTORY_CAPACITY = 200
+CHAT_WINDOW = 20
+CHAT_SPILL_DIR = os.environ.get("FINTRO_CHAT_SPILL_DIR")
+
+
+def init_state(registry):
+    if 'pending_question' not in st.session_state:
+        st.session_state.pending_question = None
+    if 'chat_messages' not in st.session_state:
+        chat_spill_path = os.path.join(CHAT_SPILL_DIR, f"{uuid.uuid4().hex}.jsonl") if CHAT_SPILL_DIR else None
+        st.session_state.chat_messages = ChatHistory(
+            [dict(registry.welcome_message)],
+            capacity=CHAT_HISTORY_CAPACITY,
+            spill_path=chat_spill_path
+        )
+    if 'chat_window' not in st.session_state:
+        st.session_state.chat_window = CHAT_WINDOW
+
+
+def ask_question(question):
+    # Queue the question; the reply is streamed while the Learn tab renders
+    st.session_state.chat_messages.append({"sender": "user", "text": question})
+    st.session_state.pending_question = question
+
+
+def handle_chat_input():
+    if st.session_state.chat_input:
+        with span("handle_chat_input"):
+            ask_question(st.session_state.chat_input)
+        
+        # Clear the input
+        st.session_state.chat_input = ""
+
+
+def load_earlier_messages():
+    st.session_state.chat_window += CHAT_WINDOW
+
+
+def chat_message_html(message, typing=False):
+    classes = f"chat-message {message['sender']}" + (" typing" if typing else "")
+    return f"<div class='{classes}'>{html.escape(message['text'])}</div>"
+
+
+def stream_bot_reply(placeholder, registry):
+    question = st.session_state.pending_question
+    st.session_state.pending_question = None
+    
+    bot_response = ""
+    for chunk in stream_response(registry.answer_cache.answer(question)):
+        bot_response += chunk
+        placeholder.markdown(chat_message_html({"sender": "bot", "text": bot_response}, typing=True), unsafe_allow_html=True)
+    st.session_state.chat_messages.append({"sender": "bot", "text": bot_response})
+
+
+def render(registry):
+    init_state(registry)
+    
+    col1, col2 = st.columns([3, 2])
+
+    with col1:
+        st.markdown("## Fintro Assistant")
+
+        # Display the most recent chat messages as a single block
+        chat_history = st.session_state.chat_messages
+        if chat_history.available() > st.session_state.chat_window:
+            st.button("Load earlier messages", key="chat_load_earlier", on_click=load_earlier_messages)
+        chat_window = chat_history.window(st.session_state.chat_window)
+        st.markdown(
+            "<div class='chat-history'>" + "".join(chat_message_html(message) for message in chat_window) + "</div>",
+            unsafe_allow_html=True
+        )
+
+        # Stream the reply to the latest question
+        if st.session_state.pending_question:
+            with span("stream_bot_reply"):
+                stream_bot_reply(st.empty(), registry)
+
+        # Chat input
+        st.text_input("Ask me anything about ETFs...", key="chat_input", on_change=handle_chat_input)
+
+    with col2:
+        st.markdown("## Frequently Asked Questions")
+
+        # FAQ cards
+        for faq in registry.faqs:
+            with st.expander(faq["question"]):
+                st.write(faq["answer"])
+
+        # Suggested questions
+        st.markdown("### Try asking:")
+
+        # Create buttons for suggested questions
+        for question in registry.suggested_questions:
+            st.button(question, key=f"q_{question}", on_click=ask_question, args=(question,))
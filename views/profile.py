@@ -0,0 +1,185 @@
+"""My Profile tab: portfolio valuation, holdings, live watchlist and recent activity."""
+import datetime
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from streamlit.runtime.scriptrunner.script_requests import ScriptRequests, ScriptRequestType
+
+from analytics import holdings_stats
+from ledger import PAGE_SIZE
+from portfolio import format_eur, format_pct, value_holdings
+from quotes import QuoteTable, SharedFeed
+from templates import PROFILE_SUMMARY, STAT_CARD, WATCHLIST_CAPTION, WATCHLIST_ROW, WATCHLIST_TABLE
+
+# Seconds between watchlist redraws, and how long a session keeps streaming
+# quotes after its last rerun. Streaming holds the session's script thread,
+# so it is off (0) unless turned on.
+REFRESH_INTERVAL = float(os.environ.get("FINTRO_QUOTE_REFRESH", "1.0"))
+STREAM_SECONDS = float(os.environ.get("FINTRO_QUOTE_STREAM_SECONDS", "0"))
+
+# A stream ends when the session asks for a rerun, which Streamlit only
+# exposes as ScriptRequests' private state; without it the watchlist is static
+STREAMING = STREAM_SECONDS > 0 and hasattr(ScriptRequests(), "_state")
+
+# The demo profile is the ledger's user 0
+USER_ID = 0
+
+ACTIVITY_ACTIONS = {"deposit": "Deposit", "withdrawal": "Withdrawal", "dividend": "Dividend Payment"}
+
+
+def init_state():
+    # Cursors of the activity pages before the one shown; empty on the newest page
+    if 'activity_cursors' not in st.session_state:
+        st.session_state.activity_cursors = []
+
+
+def show_older_activity(cursor):
+    st.session_state.activity_cursors.append(cursor)
+
+
+def show_newer_activity():
+    st.session_state.activity_cursors.pop()
+
+
+def activity_records(rows, names):
+    for row in rows:
+        date = datetime.date.fromisoformat(row["date"])
+        name = names.get(row["ticker"], row["ticker"])
+        action = {"buy": f"Purchased {name}", "sell": f"Sold {name}"}.get(row["kind"]) or ACTIVITY_ACTIONS[row["kind"]]
+        yield {"date": f"{date:%b} {date.day}, {date.year}", "action": action, "amount": format_eur(row["amount"])}
+
+
+@st.cache_resource
+def get_quote_feed():
+    # One quote table and feed per process, shared by every session
+    return SharedFeed()
+
+
+def rerun_requested(ctx):
+    # Streamlit acts on a rerun or stop request only at the next element call,
+    # so the stream checks for one between redraws to end promptly
+    return ctx.script_requests._state != ScriptRequestType.CONTINUE
+
+
+def render_watchlist(names, snapshot, live):
+    rows = WATCHLIST_ROW.render_many({
+        "name": names[ticker],
+        "ticker": ticker,
+        "price": format_eur(price),
+        "change": f"{change:+.2f}%",
+        "change_class": "positive" if change >= 0 else "negative"
+    } for ticker, price, change in zip(snapshot.tickers, snapshot.prices, snapshot.changes))
+    caption = ""
+    if live:
+        caption = WATCHLIST_CAPTION.render({"updated": time.strftime("%H:%M:%S", time.localtime(snapshot.updated_at))})
+    return WATCHLIST_TABLE.render({"rows_html": rows, "caption_html": caption})
+
+
+def stream_watchlist(placeholder, names, quotes, since):
+    # Redraws only the watchlist as quotes arrive; the rest of the page is not re-executed
+    ctx = get_script_run_ctx()
+    for snapshot in quotes.updates(REFRESH_INTERVAL, STREAM_SECONDS, since=since,
+                                   stopped=lambda: rerun_requested(ctx)):
+        placeholder.markdown(render_watchlist(names, snapshot, live=True), unsafe_allow_html=True)
+
+
+def render(registry):
+    # Returns a callable that keeps the watchlist live, to be run once the
+    # rest of the page has been drawn, or None when streaming is off
+    init_state()
+    user_profile = registry.user_profile
+    ledger = registry.ledger
+    
+    st.title("My Profile")
+
+    # Value the holdings from the latest prices; positions and cost basis are
+    # kept up to date by the ledger, so this does not depend on its length
+    holdings = ledger.holdings(registry.fund_names, USER_ID)
+    valuation = value_holdings(holdings, holdings.prices_from(registry.etf_prices))
+
+    # Profile header section
+    col1, col2, col3, col4, col5 = st.columns([1, 2, 1, 1, 1])
+
+    with col1:
+        st.markdown('<div class="profile-visual user">👤</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"## {user_profile['name']}")
+        st.markdown(f"<div style='color: #666;'>{user_profile['email']}</div>", unsafe_allow_html=True)
+
+        return_class = "positive" if valuation.total_return[0] >= 0 else "negative"
+        total_return_pct = format_pct(valuation.total_return_pct[0], 2)
+        st.markdown(PROFILE_SUMMARY.render({
+            "portfolio_value": format_eur(valuation.portfolio_value[0]),
+            "total_invested": format_eur(valuation.total_invested[0]),
+            "total_return": f"{format_eur(valuation.total_return[0])} ({total_return_pct})",
+            "return_class": return_class
+        }), unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(STAT_CARD.render({"value": valuation.funds_owned[0], "value_class": "", "label": "ETFs Owned"}),
+                    unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(STAT_CARD.render({"value": total_return_pct, "value_class": return_class, "label": "Total Return"}),
+                    unsafe_allow_html=True)
+
+    with col5:
+        # Annualized, from the covariance of the funds held
+        _, volatility = holdings_stats(registry.risk_model, holdings.tickers, valuation.values)
+        st.markdown(STAT_CARD.render({"value": format_pct(volatility), "value_class": "", "label": "Volatility"}),
+                    unsafe_allow_html=True)
+
+    # Holdings section
+    st.markdown("## Portfolio Holdings")
+
+    # Formatting is applied only here, at render time
+    holdings_df = pd.DataFrame({
+        "name": holdings.names,
+        "ticker": holdings.tickers,
+        "shares": ["-" if is_cash else f"{shares:g}" for shares, is_cash in zip(holdings.shares, holdings.is_cash)],
+        "value": [format_eur(value) for value in valuation.values],
+        "allocation": [format_pct(allocation) for allocation in valuation.allocations]
+    })
+    st.table(holdings_df)
+
+    # Create two columns for watchlist and activity
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("## Your Watchlist")
+        watchlist = [dict(row) for row in user_profile["watchlist"]]
+        names = {row["ticker"]: row["name"] for row in watchlist}
+        # The shared feed is only started when quotes are streamed; otherwise
+        # the watchlist shows the content prices
+        quotes = get_quote_feed().table(tuple(watchlist)) if STREAMING else QuoteTable.from_records(watchlist)
+        snapshot = quotes.snapshot()
+        watchlist_slot = st.empty()
+        watchlist_slot.markdown(render_watchlist(names, snapshot, STREAMING), unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("## Recent Activity")
+        totals = ledger.totals(USER_ID)
+        st.caption(f"{totals['transactions']:,} transactions · {format_eur(totals['deposits'])} deposited · "
+                   f"{format_eur(totals['dividends'])} dividends received")
+        # One indexed page of the ledger, newest first
+        cursors = st.session_state.activity_cursors
+        rows, older = ledger.page(USER_ID, cursors[-1] if cursors else None, PAGE_SIZE)
+        activity_df = pd.DataFrame(list(activity_records(rows, registry.fund_names)),
+                                   columns=["date", "action", "amount"])
+        st.table(activity_df)
+
+        if cursors or older is not None:
+            newer_col, older_col = st.columns(2)
+            with newer_col:
+                st.button("← Newer", key="activity_newer", disabled=not cursors, on_click=show_newer_activity)
+            with older_col:
+                st.button("Older →", key="activity_older", disabled=older is None,
+                          on_click=show_older_activity, args=(older,))
+
+    if STREAMING:
+        return lambda: stream_watchlist(watchlist_slot, names, quotes, snapshot.version)
+    return None
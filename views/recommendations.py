@@ -0,0 +1,311 @@
+"""Recommendations tab: investor profile, recommended ETF cards, performance chart, portfolio risk and growth projection."""
+import os
+
+import numpy as np
+import streamlit as st
+
+from analytics import efficient_frontier, portfolio_stats
+from catalog import PERIODS
+from charts import ChartCache, frontier_chart_spec, projection_chart_spec, returns_chart_spec
+from projection import PERCENTILES, horizon_steps
+from recommender import investment_bucket, investor_profile, recommendation_records
+from templates import METRIC_ROW, PROFILE_BADGE, render_etf_cards
+from views.debug import span
+from views.derived import begin_rerun, derived, end_rerun
+
+CARDS_PER_PAGE = 10
+
+# "client" ships all periods in one Vega-Lite chart; "image" is the server-rendered PNG
+CHART_MODE = os.environ.get("FINTRO_CHART_MODE", "client")
+
+
+def init_state():
+    if 'risk_tolerance' not in st.session_state:
+        st.session_state.risk_tolerance = 6
+    if 'investment_amount' not in st.session_state:
+        st.session_state.investment_amount = 2500
+    if 'recommendations' not in st.session_state:
+        st.session_state.recommendations = []
+    if 'recommendations_page' not in st.session_state:
+        st.session_state.recommendations_page = 0
+    if 'selected_time_period' not in st.session_state:
+        st.session_state.selected_time_period = '6M'
+    if 'projection_horizon' not in st.session_state:
+        st.session_state.projection_horizon = '1Y'
+
+
+@st.cache_resource
+def get_chart_cache():
+    return ChartCache()
+
+
+def get_expected_returns(etf, period):
+    return etf["returns"][period]
+
+
+def get_recommendations(registry, risk_tolerance, investment_amount):
+    # Filter and rank ETFs based on risk tolerance
+    with span("get_recommendations"):
+        indices, scores, _ = registry.recommender.recommend(risk_tolerance, investment_amount)
+        recommendations = recommendation_records(registry.catalog, indices, scores)
+    st.session_state.recommendations_page = 0
+    return recommendations
+
+
+def recommendation_inputs(registry):
+    # Everything the recommendations depend on; the amount only matters per bucket
+    return (registry.loaded_at, st.session_state.risk_tolerance, investment_bucket(st.session_state.investment_amount))
+
+
+def set_recommendations_page(page):
+    st.session_state.recommendations_page = page
+
+
+def display_chart(recommendations, selected_time_period):
+    if not recommendations:
+        return
+    
+    # Prepare data for chart
+    tickers = [etf["ticker"] for etf in recommendations]
+    etf_names = [etf["name"] for etf in recommendations]
+    returns = [etf["returns"][selected_time_period] for etf in recommendations]
+    
+    # PNG bytes, rendered once per distinct chart and shared across sessions
+    with span("display_chart"):
+        return get_chart_cache().get(tickers, etf_names, returns, selected_time_period)
+
+
+def render(registry):
+    init_state()
+    begin_rerun()
+    
+    st.title("Find ETFs that match your investment style with Fintro")
+    st.write("Answer a few questions to get personalized ETF recommendations based on your risk tolerance and investment goals.")
+
+    # Input section. The inputs sit in a form, so dragging the slider or typing
+    # an amount does not rerun the app; both are committed together on submit.
+    with st.form("investor_inputs"):
+        col1, col2, col3 = st.columns([3, 3, 2])
+
+        with col1:
+            st.write("Risk Tolerance (1-10)")
+            risk_tolerance = st.slider("", 1, 10, st.session_state.risk_tolerance, key="risk_slider")
+
+        with col2:
+            st.write("Investment Amount (€)")
+            investment_amount = st.number_input("", min_value=100, max_value=10000, value=st.session_state.investment_amount, step=100, key="investment_input")
+
+        with col3:
+            st.write("")
+            st.write("")
+            st.form_submit_button("Get Recommendations")
+
+    st.session_state.risk_tolerance = risk_tolerance
+    st.session_state.investment_amount = investment_amount
+
+    # Derived state is recomputed only when the inputs it depends on change
+    profile = derived("profile", (risk_tolerance, investment_amount > 3000),
+                      lambda: investor_profile(risk_tolerance, investment_amount))
+    recommendations_key = recommendation_inputs(registry)
+    st.session_state.recommendations = derived(
+        "recommendations", recommendations_key,
+        lambda: get_recommendations(registry, risk_tolerance, investment_amount)
+    )
+
+    # Profile card
+    st.markdown("## Your Investor Profile")
+
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        st.markdown('<div class="profile-visual">📊</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f'### {profile}')
+        st.markdown(PROFILE_BADGE.render(registry.profile_info[profile]), unsafe_allow_html=True)
+        st.write(registry.profile_info[profile]['description'])
+
+        st.markdown(METRIC_ROW.render({
+            "risk_tolerance": st.session_state.risk_tolerance,
+            "experience": registry.profile_info[profile]['experience'],
+            "investment_amount": st.session_state.investment_amount
+        }), unsafe_allow_html=True)
+
+    # ETF Recommendations
+    st.markdown("## Top ETF Recommendations")
+
+    # Only the current page of cards is rendered, as a single HTML block
+    recommendations = st.session_state.recommendations
+    page_count = max(1, -(-len(recommendations) // CARDS_PER_PAGE))
+    page = min(st.session_state.recommendations_page, page_count - 1)
+    page_start = page * CARDS_PER_PAGE
+    st.markdown(
+        derived("cards_html", (recommendations_key, page),
+                lambda: render_etf_cards(recommendations[page_start:page_start + CARDS_PER_PAGE])),
+        unsafe_allow_html=True
+    )
+
+    if page_count > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("← Previous", key="recommendations_prev", disabled=page == 0,
+                      on_click=set_recommendations_page, args=(page - 1,))
+        with col2:
+            st.markdown(f"<div style='text-align: center; color: #666;'>Page {page + 1} of {page_count} · {len(recommendations)} ETFs</div>", unsafe_allow_html=True)
+        with col3:
+            st.button("Next →", key="recommendations_next", disabled=page >= page_count - 1,
+                      on_click=set_recommendations_page, args=(page + 1,))
+
+    # Performance Chart
+    if recommendations:
+        st.markdown("## Performance Comparison")
+        if CHART_MODE == "image":
+            render_image_comparison(recommendations, recommendations_key)
+        else:
+            render_client_comparison(recommendations, recommendations_key)
+
+        st.markdown("## Portfolio Risk")
+        render_portfolio_risk(
+            derived("portfolio_risk", recommendations_key,
+                    lambda: portfolio_risk(registry, risk_tolerance, investment_amount)),
+            investment_amount
+        )
+
+        st.markdown("## Growth Projection")
+        render_projection(registry, recommendations_key, risk_tolerance, investment_amount)
+
+    end_rerun()
+
+
+def render_image_comparison(recommendations, recommendations_key):
+    # Time period selection
+    col1, col2, col3, col4, col5 = st.columns(5)
+    time_periods = {"1M": col1, "3M": col2, "6M": col3, "1Y": col4, "5Y": col5}
+
+    for period, col in time_periods.items():
+        with col:
+            if st.button(period, key=f"time_{period}", 
+                        help=f"Show {period} returns",
+                        on_click=lambda p=period: setattr(st.session_state, 'selected_time_period', p),
+                        type="secondary" if period != st.session_state.selected_time_period else "primary"):
+                st.session_state.selected_time_period = period
+
+    # Display returns data
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        st.markdown(f"### Expected Returns ({st.session_state.selected_time_period})")
+        for etf in recommendations:
+            return_value = get_expected_returns(etf, st.session_state.selected_time_period)
+            st.markdown(
+                f"**{etf['name']}:** <span class=\"{'positive' if return_value >= 0 else 'negative'}\">{'+'if return_value >= 0 else ''}{return_value}%</span>",
+                unsafe_allow_html=True
+            )
+
+    with col2:
+        # Display chart
+        selected_time_period = st.session_state.selected_time_period
+        chart = derived("chart", (recommendations_key, selected_time_period),
+                        lambda: display_chart(recommendations, selected_time_period))
+        with span("st_image"):
+            st.image(chart, use_column_width=True)
+
+
+def render_client_comparison(recommendations, recommendations_key):
+    # Every period is sent once; the period picker is part of the chart, so
+    # switching periods happens in the browser without a rerun
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        st.markdown("### Expected Returns")
+        st.dataframe(derived("returns_table", recommendations_key, lambda: returns_table(recommendations)),
+                     hide_index=True, use_container_width=True)
+
+    with col2:
+        with span("display_chart"):
+            selected_time_period = st.session_state.selected_time_period
+            st.vega_lite_chart(derived(
+                "chart", (recommendations_key, selected_time_period),
+                lambda: returns_chart_spec(
+                    [etf["ticker"] for etf in recommendations],
+                    [etf["name"] for etf in recommendations],
+                    [etf["returns"] for etf in recommendations],
+                    selected_time_period
+                )
+            ), use_container_width=True)
+
+
+def portfolio_risk(registry, risk_tolerance, investment_amount):
+    # Equal weights in the recommended funds, and the efficient frontier they span
+    with span("portfolio_risk"):
+        indices, _, _ = registry.recommender.recommend(risk_tolerance, investment_amount)
+        expected_returns = registry.catalog.annual_return[indices]
+        covariance = registry.risk_model.covariance(indices)
+        weights = np.full(len(indices), 1 / len(indices))
+        portfolio_return, portfolio_volatility = portfolio_stats(weights, expected_returns, covariance)
+        frontier_returns, frontier_volatility, _ = efficient_frontier(expected_returns, covariance)
+        fund_volatility = np.sqrt(np.diag(covariance)) * 100
+        return {
+            "return": float(portfolio_return),
+            "volatility": float(portfolio_volatility),
+            "average_volatility": float(weights @ fund_volatility),
+            "chart": frontier_chart_spec(
+                frontier_returns.tolist(), frontier_volatility.tolist(),
+                registry.catalog.names[indices].tolist(), expected_returns.tolist(), fund_volatility.tolist(),
+                float(portfolio_return), float(portfolio_volatility)
+            ),
+        }
+
+
+def render_portfolio_risk(risk, investment_amount):
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        st.metric("Expected Return", f"{risk['return']:.2f}%")
+        st.metric("Volatility", f"{risk['volatility']:.2f}%",
+                  delta=f"{risk['volatility'] - risk['average_volatility']:+.2f} pts vs. average fund",
+                  delta_color="inverse")
+        st.caption(f"Equal weights in the recommended ETFs. With €{investment_amount:,} invested, "
+                   f"a typical year moves about ±€{investment_amount * risk['volatility'] / 100:,.0f}.")
+
+    with col2:
+        st.vega_lite_chart(risk["chart"], use_container_width=True)
+
+
+def growth_projection(registry, risk_tolerance, investment_amount, horizon):
+    # Simulated value bands of the amount split equally over the recommended funds
+    with span("growth_projection"):
+        indices, _, _ = registry.recommender.recommend(risk_tolerance, investment_amount)
+        low, median, high = registry.projections.project(indices, np.ones(len(indices)), investment_amount, horizon)
+        years, steps = horizon_steps(horizon)
+        months = np.linspace(0, years * 12, steps + 1)
+        return {
+            "low": float(low[-1]),
+            "median": float(median[-1]),
+            "high": float(high[-1]),
+            "paths": registry.projections.paths,
+            "chart": projection_chart_spec(months.tolist(), low.tolist(), median.tolist(), high.tolist(), PERCENTILES),
+        }
+
+
+def render_projection(registry, recommendations_key, risk_tolerance, investment_amount):
+    horizon = st.radio("Horizon", PERIODS, key="projection_horizon", horizontal=True)
+    projection = derived("projection", (recommendations_key, investment_amount, horizon),
+                         lambda: growth_projection(registry, risk_tolerance, investment_amount, horizon))
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        st.metric(f"Median after {horizon}", f"€{projection['median']:,.0f}",
+                  delta=f"€{projection['median'] - investment_amount:+,.0f}")
+        st.caption(f"{PERCENTILES[-1] - PERCENTILES[0]}% of {projection['paths']:,} simulated outcomes end between "
+                   f"€{projection['low']:,.0f} and €{projection['high']:,.0f}, with equal weights in the recommended ETFs.")
+
+    with col2:
+        st.vega_lite_chart(projection["chart"], use_container_width=True)
+
+
+def returns_table(recommendations):
+    table = {"ETF": [etf["name"] for etf in recommendations]}
+    for period in PERIODS:
+        table[period] = [f"{get_expected_returns(etf, period):+}%" for etf in recommendations]
+    return table